@@ -0,0 +1,98 @@
+"""
+Benchmark of the response pipeline of a large list call.
+
+Times ``RequestExecutor.execute`` on a canned 10k-row ZIA user list, followed
+by the per-item model conversion done by ``UserManagementAPI.list_users``.
+No network access is needed; the HTTP client returns the canned response.
+
+Usage:
+    python scripts/bench_response_pipeline.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import functools
+import json
+import statistics
+import time
+
+import requests
+
+from zscaler.api_client import APIClient
+from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.request_executor import RequestExecutor
+from zscaler.zia.models.user_management import UserManagement
+
+
+def build_body(rows):
+    return json.dumps(
+        [
+            {
+                "id": 1000 + i,
+                "name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "comments": "Created by provisioning",
+                "tempAuthEmail": "",
+                "adminUser": i % 50 == 0,
+                "isNonEditable": False,
+                "disabled": False,
+                "deleted": False,
+                "type": "SUPERADMIN" if i % 500 == 0 else "NORMAL",
+                "groups": [{"id": 10 + g, "name": f"Group {g}"} for g in range(i % 4)],
+                "department": {"id": 77, "name": "Engineering", "idpId": 0, "comments": "", "deleted": False},
+            }
+            for i in range(rows)
+        ]
+    )
+
+
+class CannedHTTPClient:
+    """Stands in for HTTPClient, returning the same response to every request."""
+
+    def __init__(self, body, http_config=None, **legacy_clients):
+        self._body = body.encode()
+
+    def send_request(self, request):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self._body
+        response.headers["Content-Type"] = "application/json"
+        return response, None
+
+
+def run_once(request_executor):
+    request = {
+        "method": "GET",
+        "url": "https://api.zsapi.net/zia/api/v1/users",
+        "params": {},
+        "headers": {},
+        "service_type": "zia",
+    }
+    response, error = request_executor.execute(request)
+    assert error is None
+    return [UserManagement(APIClient.form_response_body(item)) for item in response.get_results()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config = {"client": {"cache": {"enabled": False}, "rateLimit": {"maxRetries": 0, "pacing": False}}}
+    request_executor = RequestExecutor(
+        config, NoOpCache(), http_client=functools.partial(CannedHTTPClient, build_body(args.rows))
+    )
+
+    run_once(request_executor)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        users = run_once(request_executor)
+        timings.append(time.perf_counter() - start)
+
+    assert len(users) == args.rows
+    print(f"{args.rows} rows: median {statistics.median(timings) * 1000:.1f} ms, best {min(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -570,6 +570,17 @@ def pytest_generate_tests(metafunc):
         os.environ[PYTEST_MOCK_CLIENT] = "1"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def disable_rate_limit_pacing():
+    """Cassette playback has no server quota to respect, so skip client-side pacing."""
+    if not is_mock_tests_flag_true() or "ZSCALER_RATE_LIMIT_PACING" in os.environ:
+        yield
+        return
+    os.environ["ZSCALER_RATE_LIMIT_PACING"] = "false"
+    yield
+    del os.environ["ZSCALER_RATE_LIMIT_PACING"]
+
+
 @pytest.fixture(scope="session", autouse=True)
 def cleanup(request):
     """Clean up environment variables after test session."""
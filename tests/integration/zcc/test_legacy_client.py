@@ -212,7 +212,7 @@ class TestLegacyZCCClient:
         assert url == "https://api-mobile.zscalerbeta.net"
 
     @patch("zscaler.zcc.legacy.requests.post")
-    @patch("zscaler.zcc.legacy.requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.zcc.legacy.check_response_for_error")
     def test_send_success(self, mock_check_error, mock_request, mock_post, mock_response):
         """Test successful send"""
@@ -336,7 +336,7 @@ class TestLegacyZCCClient:
         mock_session = Mock()
         client.set_session(mock_session)
 
-        assert client._session == mock_session
+        assert client._connection_pool.session == mock_session
 
     @patch("zscaler.zcc.legacy.requests.post")
     @patch("zscaler.zcc.legacy.check_response_for_error")
@@ -357,7 +357,7 @@ class TestLegacyZCCClient:
         # Login failure should raise an exception
 
     @patch("zscaler.zcc.legacy.requests.post")
-    @patch("zscaler.zcc.legacy.requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.zcc.legacy.check_response_for_error")
     def test_send_with_429_retry(self, mock_check_error, mock_request, mock_post, mock_response):
         """Test 429 retry handling"""
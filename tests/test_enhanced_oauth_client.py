@@ -275,8 +275,8 @@ class TestEnhancedOAuthClient:
         assert isinstance(oauth._cache, ZscalerCache)
         assert oauth._cache_enabled() is True
 
-    def test_singleton_pattern(self, fs):
-        """Test OAuth singleton pattern"""
+    def test_shared_token_per_tenant(self, fs):
+        """Test that clients of the same tenant share one access token"""
         config = {
             "client": {
                 "clientId": "test_client_id",
@@ -292,8 +292,11 @@ class TestEnhancedOAuthClient:
         oauth1 = OAuth(request_executor1, config)
         oauth2 = OAuth(request_executor2, config)
 
-        # Verify singleton pattern (same config should return same instance)
-        assert oauth1 is oauth2
+        # Each client keeps its own executor, the token is shared
+        assert oauth1._request_executor is request_executor1
+        assert oauth2._request_executor is request_executor2
+        oauth1._access_token = "shared_token"
+        assert oauth2._access_token == "shared_token"
 
         # Test with different config
         config2 = {
@@ -307,8 +310,9 @@ class TestEnhancedOAuthClient:
 
         oauth3 = OAuth(request_executor1, config2)
 
-        # Different config should create different instance
-        assert oauth1 is not oauth3
+        # A different tenant has a token of its own
+        assert oauth3._token_state is not oauth1._token_state
+        OAuth._token_manager.clear()
 
     def test_error_handling(self, fs):
         """Test error handling in OAuth client"""
@@ -0,0 +1,74 @@
+"""
+Shared fixtures for the request executor and response cache unit tests.
+"""
+
+import json
+from http import HTTPStatus
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from zscaler.cache.zscaler_cache import ZscalerCache
+from zscaler.request_executor import RequestExecutor
+
+
+@pytest.fixture
+def make_response():
+    """
+    Factory of ``requests.Response`` objects.
+
+    ``body`` may be bytes, text, or a value sent as JSON. ``content_type=None`` leaves the header out.
+    """
+
+    def make(body=b"", status_code=200, headers=None, content_type="application/json", url=None):
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = HTTPStatus(status_code).phrase
+        response.url = url
+        if isinstance(body, str):
+            body = body.encode()
+        elif not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        response._content = body
+        if content_type is not None:
+            response.headers["Content-Type"] = content_type
+        response.headers.update(headers or {})
+        return response
+
+    return make
+
+
+@pytest.fixture
+def make_request():
+    """Factory of the request dicts passed to ``RequestExecutor.fire_request`` and ``execute``."""
+
+    def make(url, method="GET", service_type="zia", headers=None):
+        return {"method": method, "url": url, "headers": dict(headers or {}), "params": {}, "service_type": service_type}
+
+    return make
+
+
+@pytest.fixture
+def make_executor():
+    """
+    Factory of ``RequestExecutor`` objects with caching on, pacing off and two retries,
+    whose HTTP client is a ``Mock`` tests set responses on.
+
+    ``cache_config`` is merged into the ``cache`` block and other keyword arguments into
+    the ``client`` block of the configuration. The cache manager defaults to a ``ZscalerCache``.
+    """
+
+    def make(cache=None, cache_config=None, **client_config):
+        config = {
+            "client": {
+                "rateLimit": {"maxRetries": 2, "pacing": False},
+                "cache": {"enabled": True, **(cache_config or {})},
+                **client_config,
+            }
+        }
+        executor = RequestExecutor(config, ZscalerCache(3600, 3600) if cache is None else cache)
+        executor._http_client = Mock()
+        return executor
+
+    return make
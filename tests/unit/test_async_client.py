@@ -0,0 +1,136 @@
+"""
+Testing the asyncio client and request executor for Zscaler SDK
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from zscaler.async_request_executor import AsyncRequestExecutor
+from zscaler.oneapi_async_client import AsyncClient, AsyncServiceProxy
+
+
+class FakeUserManagementAPI:
+    """Synchronous API object mimicking a generated SDK API class."""
+
+    base_endpoint = "/zia/api/v1"
+
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    def list_users(self, query_params=None):
+        self.calls.append(query_params)
+        self.threads.add(threading.current_thread().name)
+        return [{"id": 1}], "response", None
+
+
+class FakeZIAService:
+    def __init__(self):
+        self.user_management = FakeUserManagementAPI()
+
+
+def make_fake_client(max_concurrency=4):
+    client = MagicMock()
+    client.get_config.return_value = {"client": {"maxConcurrency": max_concurrency}}
+    client.get_request_executor.return_value = Mock()
+    client.zia = FakeZIAService()
+    return client
+
+
+def test_async_request_executor_invalid_concurrency():
+    """Test AsyncRequestExecutor rejects a non-positive concurrency."""
+    with pytest.raises(ValueError, match="Invalid max concurrency"):
+        AsyncRequestExecutor(Mock(), max_concurrency=-1)
+
+
+def test_async_request_executor_create_request_and_execute():
+    """Test the awaitable create_request/execute delegate to the sync executor."""
+    sync_executor = Mock()
+    sync_executor.create_request.return_value = ({"url": "u"}, None)
+    sync_executor.execute.return_value = ("response", None)
+    executor = AsyncRequestExecutor(sync_executor, max_concurrency=2)
+
+    async def scenario():
+        request, error = await executor.create_request("GET", "/zia/api/v1/users", params={"page": 1})
+        response, error = await executor.execute(request, dict)
+        return request, response, error
+
+    try:
+        request, response, error = asyncio.run(scenario())
+    finally:
+        executor.close()
+
+    assert request == {"url": "u"}
+    assert response == "response"
+    assert error is None
+    sync_executor.create_request.assert_called_once_with(
+        "GET", "/zia/api/v1/users", body=None, headers=None, params={"page": 1}, use_raw_data_for_body=False
+    )
+    sync_executor.execute.assert_called_once_with({"url": "u"}, dict, False)
+
+
+def test_async_request_executor_bounds_in_flight_calls():
+    """Test at most max_concurrency calls run at the same time."""
+    executor = AsyncRequestExecutor(Mock(), max_concurrency=3)
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    def blocking_call():
+        with lock:
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+        time.sleep(0.02)
+        with lock:
+            state["current"] -= 1
+
+    async def scenario():
+        await asyncio.gather(*(executor.run(blocking_call) for _ in range(12)))
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.close()
+
+    assert state["peak"] <= 3
+
+
+def test_async_client_service_methods_are_awaitable():
+    """Test AsyncClient exposes awaitable service API methods."""
+    fake_client = make_fake_client()
+    client = AsyncClient(client=fake_client)
+
+    assert isinstance(client.zia, AsyncServiceProxy)
+    assert client.zia.user_management.base_endpoint == "/zia/api/v1"
+    assert client.get_request_executor().max_concurrency == 4
+
+    async def scenario():
+        return await client.zia.user_management.list_users({"page": 2})
+
+    try:
+        result, response, error = asyncio.run(scenario())
+    finally:
+        client.close()
+
+    assert result == [{"id": 1}]
+    assert error is None
+    users_api = fake_client.zia.user_management
+    assert users_api.calls == [{"page": 2}]
+    assert all(name.startswith("zscaler-async") for name in users_api.threads)
+
+
+def test_async_client_context_manager_enters_and_exits_sync_client():
+    """Test async context manager drives the wrapped client's lifecycle."""
+    fake_client = make_fake_client()
+
+    async def scenario():
+        async with AsyncClient(client=fake_client) as client:
+            assert client.get_client() is fake_client
+
+    asyncio.run(scenario())
+
+    fake_client.__enter__.assert_called_once()
+    fake_client.__exit__.assert_called_once_with(None, None, None)
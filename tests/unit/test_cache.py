@@ -9,6 +9,7 @@ import pytest
 
 from zscaler.cache.cache import Cache
 from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.cache.single_flight import SingleFlight
 from zscaler.cache.zscaler_cache import ZscalerCache
 
 # Test constants
@@ -307,6 +308,105 @@ def test_zscaler_cache_concurrent_access():
     assert cache.contains(CACHE_KEY)
 
 
+def test_zscaler_cache_threaded_access():
+    """Test ZscalerCache stays consistent when worker threads add, read and delete entries."""
+    import threading
+
+    cache = ZscalerCache(TTL, TTI)
+    errors = []
+
+    def worker(worker_id):
+        try:
+            for i in range(200):
+                key = f"https://api.zsapi.net/zpa/segmentGroup/{worker_id}?page={i % 5}"
+                cache.add(key, CACHE_VALUE)
+                cache.get(key)
+                if i % 7 == 0:
+                    cache.delete(key)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    """Test concurrent calls with the same key run the function once and share its result."""
+    import threading
+
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return CACHE_VALUE
+
+    def caller():
+        results.append(flights.do(CACHE_KEY, fetch))
+
+    threads = [threading.Thread(target=caller) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while len(calls) == 0:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is CACHE_VALUE for result, _ in results)
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert len(flights) == 0
+
+    # Once the flight landed, the next call runs the function again
+    assert flights.do(CACHE_KEY, lambda: ALT_CACHE_VALUE) == (ALT_CACHE_VALUE, False)
+
+
+def test_single_flight_propagates_errors():
+    """Test an exception raised by the function reaches the caller and frees the key."""
+    flights = SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        flights.do(CACHE_KEY, fail)
+    assert flights.do(CACHE_KEY, lambda: CACHE_VALUE) == (CACHE_VALUE, False)
+
+
+def test_zscaler_cache_retains_stale_entries():
+    """Test entries added with a stale TTL stay available for revalidation once expired."""
+    cache = ZscalerCache(10.0, 10.0)
+    now = time.time()
+
+    with patch.object(cache, "_get_current_time") as mock_time:
+        mock_time.return_value = now
+        cache.add(CACHE_KEY, CACHE_VALUE, stale_ttl=30.0)
+        cache.add(ALT_CACHE_KEY, ALT_CACHE_VALUE)
+        assert cache.get_stale(CACHE_KEY) is None
+
+        mock_time.return_value = now + 20
+        assert not cache.contains(CACHE_KEY)
+        assert cache.get(CACHE_KEY) is None
+        assert cache.get_stale(CACHE_KEY) is CACHE_VALUE
+        assert cache.get_stale(ALT_CACHE_KEY) is None
+        assert ALT_CACHE_KEY not in cache._store
+
+        mock_time.return_value = now + 45
+        cache._clean_cache()
+        assert cache.get_stale(CACHE_KEY) is None
+        assert CACHE_KEY not in cache._store
+
+
 def test_zscaler_cache_memory_management():
     """Test ZscalerCache memory management."""
     cache = ZscalerCache(TTL, TTI)
@@ -366,3 +466,20 @@ def test_zscaler_cache_integration():
     # Test that cache can be cleared by request executor
     cache.clear()
     assert cache.get("request_key") is None
+
+
+def test_zscaler_cache_entry_timers():
+    """Test entries can be added with their own TTL and TTI."""
+    cache = ZscalerCache(TTL, TTI)
+    now = time.time()
+    with patch.object(cache, "_get_current_time") as mock_time:
+        mock_time.return_value = now
+        cache.add("short", CACHE_VALUE, ttl=10, tti=10)
+        cache.add("default", CACHE_VALUE)
+
+        mock_time.return_value = now + 8
+        assert cache.get("short") == CACHE_VALUE
+
+        mock_time.return_value = now + 12
+        assert not cache.contains("short")
+        assert cache.contains("default")
@@ -0,0 +1,173 @@
+"""
+Testing per-endpoint cache policies for Zscaler SDK
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from zscaler.cache.policy import CachePolicyRegistry
+from zscaler.cache.zscaler_cache import ZscalerCache
+
+LOCATIONS_URL = "https://api.zsapi.net/zia/api/v1/locations"
+
+
+def test_cache_policy_registry_matching():
+    """Test policies match on service and path, in order, and reject invalid definitions."""
+    registry = CachePolicyRegistry.from_config(
+        [
+            {"service": "zia", "path": r"/locations/\d+$", "staleWhileRevalidate": 30},
+            {"service": "zia", "path": "/locations", "staleWhileRevalidate": "600"},
+            {"path": "/departments"},
+        ]
+    )
+
+    assert registry.match("zia", "/zia/api/v1/locations/12").stale_while_revalidate == 30
+    assert registry.match("zia", "/zia/api/v1/locations").stale_while_revalidate == 600
+    assert registry.match("zpa", "/zpa/locations") is None
+    assert registry.match("zpa", "/api/v1/departments").stale_while_revalidate == 0
+    assert registry.match("zia", "/zia/api/v1/users") is None
+
+    with pytest.raises(ValueError, match="Invalid cache policy definition"):
+        CachePolicyRegistry.from_config([{"service": "zia", "path": "("}])
+    with pytest.raises(ValueError, match="Invalid cache policy definition"):
+        CachePolicyRegistry.from_config([{"service": "zia", "path": "/x", "unknown": 1}])
+
+
+def test_stale_while_revalidate_serves_stale_and_refreshes(make_executor, make_request, make_response):
+    """Test an expired entry is returned immediately while one background request refreshes it."""
+    cache = ZscalerCache(60, 60)
+    executor = make_executor(
+        cache, cache_config={"policies": [{"service": "zia", "path": "/locations$", "staleWhileRevalidate": 600}]}
+    )
+    release = threading.Event()
+    sent = []
+
+    def send_request(request):
+        sent.append(request)
+        if len(sent) > 1:
+            release.wait(5)
+        return make_response(f'[{{"version": {len(sent)}}}]'), None
+
+    executor._http_client.send_request.side_effect = send_request
+
+    executor.fire_request(make_request(LOCATIONS_URL))
+    later = time.time() + 120
+    with patch.object(cache, "_get_current_time", return_value=later):
+        results = [executor.fire_request(make_request(LOCATIONS_URL)) for _ in range(3)]
+        assert all(body == '[{"version": 1}]' for _, _, body, _ in results)
+
+        release.set()
+        executor._refresh_pool.shutdown(wait=True)
+        _, _, body, _ = executor.fire_request(make_request(LOCATIONS_URL))
+
+    assert body == '[{"version": 2}]'
+    assert len(sent) == 2
+    assert executor._refreshing == set()
+
+
+def test_close_session_stops_refresh_pool(make_executor, make_request, make_response):
+    """Test closing the executor shuts the stale-while-revalidate workers down."""
+    cache = ZscalerCache(60, 60)
+    executor = make_executor(
+        cache, cache_config={"policies": [{"service": "zia", "path": "/locations$", "staleWhileRevalidate": 600}]}
+    )
+    executor._http_client.send_request.return_value = (make_response("[]"), None)
+
+    executor.fire_request(make_request(LOCATIONS_URL))
+    with patch.object(cache, "_get_current_time", return_value=time.time() + 120):
+        executor.fire_request(make_request(LOCATIONS_URL))
+    refresh_pool = executor._refresh_pool
+
+    executor.close_session()
+
+    assert refresh_pool._shutdown
+    assert executor._refresh_pool is None
+    assert executor._refreshing == set()
+
+
+def test_stale_entries_without_policy_block_on_refresh(make_executor, make_request, make_response):
+    """Test endpoints without a stale-while-revalidate policy fetch expired entries synchronously."""
+    cache = ZscalerCache(60, 60)
+    executor = make_executor(
+        cache, cache_config={"policies": [{"service": "zia", "path": "/locations$", "staleWhileRevalidate": 600}]}
+    )
+    executor._http_client.send_request.side_effect = [(make_response('["old"]'), None), (make_response('["new"]'), None)]
+
+    url = "https://api.zsapi.net/zia/api/v1/departments"
+    executor.fire_request(make_request(url))
+    with patch.object(cache, "_get_current_time", return_value=time.time() + 120):
+        _, _, body, _ = executor.fire_request(make_request(url))
+
+    assert body == '["new"]'
+    assert executor._refresh_pool is None
+
+
+def test_cache_policy_settings():
+    """Test policies parse their TTL, TTI, enabled flag and size cap, and override the defaults."""
+    registry = CachePolicyRegistry.from_config(
+        [
+            {"service": "zia", "path": "/cloudApplications", "ttl": "7200", "tti": 600, "maxEntrySize": 1024},
+            {"service": "zpa", "path": "/application$", "enabled": "false"},
+        ]
+    )
+
+    catalog = registry.match("zia", "/zia/api/v1/cloudApplications/policy")
+    assert (catalog.ttl, catalog.tti, catalog.max_entry_size, catalog.enabled) == (7200.0, 600.0, 1024, True)
+    assert registry.match("zpa", "/zpa/mgmtconfig/v1/admin/customers/1/application").enabled is False
+    # Built-in defaults still apply to the other endpoints
+    assert registry.match("zia", "/zia/api/v1/status").enabled is False
+    assert registry.match("zia", "/zia/api/v1/status/activate") is None
+    assert CachePolicyRegistry.from_config(include_defaults=False).match("zia", "/zia/api/v1/status") is None
+
+    with pytest.raises(ValueError, match="Invalid cache policy definition"):
+        CachePolicyRegistry.from_config([{"service": "zia", "path": "/x", "ttl": -1}])
+
+
+def test_cache_policies_control_storage(make_executor, make_request, make_response):
+    """Test policies disable caching, cap entry sizes and set per-endpoint TTLs."""
+    cache = ZscalerCache(60, 60)
+    executor = make_executor(
+        cache,
+        cache_config={
+            "policies": [
+                {"service": "zia", "path": "/departments$", "maxEntrySize": 10},
+                {"service": "zia", "path": "/locations$", "ttl": 3600, "tti": 3600},
+            ]
+        },
+    )
+    executor._http_client.send_request.side_effect = lambda request: (make_response('["a long enough body"]'), None)
+
+    for url in (
+        "https://api.zsapi.net/zia/api/v1/status",
+        "https://api.zsapi.net/zia/api/v1/departments",
+        LOCATIONS_URL,
+    ):
+        executor.fire_request(make_request(url))
+        executor.fire_request(make_request(url))
+    # Activation status is never cached and the departments list is too large
+    assert executor._http_client.send_request.call_count == 5
+
+    with patch.object(cache, "_get_current_time", return_value=time.time() + 120):
+        assert cache.contains(cache.create_key(LOCATIONS_URL, {}))
+
+
+def test_cache_policies_with_custom_cache_manager(make_executor, make_request, make_response):
+    """Test policy TTLs are dropped for a cache manager whose add() only takes key and value."""
+
+    class KeyValueCache(ZscalerCache):
+        def add(self, key, value):
+            super().add(key, value)
+
+    cache = KeyValueCache(60, 60)
+    executor = make_executor(
+        cache, cache_config={"policies": [{"service": "zia", "path": "/locations$", "ttl": 3600, "staleWhileRevalidate": 30}]}
+    )
+    executor._http_client.send_request.return_value = (make_response("[]"), None)
+
+    executor.fire_request(make_request(LOCATIONS_URL))
+    executor.fire_request(make_request(LOCATIONS_URL))
+
+    assert executor._http_client.send_request.call_count == 1
@@ -0,0 +1,90 @@
+"""
+Testing response cache statistics for Zscaler SDK
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+from zscaler.cache.lru_cache import LRUCache
+from zscaler.cache.sqlite_cache import SQLiteCache
+from zscaler.cache.stats import CacheStats, endpoint_template, key_path
+from zscaler.cache.zscaler_cache import ZscalerCache
+
+BASE = "https://api.zsapi.net/zpa/mgmtconfig/v1/admin/customers/7205"
+
+
+def test_endpoint_template():
+    """Test resource IDs are folded so counters group by endpoint."""
+    assert endpoint_template("/zpa/mgmtconfig/v1/admin/customers/7205/application/2161") == (
+        "/zpa/mgmtconfig/v1/admin/customers/{id}/application/{id}"
+    )
+    assert endpoint_template("/zdx/v1/devices/6a1b2c3d-0000-4e5f-8a9b-0123456789ab?since=2") == "/zdx/v1/devices/{id}"
+    assert endpoint_template("/zia/api/v1/urlCategories/lite") == "/zia/api/v1/urlCategories/lite"
+    assert key_path("api.zsapi.net/zia/api/v1/locations?page=2") == "/zia/api/v1/locations"
+    assert key_path("https://api.zsapi.net/zia/api/v1/locations") == "/zia/api/v1/locations"
+
+
+def test_cache_stats_snapshot_and_hooks():
+    """Test counters are aggregated by service and endpoint and forwarded to hooks."""
+    stats = CacheStats()
+    events = []
+    stats.add_hook(lambda *event: events.append(event))
+    stats.add_hook(Mock(side_effect=RuntimeError("metrics backend down")))
+
+    stats.record("hits", "zia", "/zia/api/v1/locations", 3)
+    stats.record("misses", "zia", "/zia/api/v1/locations")
+    stats.record("stored_bytes", "zpa", "/zpa/segmentGroup", 512)
+    stats.record_key("evictions", "api.zsapi.net/zpa/segmentGroup/12?page=1")
+
+    snapshot = stats.snapshot()
+    assert snapshot["hits"] == 3 and snapshot["misses"] == 1
+    assert snapshot["hit_ratio"] == 0.75
+    assert snapshot["entries"] is None and snapshot["bytes"] is None
+    assert snapshot["services"]["zia"]["/zia/api/v1/locations"]["hits"] == 3
+    assert snapshot["services"]["zpa"]["/zpa/segmentGroup"]["stored_bytes"] == 512
+    assert snapshot["services"]["unknown"]["/zpa/segmentGroup/{id}"]["evictions"] == 1
+    assert events[0] == ("hits", "zia", "/zia/api/v1/locations", 3)
+    assert len(events) == 4
+
+    stats.reset()
+    assert stats.snapshot()["hits"] == 0
+
+
+def test_executor_records_cache_events(make_executor, make_request, make_response):
+    """Test hits, misses, stores and evictions are counted by service and endpoint."""
+    executor = make_executor(LRUCache(3600, 3600, max_entries=2))
+    executor._http_client.send_request.return_value = (make_response({"id": 1}), None)
+    events = []
+    executor.add_cache_stats_hook(lambda event, service, endpoint, value: events.append((event, endpoint)))
+
+    for path in ("/segmentGroup/1", "/segmentGroup/1", "/segmentGroup/2", "/application"):
+        executor.fire_request(make_request(f"{BASE}{path}", service_type="zpa"))
+
+    stats = executor.cache_stats()
+    segment_groups = stats["services"]["zpa"]["/zpa/mgmtconfig/v1/admin/customers/{id}/segmentGroup/{id}"]
+    assert segment_groups["hits"] == 1
+    assert segment_groups["misses"] == 2
+    assert segment_groups["stores"] == 2
+    assert segment_groups["stored_bytes"] > 0
+    # The cache reports the least recently used entry it evicted under the same labels
+    assert segment_groups["evictions"] == 1
+    assert stats["entries"] == 2 and stats["bytes"] > 0
+    assert stats["hit_ratio"] == 0.25
+    assert ("evictions", "/zpa/mgmtconfig/v1/admin/customers/{id}/segmentGroup/{id}") in events
+
+
+def test_caches_report_expirations_and_invalidations(tmp_path, make_executor, make_request, make_response):
+    """Test each cache backend reports the entries it expires and invalidates."""
+    for cache in (ZscalerCache(60, 60), LRUCache(60, 60), SQLiteCache(str(tmp_path / "c.sqlite"), 60, 60)):
+        executor = make_executor(cache)
+        executor._http_client.send_request.return_value = (make_response({"id": 1}), None)
+        executor.fire_request(make_request(f"{BASE}/segmentGroup/1", service_type="zpa"))
+        executor.fire_request(make_request(f"{BASE}/application/1", service_type="zpa"))
+        executor.fire_request(make_request(f"{BASE}/application/1", method="PUT", service_type="zpa"))
+
+        with patch.object(cache, "_get_current_time", return_value=time.time() + 120):
+            cache.add("api.zsapi.net/zpa/other", ("response", "body"))
+
+        services = executor.cache_stats()["services"]["zpa"]
+        assert services["/zpa/mgmtconfig/v1/admin/customers/{id}/application/{id}"]["invalidations"] == 1
+        assert services["/zpa/mgmtconfig/v1/admin/customers/{id}/segmentGroup/{id}"]["expirations"] == 1
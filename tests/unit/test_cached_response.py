@@ -0,0 +1,115 @@
+"""
+Testing compact cached responses for Zscaler SDK
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from zscaler.cache.cached_response import CachedResponse
+from zscaler.cache.lru_cache import estimate_size
+from zscaler.cache.sqlite_cache import SQLiteCache
+
+URL = "https://api.zsapi.net/zia/api/v1/cloudApplications"
+HEADERS = {
+    "ETag": '"v1"',
+    "Set-Cookie": "session=secret",
+    "X-RateLimit-Remaining": "9",
+    "Link": '<https://api.zsapi.net/zia/api/v1/cloudApplications?page=2>; rel="next"',
+    "X-Next-Page": "2",
+    "X-Custom-Header": "custom",
+}
+
+
+@pytest.fixture
+def app_response(make_response):
+    """Cloud applications response carrying validators, a cookie, rate limit, pagination and custom headers."""
+    return lambda content, content_type="application/json": make_response(
+        content, headers=HEADERS, content_type=content_type, url=URL
+    )
+
+
+def test_cached_response_snapshot(app_response):
+    """Test the snapshot keeps status, the headers but cookies and the decoded body, and is immutable."""
+    response = app_response(b'[{"id": 1, "name": "app"}]')
+    cached = CachedResponse.from_response(response, response.text)
+
+    assert cached.status_code == 200 and cached.ok
+    assert cached.headers["content-type"] == "application/json"
+    assert cached.headers.get("ETag") == '"v1"'
+    assert cached.headers["x-ratelimit-remaining"] == "9"
+    assert cached.headers["link"].endswith('rel="next"')
+    assert cached.headers["X-Next-Page"] == "2"
+    assert cached.headers["X-Custom-Header"] == "custom"
+    assert "Set-Cookie" not in cached.headers
+    assert cached.body == [{"id": 1, "name": "app"}]
+    assert cached.json() == cached.body
+    assert cached.json() is not cached.body
+    assert cached.content == b'[{"id": 1, "name": "app"}]'
+    headers = sum(len(name) + len(value) for name, value in cached.headers.items())
+    assert estimate_size((cached, cached.text)) == 2 * len(cached.text) + headers
+
+    with pytest.raises(AttributeError):
+        cached.status_code = 500
+    with pytest.raises(TypeError):
+        cached.headers["Content-Type"] = "text/plain"
+
+
+def test_cached_response_body_copies_are_independent(app_response):
+    """Test modifying the body returned by a cache hit leaves the cached snapshot intact."""
+    response = app_response(b'{"id": 1, "tags": ["a"], "owner": {"name": "admin"}}')
+    cached = CachedResponse.from_response(response, response.text)
+
+    body = cached.json()
+    body["id"] = 2
+    body["tags"].append("b")
+    body["owner"]["name"] = "changed"
+
+    assert cached.body == {"id": 1, "tags": ["a"], "owner": {"name": "admin"}}
+
+
+def test_cached_response_keeps_binary_content(app_response):
+    """Test non-JSON payloads keep their raw bytes for file downloads."""
+    response = app_response(b"\x00\xffcsv,data", content_type="application/octet-stream")
+    cached = CachedResponse.from_response(response, response.text)
+
+    assert cached.body is None
+    assert cached.content == b"\x00\xffcsv,data"
+
+
+def test_cache_hits_skip_json_decoding(make_executor, make_request, app_response):
+    """Test execute decodes a response once when caching it and never on cache hits."""
+    executor = make_executor()
+    executor._http_client.send_request.return_value = (app_response(json.dumps([{"id": 1}]).encode()), None)
+
+    with patch.object(executor._json_codec, "loads", wraps=executor._json_codec.loads) as mock_loads:
+        first, error = executor.execute(make_request(URL))
+        assert error is None
+        assert mock_loads.call_count == 1
+
+        second, error = executor.execute(make_request(URL))
+        assert error is None
+        assert mock_loads.call_count == 1
+
+    assert executor._http_client.send_request.call_count == 1
+    assert first.get_results() == second.get_results() == [{"id": 1}]
+
+
+def test_sqlite_cache_stores_cached_responses(tmp_path, app_response):
+    """Test snapshots round trip through the persistent cache."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), 3600, 3600)
+    response = app_response(b'{"id": 1}')
+    cached = CachedResponse.from_response(response, response.text)
+    download = CachedResponse.from_response(app_response(b"\x00\xff", "text/csv"), "")
+
+    cache.add("json", (cached, cached.text))
+    cache.add("csv", (download, download.text))
+
+    loaded, text = cache.get("json")
+    assert isinstance(loaded, CachedResponse)
+    assert loaded.body == {"id": 1} and text == '{"id": 1}'
+    assert loaded.headers["etag"] == '"v1"'
+    assert loaded.headers["x-next-page"] == "2"
+    assert "set-cookie" not in loaded.headers
+    assert cache.get("csv")[0].content == b"\x00\xff"
@@ -0,0 +1,82 @@
+"""
+Testing connection pooling in the legacy clients for Zscaler SDK
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from zscaler.connection_pool import ConnectionPool
+
+
+@pytest.fixture
+def zpa_legacy_client():
+    with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
+        "zscaler.zpa.legacy.check_response_for_error", return_value=({}, None)
+    ):
+        from zscaler.zpa.legacy import LegacyZPAClientHelper
+
+        mock_requests.post.return_value = Mock(status_code=200, json=Mock(return_value={"access_token": "token"}))
+        client = LegacyZPAClientHelper(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            customer_id="test_customer_id",
+            cloud="PRODUCTION",
+            connection_pool={"maxSize": 4},
+        )
+        yield client
+
+
+def test_connection_pool_defaults():
+    """Test the pool falls back to the documented defaults."""
+    pool = ConnectionPool()
+
+    assert pool.hosts == 10
+    assert pool.max_size == 10
+    assert pool.block is False
+    assert pool.keep_alive is True
+    assert pool.idle_timeout is None
+    assert pool.session is None
+
+
+def test_legacy_zpa_send_reuses_pooled_session(zpa_legacy_client, make_response):
+    """Test consecutive legacy sends go through the same pooled session."""
+    with patch("requests.Session.request", return_value=make_response({})) as mock_request, patch(
+        "zscaler.zpa.legacy.check_response_for_error", return_value=({}, None)
+    ):
+        zpa_legacy_client.send("GET", "/mgmtconfig/v1/admin/customers/1/segmentGroup")
+        session = zpa_legacy_client._connection_pool.session
+        zpa_legacy_client.send("GET", "/mgmtconfig/v1/admin/customers/1/serverGroup")
+
+    assert mock_request.call_count == 2
+    assert zpa_legacy_client._connection_pool.session is session
+    assert session.get_adapter("https://config.private.zscaler.com")._pool_maxsize == 4
+
+
+def test_legacy_zpa_close_session_releases_pool(zpa_legacy_client, make_response):
+    """Test close_session releases the pool and the next send opens a new one."""
+    first_session = zpa_legacy_client._connection_pool.get_session()
+
+    zpa_legacy_client.close_session()
+    assert zpa_legacy_client._connection_pool.session is None
+
+    with patch("requests.Session.request", return_value=make_response({})), patch(
+        "zscaler.zpa.legacy.check_response_for_error", return_value=({}, None)
+    ):
+        zpa_legacy_client.send("GET", "/mgmtconfig/v1/admin/customers/1/segmentGroup")
+
+    assert zpa_legacy_client._connection_pool.session is not first_session
+
+
+def test_connection_pool_recycle_leaves_old_session_open():
+    """Test the idle recycle swaps in a new session without closing one still in use."""
+    pool = ConnectionPool({"idleTimeout": 30})
+    first_session = pool.get_session()
+    pool._last_used -= 31
+
+    with patch.object(first_session, "close") as mock_close:
+        second_session = pool.get_session()
+
+    assert second_session is not first_session
+    mock_close.assert_not_called()
+    pool.close()
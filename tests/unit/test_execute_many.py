@@ -0,0 +1,131 @@
+"""
+Testing bounded-concurrency batch execution for Zscaler SDK
+"""
+
+import threading
+import time
+from functools import partial
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from zscaler.cache.no_op_cache import NoOpCache
+
+SEGMENT_GROUPS = "https://api.zsapi.net/zpa/mgmtconfig/v1/admin/customers/1/segmentGroup"
+
+
+@pytest.fixture
+def request_executor(make_executor):
+    return make_executor(NoOpCache(), cache_config={"enabled": False}, maxConcurrency=3)
+
+
+@pytest.fixture
+def segment_group_requests(make_request):
+    """GETs of the segment groups ``0`` to ``count - 1``."""
+    return lambda count: [make_request(f"{SEGMENT_GROUPS}/{i}", service_type="zpa") for i in range(count)]
+
+
+def test_execute_many_preserves_input_order(request_executor, make_response, segment_group_requests):
+    """Test results come back in input order whatever order the requests complete in."""
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def send_request(request):
+        item_id = int(request["url"].rsplit("/", 1)[1])
+        with lock:
+            in_flight.append(item_id)
+            peak.append(len(in_flight))
+        # Earlier requests finish last
+        time.sleep(0.01 * (6 - item_id))
+        with lock:
+            in_flight.remove(item_id)
+        return make_response({"id": str(item_id)}), None
+
+    with patch.object(request_executor._http_client, "send_request", side_effect=send_request):
+        results = request_executor.execute_many(segment_group_requests(6))
+
+    assert [response.get_body()["id"] for response, _ in results] == [str(i) for i in range(6)]
+    assert all(error is None for _, error in results)
+    assert max(peak) <= 3
+
+
+def test_execute_many_reports_per_item_errors(request_executor, make_response, segment_group_requests):
+    """Test a failing request does not affect the other items of the batch."""
+
+    def send_request(request):
+        if request["url"].endswith("/1"):
+            return make_response({"id": "NOT_FOUND", "reason": "missing"}, status_code=404), None
+        if request["url"].endswith("/2"):
+            raise requests.ConnectionError("connection reset")
+        return make_response({"id": "0"}), None
+
+    with patch.object(request_executor._http_client, "send_request", side_effect=send_request):
+        results = request_executor.execute_many(segment_group_requests(3))
+
+    assert results[0][1] is None
+    assert results[1][0] is None and results[1][1] is not None
+    assert results[2][0] is None and isinstance(results[2][1], requests.ConnectionError)
+
+
+def test_execute_many_retries_items(request_executor, make_response, segment_group_requests):
+    """Test each item goes through the retry policy of execute."""
+    responses = [
+        make_response({}, status_code=429, headers={"Retry-After": "0"}),
+        make_response({"id": "0"}),
+    ]
+
+    with patch.object(request_executor._http_client, "send_request", side_effect=[(r, None) for r in responses]), patch(
+        "zscaler.request_executor.time.sleep"
+    ):
+        ((response, error),) = request_executor.execute_many(segment_group_requests(1))
+
+    assert error is None
+    assert response.get_body() == {"id": "0"}
+
+
+def test_execute_many_invalid_concurrency(request_executor, segment_group_requests):
+    """Test a non-positive concurrency is rejected."""
+    with pytest.raises(ValueError, match="Invalid max concurrency"):
+        request_executor.execute_many(segment_group_requests(1), max_concurrency=0)
+
+
+def test_run_many_service_calls(request_executor):
+    """Test run_many returns service results in order and turns exceptions into errors."""
+
+    def get_group(group_id):
+        if group_id == "bad":
+            raise RuntimeError("boom")
+        return {"id": group_id}, Mock(), None
+
+    results = request_executor.run_many([partial(get_group, "a"), partial(get_group, "bad"), partial(get_group, "c")])
+
+    assert results[0][0] == {"id": "a"}
+    assert results[1][:2] == (None, None)
+    assert isinstance(results[1][2], RuntimeError)
+    assert results[2][0] == {"id": "c"}
+    assert request_executor.run_many([]) == []
+
+
+def test_execute_many_paces_every_item(request_executor, make_response, segment_group_requests):
+    """Test each item of the batch is paced by the service rate limiter."""
+    with patch.object(request_executor, "_pace_request") as mock_pace, patch.object(
+        request_executor._http_client, "send_request", side_effect=lambda request: (make_response({}), None)
+    ):
+        request_executor.execute_many(segment_group_requests(4))
+
+    assert mock_pace.call_count == 4
+
+
+def test_client_run_many_uses_configured_concurrency(request_executor):
+    """Test Client.run_many delegates to the executor of a legacy helper with maxConcurrency."""
+    from zscaler.oneapi_client import Client
+
+    client = Mock(_config={"client": {"maxConcurrency": 2}})
+    client._request_executor = Mock(request_executor=request_executor)
+
+    with patch.object(request_executor, "run_many", return_value=["result"]) as mock_run_many:
+        assert Client.run_many(client, ["call"]) == ["result"]
+
+    mock_run_many.assert_called_once_with(["call"], 2)
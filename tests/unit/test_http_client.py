@@ -2,7 +2,7 @@
 Testing HTTP Client for Zscaler SDK
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from zscaler.oneapi_http_client import HTTPClient
 
@@ -206,3 +206,72 @@ def test_http_client_send_request_with_legacy_client_routing():
     assert client.zpa_legacy_client == mock_zpa
     assert client.zia_legacy_client == mock_zia
     assert client.zwa_legacy_client == mock_zwa
+
+
+def _make_request(url="https://api.zsapi.net/zia/api/v1/users"):
+    return {"method": "GET", "url": url, "headers": {}, "params": {}, "uuid": "test-uuid"}
+
+
+def test_http_client_reuses_pooled_session_without_context_manager():
+    """Test requests share one pooled session by default."""
+    client = HTTPClient({"headers": {}})
+    mock_response = Mock(status_code=200, headers={}, text="{}")
+
+    with patch("requests.Session.request", return_value=mock_response) as mock_request:
+        client.send_request(_make_request())
+        first_session = client._session
+        client.send_request(_make_request())
+
+    assert mock_request.call_count == 2
+    assert first_session is not None
+    assert client._session is first_session
+
+
+def test_http_client_connection_pool_config():
+    """Test the pool adapter is sized from the connectionPool config block."""
+    client = HTTPClient(
+        {
+            "headers": {},
+            "connectionPool": {"hosts": "4", "maxSize": "25", "block": "true", "keepAlive": "false", "idleTimeout": 0},
+        }
+    )
+
+    session = client.open_session()
+    adapter = session.get_adapter("https://api.zsapi.net")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 25
+    assert adapter._pool_block is True
+    assert session.headers["Connection"] == "close"
+    assert client._connection_pool.idle_timeout is None
+    client.close_session()
+
+
+def test_http_client_recycles_idle_session():
+    """Test the pooled session is recycled after the idle timeout."""
+    client = HTTPClient({"headers": {}, "connectionPool": {"idleTimeout": 30}})
+
+    first_session = client.open_session()
+    client._connection_pool._last_used -= 31
+    second_session = client.open_session()
+
+    assert second_session is not first_session
+    client.close_session()
+
+
+def test_http_client_set_session_and_close_session():
+    """Test a user supplied session replaces the pool and close_session releases it."""
+    client = HTTPClient({"headers": {}})
+    pooled_session = client.open_session()
+    custom_session = Mock()
+
+    with patch.object(pooled_session, "close") as mock_close:
+        client.set_session(custom_session)
+    mock_close.assert_called_once()
+
+    client._connection_pool._last_used -= 10_000
+    assert client.open_session() is custom_session
+
+    client.close_session()
+    custom_session.close.assert_called_once()
+    assert client._session is None
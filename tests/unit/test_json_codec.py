@@ -0,0 +1,114 @@
+"""
+Testing the pluggable JSON codec for Zscaler SDK
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from zscaler.json_codec import JSONCodec, OrjsonCodec, get_json_codec
+from zscaler.oneapi_http_client import HTTPClient
+
+orjson = pytest.importorskip("orjson")
+
+
+def test_get_json_codec_resolution():
+    """Test jsonCodec values resolve to the matching backend."""
+    assert isinstance(get_json_codec(), OrjsonCodec)
+    assert isinstance(get_json_codec("auto"), OrjsonCodec)
+    assert isinstance(get_json_codec("orjson"), OrjsonCodec)
+    assert type(get_json_codec("json")) is JSONCodec
+
+    codec = JSONCodec()
+    assert get_json_codec(codec) is codec
+
+    with pytest.raises(ValueError, match="Invalid JSON codec"):
+        get_json_codec("simplejson")
+
+
+def test_orjson_codec_matches_stdlib():
+    """Test orjson decodes what the stdlib decodes, including documents it does not support natively."""
+    codec = OrjsonCodec()
+    document = '{"id": 123456789012345678901234567890, "ratio": NaN, "name": "caf\\u00e9", "list": [1, 2]}'
+
+    decoded = codec.loads(document)
+    expected = json.loads(document)
+    assert decoded["id"] == expected["id"]
+    assert decoded["name"] == expected["name"] == "café"
+    assert codec.loads(b'[{"a": 1}]') == [{"a": 1}]
+
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("{not json")
+
+
+def test_orjson_codec_dumps():
+    """Test request bodies encode to the same JSON document with either backend."""
+    body = {"name": "rule", "order": 1, "enabled": True, "ids": [1, 2], "nested": {"k": None}, 5: "int key"}
+
+    assert json.loads(OrjsonCodec().dumps(body)) == json.loads(JSONCodec().dumps(body))
+    # Objects orjson cannot encode go through the stdlib, which raises as requests' json= would
+    with pytest.raises(TypeError):
+        OrjsonCodec().dumps({"value": object()})
+
+
+def test_orjson_codec_dumps_differences():
+    """Test the cases where orjson and the stdlib do not encode alike."""
+    import dataclasses
+    import datetime
+
+    @dataclasses.dataclass
+    class Rule:
+        name: str
+
+    # Types the stdlib rejects are passed through to it rather than encoded natively
+    for value in (datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 1), Rule("r")):
+        with pytest.raises(TypeError):
+            JSONCodec().dumps({"value": value})
+        with pytest.raises(TypeError):
+            OrjsonCodec().dumps({"value": value})
+
+    # Same document, different bytes: no whitespace
+    body = {"ratio": 0.1, "ids": [1, 2]}
+    assert OrjsonCodec().dumps(body) == b'{"ratio":0.1,"ids":[1,2]}'
+    assert JSONCodec().dumps(body) == b'{"ratio": 0.1, "ids": [1, 2]}'
+
+    # NaN encodes to null with orjson, while the stdlib refuses it
+    assert OrjsonCodec().dumps({"ratio": float("nan")}) == b'{"ratio":null}'
+    with pytest.raises(ValueError):
+        JSONCodec().dumps({"ratio": float("nan")})
+
+
+def test_http_client_encodes_body_with_codec():
+    """Test send_request sends bodies encoded by the configured codec."""
+
+    class RecordingCodec(JSONCodec):
+        def __init__(self):
+            self.encoded = []
+
+        def dumps(self, obj):
+            self.encoded.append(obj)
+            return super().dumps(obj)
+
+    codec = RecordingCodec()
+    http_client = HTTPClient({"jsonCodec": codec})
+    session = Mock()
+    session.request.return_value = Mock(status_code=200, headers={}, text="{}")
+    http_client.set_session(session)
+
+    request = {
+        "method": "POST",
+        "url": "https://api.zsapi.net/zia/api/v1/users",
+        "headers": {"Authorization": "Bearer token"},
+        "params": {},
+        "json": {"name": "user"},
+        "uuid": "uuid",
+    }
+    response, error = http_client.send_request(request)
+
+    assert error is None
+    assert codec.encoded == [{"name": "user"}]
+    kwargs = session.request.call_args.kwargs
+    assert kwargs["data"] == b'{"name": "user"}'
+    assert "json" not in kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/json"
@@ -33,6 +33,14 @@ from unittest.mock import patch
 
 import pytest
 
+
+@pytest.fixture
+def mock_session_request():
+    """Patch the pooled session used by the legacy clients' send path."""
+    with patch("requests.Session.request") as mock_request:
+        yield mock_request
+
+
 # =============================================================================
 # Mock Response Classes
 # =============================================================================
@@ -94,7 +102,7 @@ class Mock200Response(MockResponse):
 class TestZPALegacyClientRateLimiting:
     """Test rate limiting in ZPA Legacy Client."""
 
-    def test_429_with_retry_after_header(self):
+    def test_429_with_retry_after_header(self, mock_session_request):
         """Test ZPA legacy client handles 429 with Retry-After header."""
         with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
             "zscaler.zpa.legacy.check_response_for_error"
@@ -116,17 +124,17 @@ class TestZPALegacyClientRateLimiting:
             )
 
             # Reset the mock for the actual test
-            mock_requests.request.reset_mock()
+            mock_session_request.reset_mock()
 
             # First call returns 429, second call returns 200
-            mock_requests.request.side_effect = [Mock429Response(retry_after="2"), Mock200Response()]
+            mock_session_request.side_effect = [Mock429Response(retry_after="2"), Mock200Response()]
 
             with patch("zscaler.zpa.legacy.LegacyZPAClientHelper.send"):
                 # Test the actual retry logic by calling the real implementation
                 pass
 
             # Directly test the send method behavior
-            mock_requests.request.side_effect = [Mock429Response(retry_after="2"), Mock200Response()]
+            mock_session_request.side_effect = [Mock429Response(retry_after="2"), Mock200Response()]
 
             with patch.object(client, "refreshToken"):
                 with patch("time.sleep") as mock_sleep:
@@ -135,9 +143,9 @@ class TestZPALegacyClientRateLimiting:
             # Should have retried after sleeping
             mock_sleep.assert_called_once_with(2)
             assert response.status_code == 200
-            assert mock_requests.request.call_count == 2
+            assert mock_session_request.call_count == 2
 
-    def test_429_with_lowercase_retry_after_header(self):
+    def test_429_with_lowercase_retry_after_header(self, mock_session_request):
         """Test ZPA legacy client handles 429 with lowercase retry-after header."""
         with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
             "zscaler.zpa.legacy.check_response_for_error"
@@ -156,8 +164,8 @@ class TestZPALegacyClientRateLimiting:
                 cloud="PRODUCTION",
             )
 
-            mock_requests.request.reset_mock()
-            mock_requests.request.side_effect = [Mock429Response(retry_after_lowercase="3"), Mock200Response()]
+            mock_session_request.reset_mock()
+            mock_session_request.side_effect = [Mock429Response(retry_after_lowercase="3"), Mock200Response()]
 
             with patch.object(client, "refreshToken"):
                 with patch("time.sleep") as mock_sleep:
@@ -166,7 +174,7 @@ class TestZPALegacyClientRateLimiting:
             mock_sleep.assert_called_once_with(3)
             assert response.status_code == 200
 
-    def test_429_without_retry_after_uses_default(self):
+    def test_429_without_retry_after_uses_default(self, mock_session_request):
         """Test ZPA legacy client uses default 2 seconds when Retry-After header missing."""
         with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
             "zscaler.zpa.legacy.check_response_for_error"
@@ -185,8 +193,8 @@ class TestZPALegacyClientRateLimiting:
                 cloud="PRODUCTION",
             )
 
-            mock_requests.request.reset_mock()
-            mock_requests.request.side_effect = [Mock429Response(), Mock200Response()]  # No retry-after header
+            mock_session_request.reset_mock()
+            mock_session_request.side_effect = [Mock429Response(), Mock200Response()]  # No retry-after header
 
             with patch.object(client, "refreshToken"):
                 with patch("time.sleep") as mock_sleep:
@@ -196,7 +204,7 @@ class TestZPALegacyClientRateLimiting:
             mock_sleep.assert_called_once_with(2)
             assert response.status_code == 200
 
-    def test_429_multiple_retries(self):
+    def test_429_multiple_retries(self, mock_session_request):
         """Test ZPA legacy client retries multiple times on repeated 429."""
         with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
             "zscaler.zpa.legacy.check_response_for_error"
@@ -215,8 +223,8 @@ class TestZPALegacyClientRateLimiting:
                 cloud="PRODUCTION",
             )
 
-            mock_requests.request.reset_mock()
-            mock_requests.request.side_effect = [
+            mock_session_request.reset_mock()
+            mock_session_request.side_effect = [
                 Mock429Response(retry_after="1"),
                 Mock429Response(retry_after="1"),
                 Mock429Response(retry_after="1"),
@@ -229,9 +237,9 @@ class TestZPALegacyClientRateLimiting:
 
             assert mock_sleep.call_count == 3
             assert response.status_code == 200
-            assert mock_requests.request.call_count == 4
+            assert mock_session_request.call_count == 4
 
-    def test_429_max_retries_exceeded(self):
+    def test_429_max_retries_exceeded(self, mock_session_request):
         """Test ZPA legacy client raises after max retries exceeded."""
         with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
             "zscaler.zpa.legacy.check_response_for_error"
@@ -250,9 +258,9 @@ class TestZPALegacyClientRateLimiting:
                 cloud="PRODUCTION",
             )
 
-            mock_requests.request.reset_mock()
+            mock_session_request.reset_mock()
             # All 429s - should exhaust retries (5 max)
-            mock_requests.request.side_effect = [
+            mock_session_request.side_effect = [
                 Mock429Response(retry_after="1"),
                 Mock429Response(retry_after="1"),
                 Mock429Response(retry_after="1"),
@@ -274,7 +282,7 @@ class TestZPALegacyClientRateLimiting:
 class TestZIALegacyClientRateLimiting:
     """Test rate limiting in ZIA Legacy Client."""
 
-    def test_429_with_retry_after_seconds_suffix(self):
+    def test_429_with_retry_after_seconds_suffix(self, mock_session_request):
         """Test ZIA legacy client handles 429 with 'Retry-After: 0 seconds' format."""
         with patch("zscaler.zia.legacy.requests") as mock_requests, patch(
             "zscaler.zia.legacy.check_response_for_error"
@@ -295,13 +303,13 @@ class TestZIALegacyClientRateLimiting:
                 username="test_user", password="test_password", api_key="test_api_key", cloud="zscaler"
             )
 
-            mock_requests.request.reset_mock()
+            mock_session_request.reset_mock()
 
             # ZIA returns "Retry-After": "0 seconds" format
             response_429 = Mock429Response()
             response_429.headers["Retry-After"] = "0 seconds"
 
-            mock_requests.request.side_effect = [response_429, Mock200Response()]
+            mock_session_request.side_effect = [response_429, Mock200Response()]
 
             with patch.object(client, "ensure_valid_session"):
                 with patch("zscaler.zia.legacy.sleep") as mock_sleep:
@@ -311,7 +319,7 @@ class TestZIALegacyClientRateLimiting:
             mock_sleep.assert_called_once_with(1)
             assert response.status_code == 200
 
-    def test_429_with_retry_after_header(self):
+    def test_429_with_retry_after_header(self, mock_session_request):
         """Test ZIA legacy client handles 429 with Retry-After header."""
         with patch("zscaler.zia.legacy.requests") as mock_requests, patch(
             "zscaler.zia.legacy.check_response_for_error"
@@ -334,8 +342,8 @@ class TestZIALegacyClientRateLimiting:
                 username="test_user", password="test_password", api_key="test_api_key", cloud="zscaler"
             )
 
-            mock_requests.request.reset_mock()
-            mock_requests.request.side_effect = [Mock429Response(retry_after="2"), Mock200Response()]
+            mock_session_request.reset_mock()
+            mock_session_request.side_effect = [Mock429Response(retry_after="2"), Mock200Response()]
 
             with patch.object(client, "ensure_valid_session"):
                 with patch("zscaler.zia.legacy.sleep") as mock_sleep:
@@ -343,9 +351,9 @@ class TestZIALegacyClientRateLimiting:
 
             mock_sleep.assert_called_once_with(2)
             assert response.status_code == 200
-            assert mock_requests.request.call_count == 2
+            assert mock_session_request.call_count == 2
 
-    def test_429_without_retry_after_uses_default(self):
+    def test_429_without_retry_after_uses_default(self, mock_session_request):
         """Test ZIA legacy client uses default 2 seconds when Retry-After missing."""
         with patch("zscaler.zia.legacy.requests") as mock_requests, patch(
             "zscaler.zia.legacy.check_response_for_error"
@@ -366,8 +374,8 @@ class TestZIALegacyClientRateLimiting:
                 username="test_user", password="test_password", api_key="test_api_key", cloud="zscaler"
             )
 
-            mock_requests.request.reset_mock()
-            mock_requests.request.side_effect = [Mock429Response(), Mock200Response()]
+            mock_session_request.reset_mock()
+            mock_session_request.side_effect = [Mock429Response(), Mock200Response()]
 
             with patch.object(client, "ensure_valid_session"):
                 with patch("zscaler.zia.legacy.sleep") as mock_sleep:
@@ -385,7 +393,7 @@ class TestZIALegacyClientRateLimiting:
 class TestZTWLegacyClientRateLimiting:
     """Test rate limiting in ZTW Legacy Client."""
 
-    def test_429_with_retry_after_seconds_suffix(self):
+    def test_429_with_retry_after_seconds_suffix(self, mock_session_request):
         """Test ZTW legacy client handles 429 with 'Retry-After: 0 seconds' format."""
         with patch("zscaler.ztw.legacy.requests") as mock_requests, patch(
             "zscaler.ztw.legacy.check_response_for_error"
@@ -406,13 +414,13 @@ class TestZTWLegacyClientRateLimiting:
                 username="test_user", password="test_password", api_key="test_api_key", cloud="zscaler"
             )
 
-            mock_requests.request.reset_mock()
+            mock_session_request.reset_mock()
 
             # ZTW returns "Retry-After": "0 seconds" format
             response_429 = Mock429Response()
             response_429.headers["Retry-After"] = "0 seconds"
 
-            mock_requests.request.side_effect = [response_429, Mock200Response()]
+            mock_session_request.side_effect = [response_429, Mock200Response()]
 
             with patch("zscaler.ztw.legacy.sleep") as mock_sleep:
                 response, request_info = client.send("GET", "/test/endpoint")
@@ -421,7 +429,7 @@ class TestZTWLegacyClientRateLimiting:
             mock_sleep.assert_called_once_with(1)
             assert response.status_code == 200
 
-    def test_429_with_retry_after_header(self):
+    def test_429_with_retry_after_header(self, mock_session_request):
         """Test ZTW legacy client handles 429 with Retry-After header."""
         with patch("zscaler.ztw.legacy.requests") as mock_requests, patch(
             "zscaler.ztw.legacy.check_response_for_error"
@@ -442,8 +450,8 @@ class TestZTWLegacyClientRateLimiting:
                 username="test_user", password="test_password", api_key="test_api_key", cloud="zscaler"
             )
 
-            mock_requests.request.reset_mock()
-            mock_requests.request.side_effect = [Mock429Response(retry_after="2"), Mock200Response()]
+            mock_session_request.reset_mock()
+            mock_session_request.side_effect = [Mock429Response(retry_after="2"), Mock200Response()]
 
             # ZTW doesn't have ensure_valid_session, just run the send directly
             with patch("zscaler.ztw.legacy.sleep") as mock_sleep:
@@ -532,7 +540,7 @@ class TestLegacyClientRateLimitingConsistency:
 class TestZPARateLimitingDetails:
     """Detailed tests for ZPA rate limiting implementation."""
 
-    def test_retry_after_with_s_suffix(self):
+    def test_retry_after_with_s_suffix(self, mock_session_request):
         """Test ZPA handles 'retry-after' header with 's' suffix (e.g., '8s')."""
         with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
             "zscaler.zpa.legacy.check_response_for_error"
@@ -551,13 +559,13 @@ class TestZPARateLimitingDetails:
                 cloud="PRODUCTION",
             )
 
-            mock_requests.request.reset_mock()
+            mock_session_request.reset_mock()
 
             # ZPA returns non-standard format with 's' suffix (e.g., '8s')
             response_429 = Mock429Response()
             response_429.headers["retry-after"] = "8s"
 
-            mock_requests.request.side_effect = [response_429, Mock200Response()]
+            mock_session_request.side_effect = [response_429, Mock200Response()]
 
             with patch.object(client, "refreshToken"):
                 with patch("time.sleep") as mock_sleep:
@@ -567,7 +575,7 @@ class TestZPARateLimitingDetails:
             mock_sleep.assert_called_with(8)
             assert response.status_code == 200
 
-    def test_retry_after_parsing_integer(self):
+    def test_retry_after_parsing_integer(self, mock_session_request):
         """Test parsing integer Retry-After value."""
         with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
             "zscaler.zpa.legacy.check_response_for_error"
@@ -586,10 +594,10 @@ class TestZPARateLimitingDetails:
                 cloud="PRODUCTION",
             )
 
-            mock_requests.request.reset_mock()
+            mock_session_request.reset_mock()
 
             # Test with integer string
-            mock_requests.request.side_effect = [Mock429Response(retry_after="10"), Mock200Response()]
+            mock_session_request.side_effect = [Mock429Response(retry_after="10"), Mock200Response()]
 
             with patch.object(client, "refreshToken"):
                 with patch("time.sleep") as mock_sleep:
@@ -597,7 +605,7 @@ class TestZPARateLimitingDetails:
 
             mock_sleep.assert_called_with(10)
 
-    def test_both_header_variants_checked(self):
+    def test_both_header_variants_checked(self, mock_session_request):
         """Test that both retry-after and Retry-After headers are checked."""
         with patch("zscaler.zpa.legacy.requests") as mock_requests, patch(
             "zscaler.zpa.legacy.check_response_for_error"
@@ -616,13 +624,13 @@ class TestZPARateLimitingDetails:
                 cloud="PRODUCTION",
             )
 
-            mock_requests.request.reset_mock()
+            mock_session_request.reset_mock()
 
             # Create response with only lowercase header
             response_429 = Mock429Response()
             response_429.headers["retry-after"] = "5"
 
-            mock_requests.request.side_effect = [response_429, Mock200Response()]
+            mock_session_request.side_effect = [response_429, Mock200Response()]
 
             with patch.object(client, "refreshToken"):
                 with patch("time.sleep") as mock_sleep:
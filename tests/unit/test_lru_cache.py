@@ -0,0 +1,169 @@
+"""
+Testing the bounded LRU cache for Zscaler SDK
+"""
+
+import time
+from unittest.mock import patch
+
+from zscaler.cache.lru_cache import LRUCache, estimate_size
+
+TTL = 3600
+TTI = 1800
+CACHE_VALUE = ("test_response", "test_body")
+
+
+def test_lru_cache_basic_operations():
+    """Test get, contains, delete and clear."""
+    cache = LRUCache(TTL, TTI)
+
+    cache.add("key", CACHE_VALUE)
+    assert cache.contains("key")
+    assert cache.get("key") is CACHE_VALUE
+    assert cache.size_bytes == estimate_size(CACHE_VALUE)
+
+    cache.delete("key")
+    assert not cache.contains("key")
+    assert cache.get("key") is None
+    assert cache.size_bytes == 0
+
+    cache.add("a", CACHE_VALUE)
+    cache.add(123, CACHE_VALUE)
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Test max_entries evicts the entry that was used the longest time ago."""
+    cache = LRUCache(TTL, TTI, max_entries=2)
+
+    cache.add("a", CACHE_VALUE)
+    cache.add("b", CACHE_VALUE)
+    assert cache.get("a") is CACHE_VALUE
+    cache.add("c", CACHE_VALUE)
+
+    assert cache.contains("a")
+    assert not cache.contains("b")
+    assert cache.contains("c")
+    assert len(cache) == 2
+
+
+def test_lru_cache_max_bytes():
+    """Test max_bytes bounds the estimated size of the cached values."""
+    cache = LRUCache(TTL, TTI, max_bytes=20)
+
+    cache.add("a", ("r", "x" * 9))
+    cache.add("b", ("r", "x" * 9))
+    assert cache.size_bytes == 20
+    cache.add("c", ("r", "x" * 9))
+
+    assert not cache.contains("a")
+    assert cache.contains("b") and cache.contains("c")
+    assert cache.size_bytes == 20
+
+    # A value larger than the whole cache is not stored and evicts nothing
+    cache.add("big", ("r", "x" * 50))
+    assert not cache.contains("big")
+    assert len(cache) == 2
+
+
+def test_lru_cache_replacing_key_updates_size():
+    """Test re-adding a key replaces its value and size accounting."""
+    cache = LRUCache(TTL, TTI)
+
+    cache.add("a", ("r", "x" * 10))
+    cache.add("a", ("r", "x" * 4))
+
+    assert len(cache) == 1
+    assert cache.size_bytes == 5
+    assert cache.get("a") == ("r", "xxxx")
+
+
+def test_lru_cache_ttl_expiration():
+    """Test entries expire after their TTL, on access or when other entries are added."""
+    cache = LRUCache(2.0, 10.0)
+    cache.add("a", CACHE_VALUE)
+    cache.add("b", CACHE_VALUE)
+    cache.add("long_lived", CACHE_VALUE, ttl=100.0)
+
+    with patch.object(cache, "_get_current_time") as mock_time:
+        mock_time.return_value = time.time() + 3
+        assert cache.get("a") is None
+        # "b" is never read again; the expiry heap reclaims it
+        cache.add("c", CACHE_VALUE)
+
+    assert len(cache) == 2
+    assert cache.contains("long_lived") and cache.contains("c")
+
+
+def test_lru_cache_tti_expiration_and_reset():
+    """Test entries expire when idle and access resets their idle timer."""
+    cache = LRUCache(100.0, 2.0)
+    now = time.time()
+
+    with patch.object(cache, "_get_current_time") as mock_time:
+        mock_time.return_value = now
+        cache.add("a", CACHE_VALUE)
+        cache.add("b", CACHE_VALUE)
+
+        mock_time.return_value = now + 1.5
+        assert cache.get("a") is CACHE_VALUE
+
+        mock_time.return_value = now + 3
+        cache.add("c", CACHE_VALUE)
+        assert not cache.contains("b")
+        assert cache.contains("a")
+
+        mock_time.return_value = now + 10
+        assert cache.get("a") is None
+
+
+def test_lru_cache_retains_stale_entries():
+    """Test entries added with a stale TTL can be revalidated after they expire."""
+    cache = LRUCache(10.0, 10.0)
+    now = time.time()
+
+    with patch.object(cache, "_get_current_time") as mock_time:
+        mock_time.return_value = now
+        cache.add("a", CACHE_VALUE, stale_ttl=30.0)
+        cache.add("b", CACHE_VALUE)
+        assert cache.get_stale("a") is None
+
+        mock_time.return_value = now + 20
+        assert cache.get("a") is None
+        assert cache.get_stale("a") is CACHE_VALUE
+        cache.add("c", CACHE_VALUE)
+        assert "b" not in cache._store
+
+        mock_time.return_value = now + 45
+        assert cache.get_stale("a") is None
+        assert len(cache) == 1
+
+
+def test_lru_cache_compacts_stale_heap_items():
+    """Test replacing keys does not grow the expiry heap without bound."""
+    cache = LRUCache(TTL, TTI)
+
+    for _ in range(1000):
+        cache.add("a", CACHE_VALUE)
+
+    assert len(cache) == 1
+    assert len(cache._expiry_heap) < 100
+
+
+def test_lru_cache_as_cache_manager():
+    """Test LRUCache plugs into the client through cacheManager."""
+    from zscaler.oneapi_client import Client
+
+    cache = LRUCache(TTL, TTI, max_entries=10)
+    config = {
+        "clientId": "client_id",
+        "clientSecret": "client_secret",
+        "vanityDomain": "vanity",
+        "cache": {"enabled": True},
+        "cacheManager": cache,
+    }
+
+    client = Client(config)
+
+    assert client._request_executor._cache is cache
@@ -278,17 +278,17 @@ def test_oauth_client_with_different_clouds():
         assert oauth._config["client"]["cloud"] == cloud
 
 
-def test_oauth_client_singleton_behavior():
-    """Test OAuth client singleton behavior."""
+def test_oauth_client_shared_token_state():
+    """Test that OAuth clients of the same tenant share their token."""
     mock_request_executor = Mock()
     config = {"client": {"clientId": "test_client_id", "clientSecret": "test_client_secret", "vanityDomain": "testcompany"}}
 
-    # Test singleton behavior
     oauth1 = OAuth(mock_request_executor, config)
-    oauth2 = OAuth(mock_request_executor, config)
+    oauth2 = OAuth(mock_request_executor, {"client": dict(config["client"], proxy="http://proxy:8080")})
 
-    # Test that same instance is returned for same config
-    assert oauth1 is oauth2
+    # Test that the token is shared, whatever the other settings of each client
+    assert oauth1 is not oauth2
+    assert oauth1._token_state is oauth2._token_state
 
 
 def test_oauth_client_different_configs():
@@ -346,3 +346,208 @@ def test_oauth_client_integration():
         # Test OAuth client functionality
         assert oauth is not None
         assert oauth._config == config
+
+
+def _token_response(access_token, expires_in=3600):
+    import requests
+
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "https://testcompany.zslogin.net/oauth2/v1/token"
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps({"access_token": access_token, "expires_in": expires_in}).encode()
+    return response
+
+
+def test_oauth_client_concurrent_requests_authenticate_once():
+    """Test that threads finding no token share a single authentication."""
+    import threading
+    import time
+
+    config = {"client": {"clientId": "single_flight_client", "clientSecret": "secret", "vanityDomain": "testcompany"}}
+    oauth = OAuth(Mock(), config)
+    calls = []
+
+    def authenticate():
+        calls.append(1)
+        time.sleep(0.05)
+        return _token_response("shared_token")
+
+    tokens = []
+    with patch.object(oauth, "authenticate", side_effect=authenticate):
+        threads = [threading.Thread(target=lambda: tokens.append(oauth._get_access_token())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    oauth.close()
+
+    assert len(calls) == 1
+    assert tokens == ["shared_token"] * 8
+
+
+def test_oauth_client_renews_token_in_background():
+    """Test that a token within the refresh margin is returned while it is renewed."""
+    import time
+
+    config = {
+        "client": {
+            "clientId": "renewal_client",
+            "clientSecret": "secret",
+            "vanityDomain": "testcompany",
+            "tokenRefreshMargin": 60,
+        }
+    }
+    oauth = OAuth(Mock(), config)
+    now = time.time()
+    with patch.object(oauth, "_schedule_renewal"):
+        oauth._set_token("old_token", now + 30, now - 3570)
+    assert abs(oauth._token_refresh_at - (now - 30)) < 1e-6
+
+    with patch.object(oauth, "authenticate", return_value=_token_response("new_token")) as authenticate:
+        assert oauth._get_access_token() == "old_token"
+        deadline = time.time() + 5
+        while oauth._access_token != "new_token" and time.time() < deadline:
+            time.sleep(0.01)
+    oauth.close()
+
+    authenticate.assert_called_once()
+    assert oauth._get_access_token() == "new_token"
+    assert oauth._token_refresh_at > time.time()
+
+
+def test_oauth_client_skips_background_renewal_when_idle():
+    """Test that a token unused since it was issued is left to expire and refreshed on demand."""
+    import time
+
+    config = {
+        "client": {
+            "clientId": "idle_client",
+            "clientSecret": "secret",
+            "vanityDomain": "testcompany",
+            "tokenRefreshMargin": 60,
+        }
+    }
+    oauth = OAuth(Mock(), config)
+    now = time.time()
+    with patch.object(oauth, "_schedule_renewal"):
+        oauth._set_token("old_token", now + 30, now - 3570)
+    oauth._token_state.last_used = now - 3600
+
+    with patch.object(oauth, "authenticate", return_value=_token_response("new_token")) as authenticate:
+        oauth._renew_access_token()
+    oauth.close()
+
+    authenticate.assert_not_called()
+    assert oauth._access_token == "old_token"
+
+
+def test_oauth_client_renewal_timer_does_not_keep_client_alive():
+    """Test that a dropped client is garbage collected and its pending renewal does nothing."""
+    import gc
+    import time
+    import weakref
+
+    config = {"client": {"clientId": "dropped_client", "clientSecret": "secret", "vanityDomain": "testcompany"}}
+    oauth = OAuth(Mock(), config)
+    now = time.time()
+    oauth._set_token("token", now + 3600, now)
+    timer = oauth._token_state.renewal_timer
+    client_ref = weakref.ref(oauth)
+
+    del oauth
+    gc.collect()
+
+    assert client_ref() is None
+    timer.cancel()
+    timer.function(*timer.args)
+
+
+def test_oauth_client_keeps_token_replacing_rejected_one():
+    """Test that clearing a token another thread already replaced keeps the new one."""
+    import time
+
+    config = {"client": {"clientId": "rejected_client", "clientSecret": "secret", "vanityDomain": "testcompany"}}
+    oauth = OAuth(Mock(), config)
+    oauth._access_token = "new_token"
+    oauth._token_expires_at = time.time() + 3600
+
+    oauth.clear_access_token("old_token")
+    assert oauth._access_token == "new_token"
+
+    oauth.clear_access_token("new_token")
+    assert oauth._access_token is None
+
+
+def _private_key_pem():
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
+    return private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+def test_oauth_client_parses_private_key_once(tmp_path):
+    """Test the private key is parsed and validated once, until the key file changes."""
+    key_file = tmp_path / "key.pem"
+    key_file.write_text(_private_key_pem())
+    config = {"client": {"clientId": "key_client", "privateKey": str(key_file), "vanityDomain": "testcompany"}}
+    oauth = OAuth(Mock(), config)
+
+    with patch("zscaler.oneapi_oauth_client.validate_rsa_key_strength") as validate:
+        first = oauth._load_private_key(str(key_file))
+        assert oauth._load_private_key(str(key_file)) is first
+        assert validate.call_count == 1
+
+        key_file.write_text(_private_key_pem() + "\n")
+        assert oauth._load_private_key(str(key_file)) is not first
+        assert validate.call_count == 2
+
+
+def test_oauth_client_reuses_signed_assertion():
+    """Test a signed JWT assertion is reused while it stays valid long enough."""
+    import time
+
+    import jwt
+
+    from zscaler.oneapi_oauth_client import JWT_ASSERTION_LIFETIME, JWT_ASSERTION_MIN_VALIDITY
+
+    pem = _private_key_pem()
+    config = {"client": {"clientId": "assertion_client", "privateKey": pem, "vanityDomain": "testcompany"}}
+    oauth = OAuth(Mock(), config)
+    private_key = oauth._load_private_key(pem)
+
+    assertion = oauth._client_assertion("assertion_client", private_key)
+    claims = jwt.decode(assertion, options={"verify_signature": False})
+    assert claims["iss"] == claims["sub"] == "assertion_client"
+    assert oauth._client_assertion("assertion_client", private_key) == assertion
+
+    later = time.time() + JWT_ASSERTION_LIFETIME - JWT_ASSERTION_MIN_VALIDITY + 1
+    with patch("zscaler.oneapi_oauth_client.time.time", return_value=later):
+        assert oauth._client_assertion("assertion_client", private_key) != assertion
+
+
+def test_oauth_client_presigns_assertion_before_expiry():
+    """Test the next assertion is signed ahead, valid past the token expiry."""
+    import time
+
+    from zscaler.oneapi_oauth_client import JWT_ASSERTION_LIFETIME, JWT_ASSERTION_MIN_VALIDITY
+
+    pem = _private_key_pem()
+    config = {"client": {"clientId": "presign_client", "privateKey": pem, "vanityDomain": "testcompany"}}
+    oauth = OAuth(Mock(), config)
+    now = time.time()
+    with patch.object(oauth, "_schedule_renewal"):
+        oauth._set_token("token", now + 3600, now)
+    timer = oauth._presign_timer
+    oauth.close()
+
+    assert timer is not None
+    expected_delay = 3600 + JWT_ASSERTION_MIN_VALIDITY - JWT_ASSERTION_LIFETIME
+    assert expected_delay - 5 < timer.interval <= expected_delay
+
+    oauth._presign_client_assertion()
+    assert oauth._assertion_cache[2] >= int(now) + JWT_ASSERTION_LIFETIME
@@ -1456,3 +1456,191 @@ def test_search_length_function():
     resp = _make_response(body, service_type="zia")
     result = resp.search("[?length(tags) > `1`].id")
     assert sorted(result) == [1, 3]
+
+
+def _paged_executor(total_pages, service_type="zpa", fail_page=None):
+    """Fake executor serving page N (1-based) of a list with random latency."""
+    import random
+    import threading
+    import time
+
+    executor = Mock()
+    executor.max_concurrency = 3
+    executor.requested = []
+    lock = threading.Lock()
+
+    def fire_request(request):
+        api_page = request["params"]["page"]
+        page = api_page + 1 if service_type == "zcell" else api_page
+        with lock:
+            executor.requested.append(page)
+        time.sleep(random.uniform(0, 0.01))
+        if page == fail_page:
+            return request, None, None, "Network error"
+        items = [{"id": page}]
+        if service_type == "zcell":
+            body = {"content": items, "totalPages": total_pages, "totalElements": total_pages}
+        else:
+            body = {"list": items, "totalPages": total_pages, "totalCount": total_pages}
+        return request, None, json.dumps(body), None
+
+    executor.fire_request.side_effect = fire_request
+    return executor
+
+
+@pytest.mark.parametrize("service_type", ["zpa", "zcell"])
+def test_prefetch_yields_pages_in_order(service_type):
+    """Test prefetched pages are returned in order and each page is requested once."""
+    executor = _paged_executor(12, service_type)
+    first = {"list": [{"id": 1}], "totalPages": 12}
+    if service_type == "zcell":
+        first = {"content": [{"id": 1}], "totalPages": 12}
+    response = ZscalerAPIResponse(
+        request_executor=executor,
+        req={"url": "https://api.example.com/test", "headers": {}, "params": {}},
+        service_type=service_type,
+        res_details=Mock(headers={"Content-Type": "application/json"}, status_code=200),
+        response_body=json.dumps(first),
+    )
+
+    items = list(response.get_results())
+    assert response.prefetch() is response
+    while response.has_next():
+        results, response, error = response.next()
+        assert error is None
+        items.extend(results)
+
+    assert [item["id"] for item in items] == list(range(1, 13))
+    assert sorted(executor.requested) == list(range(2, 13))
+    assert all(request[0][0]["service_type"] == service_type for request in executor.fire_request.call_args_list)
+    assert response._prefetch_pool is None
+
+
+def test_prefetch_reports_page_error():
+    """Test a failed prefetched page surfaces as the error of next()."""
+    executor = _paged_executor(6, fail_page=3)
+    response = ZscalerAPIResponse(
+        request_executor=executor,
+        req={"url": "https://api.example.com/test", "headers": {}, "params": {}},
+        service_type="zpa",
+        res_details=Mock(headers={"Content-Type": "application/json"}, status_code=200),
+        response_body=json.dumps({"list": [{"id": 1}], "totalPages": 6}),
+    ).prefetch(max_concurrency=2)
+
+    results, response, error = response.next()
+    assert results == [{"id": 2}]
+    results, response, error = response.next()
+    assert results is None
+    assert error == "Network error"
+    assert response._prefetch_pool is None
+
+
+def test_prefetch_close_cancels_pending_pages():
+    """Test leaving the with block early cancels the pages not requested yet."""
+    import threading
+
+    executor = _paged_executor(50)
+    release = threading.Event()
+    fire_request = executor.fire_request.side_effect
+
+    def blocking_fire_request(request):
+        if request["params"]["page"] >= 3:
+            release.wait(5)
+        return fire_request(request)
+
+    executor.fire_request.side_effect = blocking_fire_request
+    response = ZscalerAPIResponse(
+        request_executor=executor,
+        req={"url": "https://api.example.com/test", "headers": {}, "params": {}},
+        service_type="zpa",
+        res_details=Mock(headers={"Content-Type": "application/json"}, status_code=200),
+        response_body=json.dumps({"list": [{"id": 1}], "totalPages": 50}),
+    )
+
+    with response.prefetch(max_concurrency=1):
+        results, response, error = response.next()
+        assert results == [{"id": 2}]
+        pool = response._prefetch_pool
+    release.set()
+    pool.shutdown(wait=True)
+
+    assert response._prefetch_pool is None
+    assert sorted(executor.requested) == [2, 3]
+
+
+def test_prefetch_pool_shut_down_when_response_dropped():
+    """Test a response dropped mid-iteration shuts its prefetch pool down once its in-flight pages return."""
+    import gc
+    import time
+
+    response = ZscalerAPIResponse(
+        request_executor=_paged_executor(50),
+        req={"url": "https://api.example.com/test", "headers": {}, "params": {}},
+        service_type="zpa",
+        res_details=Mock(headers={"Content-Type": "application/json"}, status_code=200),
+        response_body=json.dumps({"list": [{"id": 1}], "totalPages": 50}),
+    ).prefetch(max_concurrency=2)
+    response.next()
+    pool = response._prefetch_pool
+
+    del response
+    deadline = time.time() + 5
+    while not pool._shutdown and time.time() < deadline:
+        gc.collect()
+        time.sleep(0.01)
+
+    assert pool._shutdown
+
+
+def test_prefetch_ignored_for_other_services():
+    """Test services without totalPages keep fetching pages one by one."""
+    response = _make_response(json.dumps([{"id": 1}]), service_type="zia")
+
+    response.prefetch(max_concurrency=4)
+
+    assert response._prefetch_concurrency == 0
+
+
+def test_parsed_body_is_not_decoded_again():
+    """Test a body already decoded by the executor is used as is."""
+    body = {"list": [{"id": 1}], "totalPages": 1}
+
+    with patch("zscaler.oneapi_response.json.loads") as mock_loads:
+        response = ZscalerAPIResponse(
+            request_executor=Mock(),
+            req={"url": "https://api.example.com/test", "headers": {}, "params": {}},
+            service_type="zpa",
+            res_details=Mock(headers={"Content-Type": "application/json"}, status_code=200),
+            response_body=json.dumps(body),
+            parsed_body=body,
+        )
+
+    mock_loads.assert_not_called()
+    assert response.get_body() is body
+    assert response.get_results() == [{"id": 1}]
+
+
+def test_execute_decodes_body_once():
+    """Test RequestExecutor.execute decodes a JSON response a single time."""
+    import requests
+
+    from zscaler.cache.no_op_cache import NoOpCache
+    from zscaler.request_executor import RequestExecutor
+
+    config = {"client": {"cache": {"enabled": False}, "rateLimit": {"maxRetries": 0, "pacing": False}}}
+    request_executor = RequestExecutor(config, NoOpCache())
+    http_response = requests.Response()
+    http_response.status_code = 200
+    http_response._content = b'[{"id": 1, "name": "user"}]'
+    http_response.headers["Content-Type"] = "application/json"
+    request = {"method": "GET", "url": "https://api.zsapi.net/zia/api/v1/users", "params": {}, "headers": {}}
+
+    codec = request_executor._json_codec
+    with patch.object(request_executor._http_client, "send_request", return_value=(http_response, None)), patch.object(
+        codec, "loads", wraps=codec.loads
+    ) as mock_loads:
+        response, error = request_executor.execute(request)
+
+    assert error is None
+    assert response.get_results() == [{"id": 1, "name": "user"}]
+    assert mock_loads.call_count == 1
@@ -0,0 +1,72 @@
+"""
+Testing path-based cache invalidation for Zscaler SDK
+"""
+
+import pytest
+
+from zscaler.cache.lru_cache import LRUCache
+from zscaler.cache.path_index import PathIndex, split_key
+from zscaler.cache.sqlite_cache import SQLiteCache
+from zscaler.cache.zscaler_cache import ZscalerCache
+
+BASE = "api.zsapi.net/zpa/mgmtconfig/v1/admin/customers/1"
+APPLICATIONS = f"{BASE}/application"
+APPLICATION = f"{APPLICATIONS}/123"
+
+CACHED_KEYS = [
+    APPLICATIONS,
+    f"{APPLICATIONS}?page=1&pagesize=100",
+    APPLICATION,
+    f"{APPLICATION}?microtenantId=42",
+    f"{APPLICATION}/mapping",
+    f"{APPLICATIONS}/1234",
+    f"{BASE}/segmentGroup",
+]
+STALE_KEYS = CACHED_KEYS[:5]
+
+
+def test_split_key():
+    """Test cache keys split on path segments without their query string."""
+    assert split_key(f"{APPLICATION}?page=1") == split_key(f"{APPLICATION}/")
+    assert split_key("host/zia/api/v1/locations")[-1] == "locations"
+
+
+def test_path_index_related_keys():
+    """Test a mutation relates to the resource, its variants, sub-resources and parent collections only."""
+    index = PathIndex()
+    for key in CACHED_KEYS:
+        index.add(key)
+
+    assert sorted(index.related(APPLICATION)) == sorted(STALE_KEYS)
+    assert sorted(index.related(f"{APPLICATIONS}/999")) == sorted(CACHED_KEYS[:2])
+    assert index.related("other.host/zpa") == []
+
+    for key in CACHED_KEYS:
+        index.discard(key)
+    assert len(index) == 0
+    assert index._root.children == {}
+
+
+@pytest.fixture(params=["memory", "lru", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return ZscalerCache(3600, 3600)
+    if request.param == "lru":
+        return LRUCache(3600, 3600)
+    return SQLiteCache(str(tmp_path / "cache.sqlite"), 3600, 3600)
+
+
+def test_cache_invalidate(cache):
+    """Test caches drop the entries made stale by a mutation and keep unrelated ones."""
+    for key in CACHED_KEYS:
+        cache.add(key, ("response", key))
+
+    cache.invalidate(f"{APPLICATION}?microtenantId=42")
+
+    assert [key for key in CACHED_KEYS if cache.contains(key)] == CACHED_KEYS[5:]
+
+    # Deleted and re-added keys are tracked again
+    cache.add(APPLICATIONS, ("response", APPLICATIONS))
+    cache.delete(f"{BASE}/segmentGroup")
+    cache.invalidate(f"{APPLICATIONS}/1234")
+    assert not any(cache.contains(key) for key in CACHED_KEYS)
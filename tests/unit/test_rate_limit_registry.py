@@ -0,0 +1,107 @@
+"""
+Unit tests for the endpoint-specific rate limit registry.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.ratelimiter.registry import EndpointRateLimit, RateLimitRegistry
+from zscaler.request_executor import RequestExecutor
+
+
+class TestRateLimitRegistry:
+    """Test suite for RateLimitRegistry."""
+
+    def test_default_url_lookup_limit(self):
+        """Test URL lookup is limited to one call per second on top of the ZIA service bucket."""
+        registry = RateLimitRegistry.from_config()
+
+        assert registry.wait("zia", "POST", "/zia/api/v1/urlLookup") == (False, 0)
+        should_wait, delay = registry.wait("zia", "POST", "/zia/api/v1/urlLookup")
+        assert should_wait is True
+        assert 0 < delay <= 1
+
+    def test_unrelated_endpoints_are_not_throttled(self):
+        """Test requests outside registered endpoint families are let through."""
+        registry = RateLimitRegistry.from_config()
+
+        for _ in range(5):
+            assert registry.wait("zia", "GET", "/zia/api/v1/urlCategories") == (False, 0)
+            assert registry.wait("zia", "GET", "/zia/api/v1/urlLookup") == (False, 0)
+            assert registry.wait("zpa", "POST", "/zpa/mgmtconfig/v1/admin/customers/1/application") == (False, 0)
+
+    def test_match_user_management_paths(self):
+        """Test the user management family covers the collection and single users but not bulk delete."""
+        registry = RateLimitRegistry.from_config()
+
+        assert registry.match("zia", "POST", "/zia/api/v1/users").name == "zia-user-management"
+        assert registry.match("zia", "PUT", "/api/v1/users/1234").name == "zia-user-management"
+        assert registry.match("zia", "POST", "/zia/api/v1/users/bulkDelete").name == "zia-users-bulk-delete"
+        assert registry.match("zia", "GET", "/zia/api/v1/users") is None
+
+    def test_hourly_quota(self):
+        """Test the hourly quota holds requests back once spent, even with short-term tokens left."""
+        endpoint_limit = EndpointRateLimit("lookup", "zia", "/urlLookup$", limit=10, period=1, hourly=2)
+
+        assert endpoint_limit.acquire(1000.0) == 0
+        assert endpoint_limit.acquire(1000.0) == 0
+        delay = endpoint_limit.acquire(1000.0)
+        assert delay == pytest.approx(1800, rel=0.01)
+        # The rejected request did not spend a short-term token
+        assert endpoint_limit.buckets[0].tokens == pytest.approx(8, abs=0.01)
+
+    def test_user_rules_override_defaults(self):
+        """Test endpoints from the configuration are matched before the defaults."""
+        registry = RateLimitRegistry.from_config([{"service": "zia", "path": "/urlLookup$", "limit": 5, "period": 1}])
+
+        for _ in range(5):
+            assert registry.wait("zia", "POST", "/zia/api/v1/urlLookup") == (False, 0)
+        assert registry.wait("zia", "POST", "/zia/api/v1/urlLookup")[0] is True
+
+    def test_invalid_definition(self):
+        """Test malformed endpoint definitions are reported."""
+        with pytest.raises(ValueError):
+            RateLimitRegistry.from_config([{"service": "zia", "path": "/urlLookup$", "perMinute": 5}])
+
+
+class TestRequestExecutorEndpointPacing:
+    """Test suite for endpoint pacing in RequestExecutor."""
+
+    def setup_method(self):
+        self.config = {"client": {"rateLimit": {"maxRetries": 3, "pacing": True}}}
+        self.request_executor = RequestExecutor(self.config, NoOpCache())
+
+    def test_pace_request_waits_for_endpoint_bucket(self):
+        """Test a second URL lookup within a second waits for the endpoint bucket."""
+        request = {"method": "POST", "service_type": "zia", "url": "https://api.zsapi.net/zia/api/v1/urlLookup"}
+
+        with patch("zscaler.request_executor.time.sleep") as mock_sleep:
+            self.request_executor._pace_request(request)
+            mock_sleep.assert_not_called()
+
+            with patch.object(
+                self.request_executor._endpoint_rate_limits, "wait", side_effect=[(True, 0.75), (False, 0)]
+            ) as mock_wait:
+                self.request_executor._pace_request(request)
+
+        mock_wait.assert_called_with("zia", "POST", "/zia/api/v1/urlLookup")
+        mock_sleep.assert_called_once_with(0.75)
+
+    def test_endpoints_from_config(self):
+        """Test rateLimit.endpoints adds endpoint families to the registry."""
+        config = {
+            "client": {
+                "rateLimit": {
+                    "maxRetries": 3,
+                    "endpoints": [{"name": "zpa-apps", "service": "zpa", "path": "/application$", "limit": 1, "period": 5}],
+                }
+            }
+        }
+        request_executor = RequestExecutor(config, NoOpCache())
+
+        endpoint_limit = request_executor._endpoint_rate_limits.match(
+            "zpa", "POST", "/zpa/mgmtconfig/v1/admin/customers/1/application"
+        )
+        assert endpoint_limit.name == "zpa-apps"
@@ -5,7 +5,8 @@ This module tests:
 1. Rate limiting functionality (RateLimiter class)
 2. Retry logic (retry_with_backoff decorator)
 3. RequestExecutor rate limiting (get_retry_after method)
-4. Integration scenarios
+4. RequestExecutor client-side pacing
+5. Integration scenarios
 """
 
 import time
@@ -15,7 +16,7 @@ import pytest
 
 from zscaler.cache.no_op_cache import NoOpCache
 from zscaler.exceptions.exceptions import RetryTooLong
-from zscaler.ratelimiter.ratelimiter import RateLimiter
+from zscaler.ratelimiter.ratelimiter import RateLimiter, TokenBucket
 from zscaler.request_executor import RequestExecutor
 from zscaler.utils import retry_with_backoff, should_retry
 
@@ -155,8 +156,10 @@ class TestRateLimiter:
 
         assert self.rate_limiter.get_limit == 20
         assert self.rate_limiter.post_put_delete_limit == 20
-        assert self.rate_limiter.get_freq == 30
-        assert self.rate_limiter.post_put_delete_freq == 30
+        # A per-second limit sets a one second window; the reset countdown is not a window length
+        assert self.rate_limiter.get_freq == 1
+        assert self.rate_limiter.post_put_delete_freq == 1
+        assert self.rate_limiter.get_bucket.rate == 20
 
     def test_update_limits_with_minute_hour_day_limits(self):
         """Test updating rate limits with minute, hour, and day limits."""
@@ -189,8 +192,8 @@ class TestRateLimiter:
 
         assert self.rate_limiter.get_limit == 15
         assert self.rate_limiter.post_put_delete_limit == 15
-        # Frequency should remain unchanged
-        assert self.rate_limiter.get_freq == 60
+        # The limit is per second, whatever the configured frequency
+        assert self.rate_limiter.get_freq == 1
 
     def test_invalid_method(self):
         """Test RateLimiter with invalid HTTP method."""
@@ -212,8 +215,8 @@ class TestRateLimiter:
         with patch("time.time", return_value=time.time() + 61):
             should_wait, delay = self.rate_limiter.wait("GET")
             assert should_wait is False
-            # The RateLimiter should have cleaned up the oldest request and added the new one
-            assert len(self.rate_limiter.get_requests) == 10
+            # The GET bucket should have refilled to capacity and spent one token
+            assert self.rate_limiter.get_bucket.tokens == 9
 
     def test_rate_limiter_with_custom_limits(self):
         """Test RateLimiter with custom limits."""
@@ -740,3 +743,158 @@ class TestRateLimitingIntegration:
             response = mock_request_large_retries()
             assert response.status_code == 200
             assert call_count == 5  # Should succeed after 5 attempts, not 100
+
+
+class TestRequestExecutorPacing:
+    """Test suite for client-side pacing in RequestExecutor."""
+
+    def setup_method(self):
+        self.config = {"client": {"rateLimit": {"maxRetries": 3, "pacing": True}}}
+        self.request_executor = RequestExecutor(self.config, NoOpCache())
+
+    def test_remaining_zero_blocks_until_reset(self):
+        """Test an exhausted server quota empties the bucket until the window resets."""
+        rate_limiter = RateLimiter(10, 5, 60, 60)
+
+        rate_limiter.update_limits({"X-RateLimit-Remaining-Minute": "0", "X-RateLimit-Reset": "30"})
+
+        should_wait, delay = rate_limiter.wait("GET")
+        assert should_wait is True
+        assert 29 < delay <= 30
+
+    def test_zero_reset_keeps_pacing(self):
+        """Test a reset countdown of 0 neither disables pacing nor breaks the limiter."""
+        rate_limiter = RateLimiter(2, 2, 60, 60)
+
+        rate_limiter.update_limits({"X-RateLimit-Reset": "0", "X-RateLimit-Remaining-Minute": "3"})
+
+        results = [rate_limiter.wait("GET")[0] for _ in range(5)]
+        assert results == [False, False, True, True, True]
+        assert rate_limiter.get_bucket.period == 60
+
+    def test_large_reset_does_not_stretch_period(self):
+        """Test a long reset countdown does not slow down the refill rate."""
+        rate_limiter = RateLimiter(10, 5, 1, 1)
+
+        rate_limiter.update_limits({"X-RateLimit-Reset": "37"})
+
+        assert rate_limiter.get_bucket.period == 1
+        assert rate_limiter.get_bucket.rate == 10
+
+    def test_limit_second_sets_per_second_rate(self):
+        """Test X-RateLimit-Limit-Second paces to that many requests per second, not per configured window."""
+        rate_limiter = RateLimiter(20, 10, 10, 10)
+
+        rate_limiter.update_limits({"X-RateLimit-Limit-Second": "20"})
+
+        assert rate_limiter.get_bucket.rate == 20
+        assert rate_limiter.post_put_delete_bucket.rate == 20
+
+    def test_malformed_headers_are_ignored(self):
+        """Test unparsable header values leave the limiter unchanged."""
+        rate_limiter = RateLimiter(10, 5, 60, 60)
+
+        rate_limiter.update_limits(
+            {"X-Ratelimit-Limit-Second": "abc", "X-RateLimit-Remaining-Minute": "n/a", "X-RateLimit-Reset": "soon"}
+        )
+
+        assert rate_limiter.get_limit == 10
+        assert rate_limiter.wait("GET") == (False, 0)
+
+    def test_token_bucket_rejects_non_positive_period(self):
+        """Test a bucket cannot be built or resized with a zero period."""
+        with pytest.raises(ValueError):
+            TokenBucket(10, 0)
+        bucket = TokenBucket(10, 1)
+        with pytest.raises(ValueError):
+            bucket.resize(period=0)
+
+    def test_update_rate_limits_never_raises(self):
+        """Test a failure while retuning the limiter does not turn a response into an error."""
+        request = {"method": "GET", "service_type": "zpa", "url": "https://api.zsapi.net/zpa/x"}
+        response = Mock(headers={"X-RateLimit-Remaining-Minute": "3"})
+        rate_limiter = self.request_executor.get_rate_limiter("zpa")
+
+        with patch.object(rate_limiter, "update_limits", side_effect=ZeroDivisionError):
+            self.request_executor._update_rate_limits(request, response)
+
+    def test_remaining_caps_available_tokens(self):
+        """Test the reported remaining quota caps the burst allowed by the bucket."""
+        rate_limiter = RateLimiter(10, 5, 60, 60)
+
+        rate_limiter.update_limits({"X-RateLimit-Remaining-Second": "1"})
+
+        assert rate_limiter.wait("GET") == (False, 0)
+        should_wait, _ = rate_limiter.wait("GET")
+        assert should_wait is True
+
+    def test_pace_request_sleeps_until_token_available(self):
+        """Test fire_request waits for the service bucket before sending."""
+        rate_limiter = self.request_executor.get_rate_limiter("zpa")
+        request = {"method": "GET", "service_type": "zpa", "url": "https://api.zsapi.net/zpa/x"}
+
+        with patch.object(rate_limiter, "wait", side_effect=[(True, 0.5), (False, 0)]), patch(
+            "zscaler.request_executor.time.sleep"
+        ) as mock_sleep:
+            self.request_executor._pace_request(request)
+
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_pacing_disabled(self):
+        """Test pacing can be switched off from the rateLimit config block."""
+        config = {"client": {"rateLimit": {"maxRetries": 3, "pacing": "false"}}}
+        request_executor = RequestExecutor(config, NoOpCache())
+        request = {"method": "GET", "service_type": "zpa", "url": "https://api.zsapi.net/zpa/x"}
+
+        with patch.object(request_executor, "get_rate_limiter") as mock_get_rate_limiter:
+            request_executor._pace_request(request)
+
+        mock_get_rate_limiter.assert_not_called()
+
+    def test_limiters_are_per_service(self):
+        """Test each service gets its own limiter and unknown services are not paced."""
+        assert self.request_executor.get_rate_limiter("zpa") is self.request_executor.get_rate_limiter("zpa")
+        assert self.request_executor.get_rate_limiter("zpa") is not self.request_executor.get_rate_limiter("ztb")
+        assert self.request_executor.get_rate_limiter("zcc") is None
+
+    def test_zia_paced_from_advertised_limit(self):
+        """Test ZIA has no guessed default and is paced once its responses advertise a per-second limit."""
+        assert self.request_executor.get_rate_limiter("zia") is None
+
+        rate_limiter = self.request_executor.get_rate_limiter("zia", {"X-RateLimit-Limit-Second": "10"})
+
+        assert rate_limiter.get_bucket.rate == 10
+
+    def test_retry_takes_a_token(self):
+        """Test a 429 retry is paced like the first attempt."""
+        request = {"method": "GET", "service_type": "zpa", "url": "https://api.zsapi.net/zpa/x", "headers": {}}
+        throttled = Mock(status_code=429, headers={"Retry-After": "0"}, text="")
+        ok = Mock(status_code=200, headers={}, text="{}")
+        self.request_executor._http_client = Mock()
+        self.request_executor._http_client.send_request.side_effect = [(throttled, None), (ok, None)]
+
+        with patch.object(self.request_executor, "_pace_request") as mock_pace, patch(
+            "zscaler.request_executor.time.sleep"
+        ), patch.object(self.request_executor, "get_retry_after", return_value=0):
+            _, response, _, error = self.request_executor.fire_request_helper(request, 0, time.time())
+
+        assert error is None and response is ok
+        mock_pace.assert_called_once_with(request)
+
+    def test_limiter_created_from_response_headers(self):
+        """Test services without defaults are paced once the API advertises a limit."""
+        request = {"method": "GET", "service_type": "zcc", "url": "https://api.zsapi.net/zcc/x"}
+        response = Mock(headers={"X-RateLimit-Limit-Second": "3", "X-RateLimit-Remaining-Second": "2"})
+
+        self.request_executor._update_rate_limits(request, response)
+
+        rate_limiter = self.request_executor.get_rate_limiter("zcc")
+        assert rate_limiter.get_limit == 3
+        assert rate_limiter.get_bucket.tokens == 2
+
+    def test_legacy_helper_rate_limiter_is_reused(self):
+        """Test the rate limiter carried by a legacy helper paces its requests."""
+        legacy_rate_limiter = RateLimiter(20, 10, 10, 10)
+        request_executor = RequestExecutor(self.config, NoOpCache(), zpa_legacy_client=Mock(rate_limiter=legacy_rate_limiter))
+
+        assert request_executor.get_rate_limiter("zpa") is legacy_rate_limiter
@@ -2,6 +2,7 @@
 Testing Request Executor for Zscaler SDK
 """
 
+import threading
 import time
 from http import HTTPStatus
 from unittest.mock import Mock, patch
@@ -9,6 +10,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.cache.zscaler_cache import ZscalerCache
 from zscaler.exceptions.exceptions import RetryTooLong
 from zscaler.request_executor import RequestExecutor
 
@@ -1189,3 +1191,156 @@ class TestZIAEditLockRetry:
         # Progression: 5, 10, 20, 40, 60 (capped), 60 (capped)
         for backoff in sleep_calls:
             assert backoff <= 60
+
+
+class TestRequestCoalescing:
+    """Tests for coalescing concurrent identical GETs."""
+
+    def test_identical_gets_share_one_call(self, make_executor, make_request, make_response):
+        """Test identical GETs fired concurrently share one HTTP call and the cached response."""
+        executor = make_executor(ZscalerCache(3600, 1800))
+        release = threading.Event()
+
+        def send_request(request):
+            release.wait(5)
+            return make_response('{"list": []}'), None
+
+        executor._http_client.send_request.side_effect = send_request
+        url = "https://api.zsapi.net/zpa/mgmtconfig/v1/admin/customers/1/segmentGroup"
+        fired = [make_request(url, service_type="zpa") for _ in range(10)]
+        results = [None] * len(fired)
+
+        def worker(index):
+            results[index] = executor.fire_request(fired[index])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(fired))]
+        for thread in threads:
+            thread.start()
+        while len(executor._in_flight) == 0:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert executor._http_client.send_request.call_count == 1
+        shared = results[0][1]
+        for request, (req, response, response_body, error) in zip(fired, results):
+            assert req is request
+            assert response is shared
+            assert response_body == '{"list": []}'
+            assert error is None
+
+        # Later identical GETs are served from the cache
+        executor.fire_request(make_request(url, service_type="zpa"))
+        assert executor._http_client.send_request.call_count == 1
+
+
+class TestConditionalRevalidation:
+    """Tests for revalidating expired cache entries with conditional GETs."""
+
+    def test_expired_entries_reused_on_not_modified(self, make_executor, make_request, make_response):
+        """Test an expired response with an ETag is revalidated and reused on 304 Not Modified."""
+        cache = ZscalerCache(60, 60)
+        executor = make_executor(cache)
+        validators = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 10:00:00 GMT"}
+        executor._http_client.send_request.side_effect = [
+            (make_response(b'{"list": [1, 2, 3]}', headers=validators), None),
+            (make_response(status_code=304, headers=validators), None),
+        ]
+        url = "https://api.zsapi.net/zia/api/v1/urlCategories"
+        authorization = {"Authorization": "Bearer token"}
+
+        _, cached, _, _ = executor.fire_request(make_request(url, headers=authorization))
+        request = make_request(url, headers=authorization)
+        with patch.object(cache, "_get_current_time", return_value=time.time() + 120):
+            req, response, response_body, error = executor.fire_request(request)
+            # The revalidated entry is fresh again
+            executor.fire_request(make_request(url, headers=authorization))
+
+        sent = executor._http_client.send_request.call_args_list[1][0][0]
+        assert sent["headers"]["If-None-Match"] == '"v1"'
+        assert sent["headers"]["If-Modified-Since"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+        assert "If-None-Match" not in request["headers"]
+        # Paginated responses reuse the returned request for their next pages
+        assert "If-None-Match" not in req["headers"] and "If-Modified-Since" not in req["headers"]
+        assert error is None
+        assert response is cached
+        assert response.body == {"list": [1, 2, 3]}
+        assert response_body == '{"list": [1, 2, 3]}'
+        assert executor._http_client.send_request.call_count == 2
+
+
+class TestCacheInvalidation:
+    """Tests for invalidating cached responses on mutations."""
+
+    def test_mutation_invalidates_parent_collection(self, make_executor, make_request, make_response):
+        """Test a PUT on a resource invalidates the cached collection listing it."""
+        cache = ZscalerCache(3600, 3600)
+        executor = make_executor(cache)
+        executor._http_client.send_request.return_value = (make_response({}), None)
+
+        base = "https://api.zsapi.net/zpa/mgmtconfig/v1/admin/customers/1"
+        collection = make_request(f"{base}/application", service_type="zpa")
+        collection["params"] = {"page": "1"}
+        unrelated = make_request(f"{base}/segmentGroup", service_type="zpa")
+        executor.fire_request(dict(collection))
+        executor.fire_request(dict(unrelated))
+        collection_key = cache.create_key(collection["url"], collection["params"])
+        assert cache.contains(collection_key)
+
+        executor.fire_request(make_request(f"{base}/application/123", method="PUT", service_type="zpa"))
+
+        assert not cache.contains(collection_key)
+        assert cache.contains(cache.create_key(unrelated["url"], {}))
+
+
+class TestNegativeCaching:
+    """Tests for caching 404 answers to by-ID lookups."""
+
+    BASE = "https://api.zsapi.net/zpa/mgmtconfig/v1/admin/customers/1/segmentGroup"
+    ITEM = f"{BASE}/72058304855015579"
+
+    @pytest.fixture
+    def not_found_executor(self, make_executor, make_response):
+        def make(negative_ttl):
+            executor = make_executor(cache_config={"negativeTtl": negative_ttl})
+            body = {"id": "resource.not.found", "reason": "Resource not found"}
+            executor._http_client.send_request.return_value = (make_response(body, status_code=404), None)
+            return executor
+
+        return make
+
+    @staticmethod
+    def _get(executor, make_request, url=ITEM):
+        return executor.execute(make_request(url, service_type="zpa"))
+
+    def test_not_found_by_id_lookups_cached(self, not_found_executor, make_request):
+        """Test 404 answers to by-ID GETs are cached for negativeTtl seconds and dropped by mutations."""
+        executor = not_found_executor(30)
+        for _ in range(3):
+            response, error = self._get(executor, make_request)
+            assert response is None and error.status_code == 404
+        assert executor._http_client.send_request.call_count == 1
+
+        # Collections are not cached when missing
+        self._get(executor, make_request, self.BASE)
+        self._get(executor, make_request, self.BASE)
+        assert executor._http_client.send_request.call_count == 3
+
+        # Expired after negativeTtl
+        with patch.object(executor._cache, "_get_current_time", return_value=time.time() + 31):
+            self._get(executor, make_request)
+        assert executor._http_client.send_request.call_count == 4
+
+        # Creating or updating the resource drops the cached 404
+        executor.fire_request(make_request(self.ITEM, method="PUT", service_type="zpa"))
+        self._get(executor, make_request)
+        assert executor._http_client.send_request.call_count == 6
+
+    def test_negative_caching_disabled_by_default(self, not_found_executor, make_request):
+        """Test 404 answers are not cached without negativeTtl."""
+        executor = not_found_executor(0)
+        self._get(executor, make_request)
+        self._get(executor, make_request)
+        assert executor._http_client.send_request.call_count == 2
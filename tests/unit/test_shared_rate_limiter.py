@@ -0,0 +1,103 @@
+"""
+Unit tests for the cross-process shared rate limiter.
+"""
+
+import multiprocessing
+import os
+import stat
+
+from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.ratelimiter.ratelimiter import RateLimiter
+from zscaler.ratelimiter.shared import SharedRateLimiter
+from zscaler.request_executor import RequestExecutor
+
+
+def _take_tokens(path, attempts, results):
+    rate_limiter = SharedRateLimiter(path, "tenant:zpa", 10, 5, 3600, 3600)
+    results.put(sum(1 for _ in range(attempts) if rate_limiter.wait("GET") == (False, 0)))
+
+
+def test_limiters_share_one_budget(tmp_path):
+    """Test two limiters on the same store draw from the same bucket."""
+    path = str(tmp_path / "ratelimit.sqlite")
+    first = SharedRateLimiter(path, "tenant:zpa", 3, 1, 3600, 3600)
+    second = SharedRateLimiter(path, "tenant:zpa", 3, 1, 3600, 3600)
+
+    assert first.wait("GET") == (False, 0)
+    assert second.wait("GET") == (False, 0)
+    assert first.wait("GET") == (False, 0)
+    should_wait, delay = second.wait("GET")
+    assert should_wait is True
+    assert delay > 0
+
+    # Write requests have their own bucket
+    assert second.wait("POST") == (False, 0)
+
+
+def test_store_is_private(tmp_path):
+    """Test the store file is only readable by its owner, like the other on-disk stores."""
+    path = tmp_path / "ratelimit.sqlite"
+    SharedRateLimiter(str(path), "tenant:zpa", 3, 1, 3600, 3600).wait("GET")
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_budgets_are_isolated_by_name(tmp_path):
+    """Test limiters with different names do not spend each other's tokens."""
+    path = str(tmp_path / "ratelimit.sqlite")
+    zpa = SharedRateLimiter(path, "tenant:zpa", 1, 1, 3600, 3600)
+    zia = SharedRateLimiter(path, "tenant:zia", 1, 1, 3600, 3600)
+
+    assert zpa.wait("GET") == (False, 0)
+    assert zia.wait("GET") == (False, 0)
+    assert zpa.wait("GET")[0] is True
+
+
+def test_update_limits_propagates(tmp_path):
+    """Test limits retuned from response headers in one process apply to the others."""
+    path = str(tmp_path / "ratelimit.sqlite")
+    first = SharedRateLimiter(path, "tenant:zcc", 10, 10, 1, 1)
+    second = SharedRateLimiter(path, "tenant:zcc", 10, 10, 1, 1)
+
+    first.update_limits({"X-RateLimit-Remaining-Second": "0", "X-RateLimit-Reset": "30"})
+
+    should_wait, delay = second.wait("GET")
+    assert should_wait is True
+    assert 29 < delay <= 30
+
+
+def test_budget_shared_across_processes(tmp_path):
+    """Test concurrent processes together never take more tokens than the bucket holds."""
+    path = str(tmp_path / "ratelimit.sqlite")
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_take_tokens, args=(path, 6, results)) for _ in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+
+    assert sum(results.get(timeout=5) for _ in processes) == 10
+
+
+def test_falls_back_to_in_process_pacing(tmp_path):
+    """Test an unusable store does not break requests."""
+    store = tmp_path / "not-a-database"
+    store.mkdir()
+    rate_limiter = SharedRateLimiter(str(store), "tenant:zpa", 1, 1, 3600, 3600)
+
+    assert rate_limiter.wait("GET") == (False, 0)
+    assert rate_limiter.wait("GET")[0] is True
+
+
+def test_request_executor_uses_shared_store(tmp_path):
+    """Test rateLimit.sharedStore switches the service limiters to the shared backend."""
+    path = str(tmp_path / "ratelimit.sqlite")
+    config = {"client": {"vanityDomain": "acme", "rateLimit": {"maxRetries": 3, "sharedStore": path}}}
+    request_executor = RequestExecutor(config, NoOpCache())
+
+    rate_limiter = request_executor.get_rate_limiter("zpa")
+    assert isinstance(rate_limiter, SharedRateLimiter)
+    assert rate_limiter.name == "acme:zpa"
+
+    request_executor = RequestExecutor({"client": {"rateLimit": {"maxRetries": 3}}}, NoOpCache())
+    assert type(request_executor.get_rate_limiter("zpa")) is RateLimiter
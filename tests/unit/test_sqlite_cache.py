@@ -0,0 +1,287 @@
+"""
+Testing the persistent SQLite response cache for Zscaler SDK
+"""
+
+import json
+import multiprocessing
+import os
+import sqlite3
+import stat
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from zscaler.cache.backends import cache_namespace, get_cache
+from zscaler.cache.cached_response import CachedResponse
+from zscaler.cache.lru_cache import LRUCache
+from zscaler.cache.sqlite_cache import ACCESS_FLUSH_INTERVAL, SQLiteCache
+from zscaler.cache.zscaler_cache import ZscalerCache
+
+TTL = 3600
+TTI = 1800
+CACHE_KEY = "https://api.zsapi.net/zia/api/v1/urlCategories?customOnly=true"
+
+
+def _response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = CACHE_KEY
+    response.reason = "OK"
+    response._content = json.dumps(body).encode()
+    response.headers["Content-Type"] = "application/json"
+    return response, response.text
+
+
+def test_sqlite_cache_round_trips_responses(tmp_path):
+    """Test cached responses come back with their status, headers and body."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), TTL, TTI)
+    cache.add(CACHE_KEY, _response([{"id": "CUSTOM_01", "name": "café"}]))
+
+    assert cache.contains(CACHE_KEY)
+    response, body = cache.get(CACHE_KEY)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [{"id": "CUSTOM_01", "name": "café"}]
+    assert json.loads(body) == [{"id": "CUSTOM_01", "name": "café"}]
+
+    cache.add("plain", ("test_response", "test_body"))
+    assert cache.get("plain") == ("test_response", "test_body")
+
+    cache.delete(CACHE_KEY)
+    assert not cache.contains(CACHE_KEY)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    """Test a new cache instance on the same file sees earlier entries."""
+    path = str(tmp_path / "cache.sqlite")
+    SQLiteCache(path, TTL, TTI).add(CACHE_KEY, _response({"id": 1}))
+
+    response, _ = SQLiteCache(path, TTL, TTI).get(CACHE_KEY)
+    assert response.json() == {"id": 1}
+
+
+def test_sqlite_cache_expiration(tmp_path):
+    """Test entries expire after their TTL or when idle longer than their TTI."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), 100.0, 10.0)
+    now = time.time()
+
+    with patch.object(cache, "_get_current_time") as mock_time:
+        mock_time.return_value = now
+        cache.add("a", ("r", "a"))
+        cache.add("b", ("r", "b"))
+
+        mock_time.return_value = now + 8
+        assert cache.get("a") == ("r", "a")
+
+        mock_time.return_value = now + 12
+        assert cache.contains("a")
+        assert not cache.contains("b")
+
+        mock_time.return_value = now + 101
+        assert cache.get("a") is None
+
+
+def test_sqlite_cache_retains_stale_entries(tmp_path):
+    """Test entries added with a stale TTL can be revalidated after they expire."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), 10.0, 10.0)
+    now = time.time()
+
+    with patch.object(cache, "_get_current_time") as mock_time:
+        mock_time.return_value = now
+        cache.add(CACHE_KEY, _response({"id": 1}), stale_ttl=30.0)
+        assert cache.get_stale(CACHE_KEY) is None
+
+        mock_time.return_value = now + 20
+        assert cache.get(CACHE_KEY) is None
+        response, _ = cache.get_stale(CACHE_KEY)
+        assert response.json() == {"id": 1}
+
+        mock_time.return_value = now + 45
+        cache.add("other", ("r", "b"))
+        assert cache.get_stale(CACHE_KEY) is None
+        assert len(cache) == 1
+
+
+def test_sqlite_cache_size_caps(tmp_path):
+    """Test maxEntries and maxBytes evict the least recently used entries."""
+    cache = SQLiteCache(str(tmp_path / "entries.sqlite"), TTL, TTI, max_entries=2)
+    now = time.time()
+    with patch.object(cache, "_get_current_time") as mock_time:
+        for offset, key in enumerate(["a", "b"]):
+            mock_time.return_value = now + offset
+            cache.add(key, ("r", key))
+        mock_time.return_value = now + 2
+        cache.get("a")
+        mock_time.return_value = now + 3
+        cache.add("c", ("r", "c"))
+
+    assert cache.contains("a") and cache.contains("c")
+    assert not cache.contains("b")
+
+    cache = SQLiteCache(str(tmp_path / "bytes.sqlite"), TTL, TTI, max_bytes=100)
+    with patch.object(cache, "_get_current_time") as mock_time:
+        for offset, key in enumerate(["a", "b", "c"]):
+            mock_time.return_value = now + offset
+            cache.add(key, ["x" * 40])
+        # Larger than the whole cache
+        cache.add("big", ["x" * 200])
+
+    assert not cache.contains("a")
+    assert cache.contains("b") and cache.contains("c")
+    assert not cache.contains("big")
+
+
+def _add_entries(path, worker, results):
+    cache = SQLiteCache(path, TTL, TTI)
+    for i in range(20):
+        cache.add(f"{worker}:{i}", ["value", i])
+    results.put(len(cache))
+
+
+def test_sqlite_cache_shared_across_processes(tmp_path):
+    """Test several processes can write to the same cache file."""
+    path = str(tmp_path / "cache.sqlite")
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_add_entries, args=(path, n, results)) for n in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+
+    assert all(process.exitcode == 0 for process in processes)
+    cache = SQLiteCache(path, TTL, TTI)
+    assert len(cache) == 60
+    assert cache.get("2:19") == ("value", 19)
+
+
+def test_sqlite_cache_unavailable_behaves_as_empty(tmp_path):
+    """Test a file that is not a database makes the cache miss instead of failing requests."""
+    store = tmp_path / "not-a-database"
+    store.write_bytes(b"garbage" * 1000)
+    cache = SQLiteCache(str(store), TTL, TTI)
+
+    cache.add(CACHE_KEY, ("r", "body"))
+    assert cache.get(CACHE_KEY) is None
+    assert not cache.contains(CACHE_KEY)
+
+
+def test_sqlite_cache_isolates_namespaces(tmp_path):
+    """Test tenants sharing the file only see, count and clear their own entries."""
+    path = str(tmp_path / "cache.sqlite")
+    tenant_a = SQLiteCache(path, TTL, TTI, namespace=cache_namespace("client-a", "acme"))
+    tenant_b = SQLiteCache(path, TTL, TTI, namespace=cache_namespace("client-b", "acme"))
+
+    tenant_a.add(CACHE_KEY, _response({"id": "a"}))
+    assert tenant_b.get(CACHE_KEY) is None
+    assert not tenant_b.contains(CACHE_KEY)
+    assert len(tenant_b) == 0
+
+    tenant_b.add(CACHE_KEY, _response({"id": "b"}))
+    tenant_b.invalidate(CACHE_KEY)
+    tenant_b.clear()
+    response, _ = tenant_a.get(CACHE_KEY)
+    assert response.json() == {"id": "a"}
+    assert len(tenant_a) == 1
+
+
+def test_sqlite_cache_file_is_private(tmp_path):
+    """Test the cache file and its directory are only accessible by their owner."""
+    path = tmp_path / "zscaler" / "cache.sqlite"
+    SQLiteCache(str(path), TTL, TTI).add(CACHE_KEY, ("r", "body"))
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+
+
+def test_sqlite_cache_drops_undecodable_rows(tmp_path):
+    """Test a corrupt or old-format row is a miss and is deleted."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), TTL, TTI)
+    cache.add(CACHE_KEY, _response({"id": 1}))
+    cache._connection().execute("UPDATE response_cache SET meta = ?", ('{"status_code": 200}',))
+
+    assert cache.get(CACHE_KEY) is None
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_reads_buffer_access_times(tmp_path):
+    """Test hits don't write the database until the flush interval passes or an entry is added."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), TTL, 10.0)
+    now = time.time()
+
+    def accessed():
+        return cache._connection().execute("SELECT accessed FROM response_cache WHERE key = 'a'").fetchone()[0]
+
+    with patch.object(cache, "_get_current_time") as mock_time:
+        mock_time.return_value = now
+        cache.add("a", ("r", "a"))
+
+        mock_time.return_value = now + 1
+        assert cache.get("a") == ("r", "a")
+        assert accessed() == now
+
+        mock_time.return_value = now + 2
+        cache.add("b", ("r", "b"))
+        assert accessed() == now + 1
+
+        mock_time.return_value = now + 2 + ACCESS_FLUSH_INTERVAL
+        assert cache.get("a") == ("r", "a")
+        assert accessed() == now + 2 + ACCESS_FLUSH_INTERVAL
+
+
+def test_sqlite_cache_reuses_decoded_responses(tmp_path):
+    """Test hits on an unchanged row share the decoded snapshot, and a rewrite by another instance is seen."""
+    path = str(tmp_path / "cache.sqlite")
+    cache = SQLiteCache(path, TTL, TTI)
+    cache.add(CACHE_KEY, (CachedResponse.from_response(*_response({"id": 1})), ""))
+
+    first, _ = cache.get(CACHE_KEY)
+    with patch("zscaler.cache.sqlite_cache._decode") as decode:
+        second, _ = cache.get(CACHE_KEY)
+    decode.assert_not_called()
+    assert second is first
+
+    SQLiteCache(path, TTL, TTI).add(CACHE_KEY, (CachedResponse.from_response(*_response({"id": 2})), ""))
+    response, _ = cache.get(CACHE_KEY)
+    assert response.json() == {"id": 2}
+
+
+def test_sqlite_cache_upgrades_unversioned_database(tmp_path):
+    """Test a database created before rows were versioned gains the column."""
+    path = str(tmp_path / "cache.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE response_cache (key TEXT PRIMARY KEY, kind TEXT NOT NULL, meta TEXT NOT NULL, body BLOB, "
+        "size INTEGER NOT NULL, expires REAL NOT NULL, tti REAL NOT NULL, stale REAL NOT NULL, accessed REAL NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO response_cache VALUES ('plain', 'json', ?, NULL, 1, ?, ?, 0, ?)",
+        (json.dumps(["r", "body"]), time.time() + TTL, TTI, time.time()),
+    )
+    conn.commit()
+    conn.close()
+
+    cache = SQLiteCache(path, TTL, TTI)
+    assert cache.get("plain") == ("r", "body")
+    cache.add(CACHE_KEY, ("r", "body"))
+    assert len(cache) == 2
+
+
+def test_get_cache_backends(tmp_path):
+    """Test the cache config block selects the backend."""
+    assert isinstance(get_cache({"enabled": True, "defaultTtl": 300, "defaultTti": 300}), ZscalerCache)
+
+    lru = get_cache({"backend": "lru", "maxEntries": "100", "maxBytes": ""})
+    assert isinstance(lru, LRUCache)
+    assert lru._max_entries == 100 and lru._max_bytes is None
+
+    sqlite = get_cache({"backend": "sqlite", "path": str(tmp_path / "c.sqlite"), "defaultTtl": "60"})
+    assert isinstance(sqlite, SQLiteCache)
+    assert sqlite._time_to_live == 60.0
+    assert get_cache({"backend": "sqlite", "path": str(tmp_path / "c.sqlite")}, namespace="t1").namespace == "t1"
+
+    with pytest.raises(ValueError, match="Invalid cache backend"):
+        get_cache({"backend": "redis"})
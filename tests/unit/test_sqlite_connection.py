@@ -0,0 +1,66 @@
+"""
+Unit tests for the per-thread SQLite connections shared by the on-disk stores.
+"""
+
+import os
+import stat
+import threading
+
+import pytest
+
+from zscaler.sqlite_connection import SQLiteConnection
+
+SCHEMA = ("CREATE TABLE IF NOT EXISTS items (key TEXT PRIMARY KEY)",)
+
+
+def test_database_is_private_and_in_wal_mode(tmp_path):
+    """Test the file and its directory are only accessible by their owner, and WAL is on."""
+    path = tmp_path / "zscaler" / "store.sqlite"
+    conn = SQLiteConnection(str(path), SCHEMA)()
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_connection_per_thread_and_process(tmp_path):
+    """Test each thread gets its own connection, and a forked child opens a fresh one."""
+    connection = SQLiteConnection(str(tmp_path / "store.sqlite"), SCHEMA)
+    main = connection()
+    assert connection() is main
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not main
+
+    # As seen from a child process after fork
+    connection._local.pid = -1
+    assert connection() is not main
+
+
+def test_setup_runs_on_new_connections(tmp_path):
+    """Test the setup hook sees the schema created."""
+    seen = []
+    connection = SQLiteConnection(
+        str(tmp_path / "store.sqlite"),
+        SCHEMA,
+        setup=lambda conn: seen.append(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]),
+    )
+    connection()
+    connection()
+    assert seen == [0]
+
+
+def test_transaction_rolls_back_on_error(tmp_path):
+    """Test a failing block leaves the database unchanged."""
+    connection = SQLiteConnection(str(tmp_path / "store.sqlite"), SCHEMA)
+    with connection.transaction() as conn:
+        conn.execute("INSERT INTO items VALUES ('kept')")
+    with pytest.raises(RuntimeError):
+        with connection.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('dropped')")
+            raise RuntimeError("boom")
+
+    assert connection().execute("SELECT key FROM items").fetchall() == [("kept",)]
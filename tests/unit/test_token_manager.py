@@ -0,0 +1,70 @@
+"""
+Testing the multi-tenant token manager for Zscaler SDK
+"""
+
+from unittest.mock import Mock
+
+from zscaler.oneapi_oauth_client import OAuth
+from zscaler.token_manager import TokenManager
+
+
+def _client_config(client_id, secret="secret", cloud=None):
+    config = {"clientId": client_id, "clientSecret": secret, "vanityDomain": "testcompany"}
+    if cloud:
+        config["cloud"] = cloud
+    return config
+
+
+def test_tenant_key():
+    """Test tenants are told apart by client ID, vanity domain, cloud and credentials."""
+    key = TokenManager.tenant_key(_client_config("tenant1"))
+
+    assert key == TokenManager.tenant_key(_client_config("tenant1", cloud="production"))
+    assert key != TokenManager.tenant_key(_client_config("tenant2"))
+    assert key != TokenManager.tenant_key(_client_config("tenant1", cloud="beta"))
+    assert key != TokenManager.tenant_key(_client_config("tenant1", secret="other_secret"))
+    # The credential is only kept as a digest
+    assert "secret" not in key
+
+
+def test_token_manager_keeps_many_tenants():
+    """Test the token states of several tenants are kept at once."""
+    manager = TokenManager(max_tenants=3)
+    states = [manager.get(f"tenant{i}") for i in range(3)]
+
+    assert len(manager) == 3
+    assert [manager.get(f"tenant{i}") for i in range(3)] == states
+
+
+def test_token_manager_evicts_least_recently_used_tenant():
+    """Test tenants beyond max_tenants are dropped, least recently used first."""
+    manager = TokenManager(max_tenants=2)
+    first = manager.get("tenant1")
+    manager.get("tenant2")
+    manager.get("tenant1")
+    first.renewal_timer = Mock()
+
+    manager.get("tenant3")
+
+    assert "tenant1" in manager
+    assert "tenant2" not in manager
+    assert "tenant3" in manager
+
+    timer = first.renewal_timer
+    manager.discard("tenant1")
+    assert "tenant1" not in manager
+    timer.cancel.assert_called_once()
+    assert first.renewal_timer is None
+
+
+def test_oauth_clients_alternating_tenants_keep_tokens(monkeypatch):
+    """Test clients alternating between tenants don't discard each other's tokens."""
+    monkeypatch.setattr(OAuth, "_token_manager", TokenManager())
+    configs = [{"client": _client_config(f"tenant{i}")} for i in range(3)]
+
+    for i, config in enumerate(configs):
+        OAuth(Mock(), config)._access_token = f"token{i}"
+
+    for i, config in enumerate(configs):
+        assert OAuth(Mock(), config)._access_token == f"token{i}"
+    assert len(OAuth._token_manager) == 3
@@ -0,0 +1,107 @@
+"""
+Testing the encrypted OAuth token store for Zscaler SDK
+"""
+
+import os
+import stat
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from zscaler.oneapi_oauth_client import OAuth
+from zscaler.token_manager import TokenManager
+from zscaler.token_store import TokenStore, derive_key
+
+KEY = "oauth_token_client_testcompany_production"
+
+
+def _token_data(access_token="stored_token", expires_in=3600):
+    now = time.time()
+    return {"access_token": access_token, "expires_at": now + expires_in, "issued_at": now}
+
+
+def test_token_store_round_trip(tmp_path):
+    """Test tokens are stored encrypted and read back with the same key."""
+    path = str(tmp_path / "tokens.db")
+    encryption_key = derive_key("secret", KEY)
+    store = TokenStore(path)
+
+    store.add(KEY, _token_data(), encryption_key)
+
+    assert store.get(KEY, encryption_key)["access_token"] == "stored_token"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    content = b""
+    for db_file in (path, f"{path}-wal"):
+        if os.path.exists(db_file):
+            with open(db_file, "rb") as db:
+                content += db.read()
+    assert b"stored_token" not in content
+    assert b"testcompany" not in content
+
+
+def test_token_store_ignores_other_keys_and_expired_tokens(tmp_path):
+    """Test tokens encrypted with other credentials or expired are not returned."""
+    store = TokenStore(str(tmp_path / "tokens.db"))
+    encryption_key = derive_key("secret", KEY)
+
+    store.add(KEY, _token_data(), encryption_key)
+    assert store.get(KEY, derive_key("other_secret", KEY)) is None
+    assert store.get(KEY, Fernet.generate_key()) is None
+
+    store.add(KEY, _token_data(expires_in=-1), encryption_key)
+    assert store.get(KEY, encryption_key) is None
+
+
+def test_token_store_delete_keeps_newer_token(tmp_path):
+    """Test deleting a rejected token keeps a token another process stored since."""
+    store = TokenStore(str(tmp_path / "tokens.db"))
+    encryption_key = derive_key("secret", KEY)
+    store.add(KEY, _token_data("new_token"), encryption_key)
+
+    store.delete(KEY, "old_token", encryption_key)
+    assert store.get(KEY, encryption_key)["access_token"] == "new_token"
+
+    store.delete(KEY, "new_token", encryption_key)
+    assert store.get(KEY, encryption_key) is None
+
+
+def test_oauth_reuses_stored_token_in_new_process(tmp_path, monkeypatch):
+    """Test a client reuses a valid token stored by an earlier process."""
+    config = {
+        "client": {
+            "clientId": "store_client",
+            "clientSecret": "secret",
+            "vanityDomain": "testcompany",
+            "tokenStore": {"path": str(tmp_path / "tokens.db")},
+        }
+    }
+    oauth = OAuth(Mock(), config)
+    oauth._set_token("stored_token", time.time() + 3600, time.time())
+    oauth._store_token()
+    oauth.close()
+
+    # A new process starts with an empty token manager
+    monkeypatch.setattr(OAuth, "_token_manager", TokenManager())
+    oauth = OAuth(Mock(), config)
+    with patch.object(oauth, "authenticate") as authenticate:
+        assert oauth._get_access_token() == "stored_token"
+    oauth.close()
+
+    authenticate.assert_not_called()
+
+
+def test_oauth_rejects_invalid_token_store_key(tmp_path):
+    """Test a malformed tokenStore.key is reported when the client is created."""
+    config = {
+        "client": {
+            "clientId": "store_client",
+            "clientSecret": "secret",
+            "vanityDomain": "testcompany",
+            "tokenStore": {"path": str(tmp_path / "tokens.db"), "key": "not-a-fernet-key"},
+        }
+    }
+
+    with pytest.raises(ValueError):
+        OAuth(Mock(), config)
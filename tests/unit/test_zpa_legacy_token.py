@@ -0,0 +1,113 @@
+"""
+Testing access token handling of the ZPA legacy client for Zscaler SDK
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from zscaler.zpa.legacy import TOKEN_REFRESH_MARGIN, LegacyZPAClientHelper
+
+
+def _login_response(access_token, expires_in="3600"):
+    response = Mock(status_code=200)
+    response.json.return_value = {"token_type": "Bearer", "access_token": access_token, "expires_in": expires_in}
+    return response
+
+
+def _client(login):
+    with patch.object(LegacyZPAClientHelper, "login", login):
+        client = LegacyZPAClientHelper(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            customer_id="test_customer_id",
+            cloud="PRODUCTION",
+        )
+    client.login = login
+    return client
+
+
+def test_login_records_token_expiry():
+    """Test the expiry is taken from expires_in at login, and headers stay a plain dict."""
+    client = _client(Mock(return_value=_login_response("token1")))
+
+    assert client._token_expires_at == pytest.approx(time.time() + 3600, abs=5)
+    assert client._token_refresh_at == pytest.approx(client._token_expires_at - TOKEN_REFRESH_MARGIN)
+    assert client.headers["Authorization"] == "Bearer token1"
+    assert type(client.headers) is dict
+    # The merged request headers are read-only, but track changes to headers
+    with pytest.raises(TypeError):
+        client._request_headers()["Authorization"] = "Bearer other"
+    client.headers["X-Custom"] = "1"
+    assert client._request_headers()["X-Custom"] == "1"
+
+
+def test_send_reuses_token_and_headers():
+    """Test requests neither log in again nor rebuild headers while the token is fresh."""
+    login = Mock(return_value=_login_response("token1"))
+    client = _client(login)
+    session = Mock()
+    session.request.return_value = Mock(status_code=200, text="{}")
+    client.set_session(session)
+
+    with patch("zscaler.zpa.legacy.check_response_for_error", return_value=({}, None)):
+        _, first = client.send("GET", "/mgmtconfig/v1/admin/customers/1/application")
+        _, second = client.send("GET", "/mgmtconfig/v1/admin/customers/1/segmentGroup")
+
+    login.assert_called_once()
+    assert session.request.call_args_list[0][1]["headers"] is session.request.call_args_list[1][1]["headers"]
+    assert type(second["headers"]) is dict
+    assert second["headers"]["Authorization"] == "Bearer token1"
+
+
+def test_token_refreshed_once_before_expiry():
+    """Test threads finding the token about to expire share one login and keep working."""
+    client = _client(Mock(return_value=_login_response("token1")))
+    client._token_refresh_at = time.time() - 1
+
+    calls = []
+
+    def login():
+        calls.append(1)
+        time.sleep(0.05)
+        return _login_response("token2")
+
+    client.login = login
+    threads = [threading.Thread(target=client.refreshToken) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert client.headers["Authorization"] == "Bearer token2"
+
+
+def test_failed_refresh_keeps_valid_token():
+    """Test a failed proactive refresh keeps the current token and retries later."""
+    client = _client(Mock(return_value=_login_response("token1")))
+    client._token_refresh_at = time.time() - 1
+    client.login = Mock(return_value=None)
+
+    client.refreshToken()
+
+    assert client.access_token == "token1"
+    assert client._token_refresh_at > time.time()
+
+    client._token_expires_at = client._token_refresh_at = time.time() - 1
+    with pytest.raises(Exception):
+        client.refreshToken()
+
+
+def test_expiry_read_from_token_without_expires_in():
+    """Test the JWT exp claim is used, once, when the signin response has no expires_in."""
+    import base64
+    import json
+
+    expires_at = int(time.time()) + 1800
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expires_at}).encode()).decode().rstrip("=")
+    client = _client(Mock(return_value=_login_response(f"header.{payload}.signature", expires_in=None)))
+
+    assert client._token_expires_at == expires_at
@@ -138,7 +138,7 @@ class TestAuthHeaderFormation:
         client = _build_client()
         assert client._build_auth_header_value() == f"Bearer {_TEST_DELEGATE_TOKEN}"
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_send_sets_bearer_authorization_header(self, mock_request):
         client = _build_client()
         mock_resp = _make_response(200, json_data={"ok": True})
@@ -193,7 +193,7 @@ class TestURLResolution:
             with pytest.raises(ValueError, match="Cloud environment must be set"):
                 _build_client(cloud=None)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_send_builds_correct_url(self, mock_request):
         client = _build_client(cloud="zscalerbd-api")
         mock_resp = _make_response(200, json_data={})
@@ -205,7 +205,7 @@ class TestURLResolution:
         _, kwargs = mock_request.call_args
         assert kwargs["url"] == "https://zscalerbd-api.goairgap.com/api/v2/alarm"
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_send_strips_leading_slash_correctly(self, mock_request):
         client = _build_client(cloud="zscalerbd-api")
         mock_resp = _make_response(200, json_data={})
@@ -225,7 +225,7 @@ class TestURLResolution:
 
 class TestAutoReauth:
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("requests.post")
     def test_401_triggers_reauth_and_retry(self, mock_post, mock_request):
         client = _build_client()
@@ -245,7 +245,7 @@ class TestAutoReauth:
         mock_post.assert_called_once()
         assert client._delegate_token == new_token
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("requests.post")
     def test_401_reauth_only_once(self, mock_post, mock_request):
         """If reauth succeeds but the retried request also returns 401, don't loop."""
@@ -299,7 +299,7 @@ class TestRetryAfterParsing:
         result = LegacyZTBClientHelper._parse_retry_after({"Retry-After": "not-a-number"}, attempt=0)
         assert result >= 1
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.ztb.legacy.sleep")
     def test_429_retries_with_retry_after(self, mock_sleep, mock_request):
         client = _build_client(max_retries=3)
@@ -314,7 +314,7 @@ class TestRetryAfterParsing:
         assert resp.status_code == 200
         mock_sleep.assert_called_once_with(2)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.ztb.legacy.sleep")
     def test_429_exhausts_retries(self, mock_sleep, mock_request):
         client = _build_client(max_retries=2)
@@ -335,7 +335,7 @@ class TestRetryAfterParsing:
 
 class TestTransientErrorRetries:
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.ztb.legacy.sleep")
     def test_502_retries_then_succeeds(self, mock_sleep, mock_request):
         client = _build_client(max_retries=3)
@@ -350,7 +350,7 @@ class TestTransientErrorRetries:
         assert resp.status_code == 200
         assert mock_sleep.call_count == 1
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.ztb.legacy.sleep")
     def test_503_retries(self, mock_sleep, mock_request):
         client = _build_client(max_retries=2)
@@ -361,7 +361,7 @@ class TestTransientErrorRetries:
         with pytest.raises(ValueError, match="maximum retries"):
             client.send("GET", "/api/v2/alarm")
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.ztb.legacy.sleep")
     def test_504_retries(self, mock_sleep, mock_request):
         client = _build_client(max_retries=1)
@@ -383,7 +383,7 @@ class TestTransientErrorRetries:
 
 class TestNetworkErrorRetries:
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.ztb.legacy.sleep")
     def test_connection_error_retries(self, mock_sleep, mock_request):
         client = _build_client(max_retries=2)
@@ -399,7 +399,7 @@ class TestNetworkErrorRetries:
         assert resp.status_code == 200
         assert mock_sleep.call_count == 1
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     @patch("zscaler.ztb.legacy.sleep")
     def test_network_error_exhausts_retries(self, mock_sleep, mock_request):
         client = _build_client(max_retries=2)
@@ -541,7 +541,7 @@ class TestHeaders:
         client = _build_client()
         assert "x-partner-id" not in client.headers
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_custom_headers_merged_in_send(self, mock_request):
         client = _build_client()
         mock_resp = _make_response(200, json_data={})
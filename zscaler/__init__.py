@@ -33,3 +33,4 @@ __version__ = "1.9.43"
 
 
 from zscaler.oneapi_client import Client as ZscalerClient  # noqa
+from zscaler.oneapi_async_client import AsyncClient as ZscalerAsyncClient  # noqa
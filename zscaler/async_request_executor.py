@@ -0,0 +1,115 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from zscaler.oneapi_response import ZscalerAPIResponse
+from zscaler.request_executor import DEFAULT_MAX_CONCURRENCY, RequestExecutor
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+
+class AsyncRequestExecutor:
+    """
+    Awaitable counterpart of :class:`zscaler.request_executor.RequestExecutor`.
+
+    The SDK transport is built on ``requests``, so every call is dispatched to a
+    bounded worker pool and awaited from the event loop. The wrapped executor
+    keeps ownership of OAuth, retries, caching and the HTTP session, which means
+    the ``create_request``/``execute`` contract is identical to the synchronous
+    one, only awaitable.
+
+    The worker pool size is the shared in-flight budget: any number of
+    coroutines may be scheduled on the loop, but at most ``max_concurrency``
+    HTTP calls are on the wire at the same time.
+    """
+
+    def __init__(
+        self,
+        request_executor: RequestExecutor,
+        max_concurrency: Optional[int] = None,
+        thread_pool: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        """
+        Constructor for the AsyncRequestExecutor.
+
+        Args:
+            request_executor (RequestExecutor): The synchronous executor doing the actual work.
+            max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 10.
+            thread_pool (ThreadPoolExecutor, optional): Externally managed pool to run requests on.
+        """
+        max_concurrency = int(max_concurrency or DEFAULT_MAX_CONCURRENCY)
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max concurrency: {max_concurrency}. Must be 1 or greater.")
+
+        self._request_executor = request_executor
+        self._max_concurrency = max_concurrency
+        self._owns_thread_pool = thread_pool is None
+        self._thread_pool = thread_pool or ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="zscaler-async")
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    def get_request_executor(self) -> RequestExecutor:
+        return self._request_executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a blocking SDK callable on the worker pool and awaits its result.
+
+        Args:
+            func (callable): Any synchronous SDK callable (API method, executor method, ...).
+
+        Returns:
+            Whatever ``func`` returns.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._thread_pool, functools.partial(func, *args, **kwargs))
+
+    async def create_request(
+        self,
+        method: str,
+        endpoint: str,
+        body: dict = None,
+        headers: dict = None,
+        params: dict = None,
+        use_raw_data_for_body: bool = False,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        """
+        Awaitable :meth:`RequestExecutor.create_request`.
+
+        Request creation may fetch an OAuth token, so it runs on the worker pool as well.
+        """
+        return await self.run(
+            self._request_executor.create_request,
+            method,
+            endpoint,
+            body=body,
+            headers=headers,
+            params=params,
+            use_raw_data_for_body=use_raw_data_for_body,
+        )
+
+    async def execute(
+        self,
+        request: Dict[str, Any],
+        response_type: Optional[type] = None,
+        return_raw_response: bool = False,
+    ) -> Tuple[Optional[ZscalerAPIResponse], Optional[Exception]]:
+        """
+        Awaitable :meth:`RequestExecutor.execute`.
+        """
+        return await self.run(
+            self._request_executor.execute,
+            request,
+            response_type,
+            return_raw_response,
+        )
+
+    def close(self) -> None:
+        """Shuts down the worker pool if this executor created it."""
+        if self._owns_thread_pool:
+            logger.debug("Shutting down async request executor worker pool.")
+            self._thread_pool.shutdown(wait=True)
@@ -0,0 +1,67 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+from zscaler.cache.cache import Cache
+
+CACHE_BACKENDS = ("memory", "lru", "sqlite")
+DEFAULT_TTL = 300
+DEFAULT_TTI = 300
+
+
+def _number(value, cast, default=None):
+    # Environment variables arrive as strings, unset values as "" or None
+    if value in (None, ""):
+        return default
+    return cast(value)
+
+
+def cache_namespace(*identity: Optional[str]) -> str:
+    """
+    Returns the namespace isolating the persisted responses of one tenant.
+
+    Args:
+        identity (str): The values identifying the tenant, e.g. ``clientId``,
+            ``vanityDomain``, ``customerId`` and ``cloud``.
+
+    Returns:
+        str: A digest of the identity, so credentials never end up in the cache file.
+    """
+    return hashlib.sha256("\0".join(str(value or "") for value in identity).encode()).hexdigest()[:32]
+
+
+def get_cache(cache_config: Dict[str, Any], namespace: Optional[str] = None) -> Cache:
+    """
+    Builds the response cache described by the ``cache`` client setting.
+
+    Args:
+        cache_config (dict): The ``cache`` configuration block. ``backend`` selects
+            ``"memory"`` (default, :class:`ZscalerCache`), ``"lru"`` (:class:`LRUCache`)
+            or ``"sqlite"`` (:class:`SQLiteCache`, stored at ``path``). ``maxEntries``
+            and ``maxBytes`` bound the ``lru`` and ``sqlite`` backends.
+        namespace (str, optional): Tenant namespace of the ``sqlite`` entries, see
+            :func:`cache_namespace`.
+
+    Returns:
+        Cache: The cache.
+    """
+    backend = str(cache_config.get("backend") or "memory").strip().lower()
+    ttl = _number(cache_config.get("defaultTtl"), float, DEFAULT_TTL)
+    tti = _number(cache_config.get("defaultTti"), float, DEFAULT_TTI)
+    max_entries = _number(cache_config.get("maxEntries"), int)
+    max_bytes = _number(cache_config.get("maxBytes"), int)
+
+    if backend == "memory":
+        from zscaler.cache.zscaler_cache import ZscalerCache
+
+        return ZscalerCache(ttl, tti)
+    if backend == "lru":
+        from zscaler.cache.lru_cache import LRUCache
+
+        return LRUCache(ttl, tti, max_entries=max_entries, max_bytes=max_bytes)
+    if backend == "sqlite":
+        from zscaler.cache.sqlite_cache import SQLiteCache
+
+        return SQLiteCache(
+            cache_config.get("path"), ttl, tti, max_entries=max_entries, max_bytes=max_bytes, namespace=namespace
+        )
+    raise ValueError(f"Invalid cache backend: {backend}. Must be one of: {', '.join(CACHE_BACKENDS)}.")
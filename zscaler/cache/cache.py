@@ -6,9 +6,16 @@ class Cache:
     This is the ABSTRACT class that defines a Cache object for the ZPA Client
     """
 
+    # CacheStats counting the entries the cache evicts, expires or invalidates, if any
+    stats = None
+
     def __init__(self):
         pass
 
+    def __bool__(self):
+        # Caches defining __len__ must not be falsy when empty: callers test "if self._cache"
+        return True
+
     def get(self, key):
         """
         A method which retrieves the desired value from the cache.
@@ -49,6 +56,22 @@ class Cache:
         """
         raise NotImplementedError
 
+    def get_stale(self, key):
+        """
+        A method which retrieves a value that is no longer fresh but is kept
+        so it can be revalidated with a conditional request.
+
+        Caches that keep such values accept a ``stale_ttl`` keyword in
+        :meth:`add`: the number of seconds an entry is retained after it expires.
+
+        Arguments:
+            key {str} -- The key used to find the desired value
+
+        Returns:
+            None -- Caches that don't keep expired values have nothing to return
+        """
+        return None
+
     def delete(self, key):
         """
         A method which deletes a key-value pair from the cache.
@@ -62,6 +85,19 @@ class Cache:
         """
         raise NotImplementedError
 
+    def invalidate(self, key):
+        """
+        A method which removes the entries a mutation of the resource at key
+        makes stale: the resource with its query-parameter variants, its
+        sub-resources, and the collections above it.
+
+        Arguments:
+            key {str} -- The key of the mutated resource
+
+        Caches that don't index their keys only delete the exact key.
+        """
+        self.delete(key)
+
     def clear(self):
         """
         A method used to empty the cache.
@@ -72,6 +108,17 @@ class Cache:
         """
         raise NotImplementedError
 
+    def _record(self, event, key, value=1):
+        """
+        Records a cache event for key in the attached CacheStats, if any.
+
+        Arguments:
+            event {str} -- One of zscaler.cache.stats.CACHE_EVENTS
+            key {str} -- Key of the entry concerned
+        """
+        if self.stats is not None:
+            self.stats.record_key(event, key, value)
+
     def create_key(self, request, params):
         """
         A method used to create a unique key for an entry in the cache.
@@ -0,0 +1,137 @@
+import json
+from types import MappingProxyType
+
+from requests.structures import CaseInsensitiveDict
+
+from zscaler.json_codec import default_codec
+
+# Response headers not kept with cached responses: they describe the connection,
+# or carry session cookies that must not be replayed nor written to disk caches
+UNCACHED_HEADERS = frozenset(("connection", "keep-alive", "set-cookie", "transfer-encoding"))
+
+
+class CachedResponse:
+    """
+    Compact, immutable snapshot of a successful response, stored in the response
+    cache instead of the ``requests.Response`` with its raw buffers and connection.
+
+    JSON bodies are decoded once, when the response is cached. Each read of
+    :attr:`body` or :meth:`json` returns a fresh copy of the decoded tree,
+    which is cheaper than decoding the text again, so callers may modify what
+    they get without corrupting the cache for later hits or other threads.
+
+    The snapshot quacks like a ``requests.Response`` (``status_code``, ``headers``,
+    ``text``, ``content``, ``json()``, ``ok``), so it can be returned to callers
+    asking for the raw response. Its headers are a read-only, case-insensitive
+    copy of the response headers, so cache hits still carry the rate limit
+    (``X-RateLimit-*``), pagination (``Link``, ``X-Next-Page``) and custom
+    headers; only :data:`UNCACHED_HEADERS` are dropped.
+
+    Args:
+        status_code (int): HTTP status code.
+        headers (Mapping): Response headers, except :data:`UNCACHED_HEADERS`.
+        text (str): Response body text.
+        body (dict or list, optional): Decoded JSON body.
+        content (bytes, optional): Raw body, kept for non-JSON payloads such as file downloads.
+        url (str, optional): Final URL of the response.
+        reason (str, optional): HTTP reason phrase.
+    """
+
+    __slots__ = ("status_code", "headers", "text", "_body", "_content", "url", "reason")
+
+    def __init__(self, status_code, headers, text, body=None, content=None, url=None, reason=None):
+        kept = CaseInsensitiveDict({name: value for name, value in headers.items() if name.lower() not in UNCACHED_HEADERS})
+        for name, value in (
+            ("status_code", status_code),
+            ("headers", MappingProxyType(kept)),
+            ("text", text),
+            ("_body", body),
+            ("_content", content),
+            ("url", url),
+            ("reason", reason),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def from_response(cls, response, response_body, json_codec=None):
+        """
+        Snapshots a response, decoding JSON bodies with ``json_codec``.
+
+        Args:
+            response (requests.Response): The response.
+            response_body (str): The response text.
+            json_codec (JSONCodec, optional): Codec decoding JSON bodies. Defaults to the process default codec.
+
+        Returns:
+            CachedResponse: The snapshot.
+        """
+        headers = response.headers
+        body = None
+        content = None
+        if "application/json" in headers.get("Content-Type", "").lower():
+            try:
+                body = (json_codec or default_codec).loads(response_body)
+            except (json.JSONDecodeError, TypeError, ValueError):
+                body = None
+        else:
+            content = response.content
+        return cls(
+            response.status_code,
+            headers,
+            response_body,
+            body=body if isinstance(body, (dict, list)) else None,
+            content=content,
+            url=getattr(response, "url", None),
+            reason=getattr(response, "reason", None),
+        )
+
+    @property
+    def body(self):
+        """Copy of the decoded JSON body, or None for non-JSON payloads."""
+        return _copy_json(self._body)
+
+    @property
+    def has_body(self):
+        """Whether the snapshot holds a decoded JSON body."""
+        return self._body is not None
+
+    @property
+    def content(self):
+        if self._content is not None:
+            return self._content
+        return (self.text or "").encode("utf-8")
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def size(self):
+        """Approximate memory footprint of the snapshot, in bytes."""
+        text = len(self.text or "")
+        headers = sum(len(name) + len(value) for name, value in self.headers.items())
+        # The decoded body takes at least as much room as its text
+        return text + (text if self._body is not None else 0) + len(self._content or b"") + headers
+
+    def json(self, **kwargs):
+        if self._body is not None:
+            return self.body
+        return json.loads(self.text, **kwargs)
+
+    def __repr__(self):
+        return f"<CachedResponse [{self.status_code}]>"
+
+
+def _copy_json(value):
+    """Copies a decoded JSON tree; strings, numbers, booleans and None are immutable and shared."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
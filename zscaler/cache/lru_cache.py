@@ -0,0 +1,295 @@
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from zscaler.cache.cache import Cache
+from zscaler.cache.cached_response import CachedResponse
+from zscaler.cache.path_index import PathIndex
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+
+def estimate_size(value):
+    """
+    Approximate memory footprint of a cached value, in bytes.
+
+    Cached values are ``(response, response_body)`` tuples, whose size is
+    dominated by the body text and, for :class:`CachedResponse`, its decoded
+    body; other values fall back to ``sys.getsizeof``.
+    """
+    if isinstance(value, tuple) and value and isinstance(value[0], CachedResponse):
+        return value[0].size
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "ttl", "tti", "idle", "stale", "size", "generation")
+
+    def __init__(self, value, ttl, idle, stale, size, generation):
+        self.value = value
+        self.ttl = ttl
+        self.idle = idle
+        self.tti = 0.0
+        self.stale = stale
+        self.size = size
+        self.generation = generation
+
+    def is_fresh(self, now):
+        return self.ttl > now and self.tti > now
+
+    def is_retained(self, now):
+        return self.ttl + self.stale > now and self.tti + self.stale > now
+
+
+class LRUCache(Cache):
+    """
+    Bounded in-memory cache with TTL/TTI expiry and least-recently-used eviction.
+
+    Drop-in replacement for :class:`ZscalerCache` through the ``cacheManager``
+    client setting, for long running processes with large or many responses:
+
+    * ``get``/``add``/``contains``/``delete`` are amortized O(1).
+    * Expired entries are evicted lazily: on access, and from the front of an
+      expiry heap (TTL) and of the LRU order (TTI) when entries are added.
+    * ``max_entries`` and ``max_bytes`` cap the cache; the least recently used
+      entries are evicted first.
+
+    Args:
+        ttl (float): Time to live of cache entries, in seconds.
+        tti (float): Time to idle of cache entries, in seconds.
+        max_entries (int, optional): Maximum number of entries. Unbounded when None.
+        max_bytes (int, optional): Maximum estimated size of the cached values. Unbounded when None.
+        sizeof (callable, optional): Estimates the size of a value. Defaults to :func:`estimate_size`.
+
+    Example:
+        >>> from zscaler.cache.lru_cache import LRUCache
+        >>> config = {
+        ...     "clientId": "...",
+        ...     "clientSecret": "...",
+        ...     "vanityDomain": "...",
+        ...     "cache": {"enabled": True},
+        ...     "cacheManager": LRUCache(ttl=300, tti=300, max_entries=5000, max_bytes=256 * 1024 * 1024),
+        ... }
+    """
+
+    def __init__(self, ttl, tti, max_entries=None, max_bytes=None, sizeof=None):
+        super().__init__()
+        self._time_to_live = ttl
+        self._time_to_idle = tti
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof or estimate_size
+
+        self._store = OrderedDict()  # key -> _Entry, least recently used first
+        self._index = PathIndex()  # cached keys by URL path
+        self._expiry_heap = []  # (ttl + stale ttl deadline, generation, key)
+        self._generations = itertools.count()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        """
+        Retrieves value from cache using key, marking it as recently used.
+
+        Arguments:
+            key {str} -- Desired key
+
+        Returns:
+            Corresponding value to given key, or None if it is missing or expired
+        """
+        with self._lock:
+            entry = self._valid_entry(key)
+            if entry is None:
+                logger.debug(f'Key "{key}" not found in cache.')
+                return None
+            entry.tti = self._get_current_time() + entry.idle
+            self._store.move_to_end(key)
+            return entry.value
+
+    def contains(self, key):
+        """
+        Returns existence of a valid entry for key in cache, as boolean
+
+        Arguments:
+            key {str} -- Desired key
+        """
+        with self._lock:
+            return self._valid_entry(key) is not None
+
+    def get_stale(self, key):
+        """
+        Retrieves a value whose TTL or TTI passed but which is still retained for revalidation
+
+        Arguments:
+            key {str} -- Desired key
+
+        Returns:
+            Corresponding value to given key, or None if it is missing, fresh or no longer retained
+        """
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            now = self._get_current_time()
+            if not entry.is_retained(now):
+                self._expire(key)
+                return None
+            return None if entry.is_fresh(now) else entry.value
+
+    def add(self, key, value, ttl=None, tti=None, stale_ttl=0):
+        """
+        Adds a key-value pair to the cache, evicting expired and least recently used entries as needed.
+
+        Arguments:
+            key {str} -- Key in pair
+            value {tuple} -- Tuple of response and response body
+            ttl {float} -- Time to live of this entry. Defaults to the cache TTL.
+            tti {float} -- Time to idle of this entry. Defaults to the cache TTI.
+            stale_ttl {float} -- Seconds the entry is retained for revalidation once expired.
+        """
+        if not isinstance(key, str):
+            logger.error(f'Failed to add key "{key}" to cache. Invalid key type.')
+            return
+
+        size = self._sizeof(value)
+        if self._max_bytes is not None and size > self._max_bytes:
+            logger.debug(f'Not caching key "{key}": {size} bytes exceeds maxBytes.')
+            return
+
+        with self._lock:
+            now = self._get_current_time()
+            self._remove(key)
+            ttl = self._time_to_live if ttl is None else ttl
+            idle = self._time_to_idle if tti is None else tti
+            entry = _Entry(value, now + ttl, idle, stale_ttl, size, next(self._generations))
+            entry.tti = now + idle
+            self._store[key] = entry
+            self._index.add(key)
+            self._bytes += size
+            heapq.heappush(self._expiry_heap, (entry.ttl + stale_ttl, entry.generation, key))
+
+            self._evict_expired(now)
+            self._evict_overflow()
+            logger.debug(f'Successfully added key "{key}" to cache.')
+
+    def delete(self, key):
+        """
+        Delete a key-value pair from the cache.
+
+        Arguments:
+            key {str} -- Desired key
+        """
+        with self._lock:
+            if self._remove(key):
+                logger.debug(f'Successfully deleted key "{key}" from cache.')
+
+    def invalidate(self, key):
+        """
+        Delete the entries made stale by a mutation of the resource at key: the resource
+        and its query variants, its sub-resources, and the collections above it.
+
+        Arguments:
+            key {str} -- Key of the mutated resource
+        """
+        with self._lock:
+            related = self._index.related(key)
+            for related_key in related:
+                self._remove(related_key)
+        if related:
+            logger.debug(f"Invalidated keys from cache: {related}")
+        for related_key in related:
+            self._record("invalidations", related_key)
+
+    def clear(self):
+        """
+        Clear the cache.
+        """
+        with self._lock:
+            self._store.clear()
+            self._index.clear()
+            self._expiry_heap = []
+            self._bytes = 0
+        logger.debug("Cache cleared successfully.")
+
+    def __len__(self):
+        return len(self._store)
+
+    @property
+    def size_bytes(self):
+        """Estimated size of the cached values, in bytes."""
+        return self._bytes
+
+    def _valid_entry(self, key):
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        now = self._get_current_time()
+        if entry.is_fresh(now):
+            return entry
+        if not entry.is_retained(now):
+            self._expire(key)
+        return None
+
+    def _remove(self, key):
+        entry = self._store.pop(key, None)
+        if entry is None:
+            return False
+        # Its heap item becomes stale and is skipped when it reaches the top
+        self._index.discard(key)
+        self._bytes -= entry.size
+        return True
+
+    def _expire(self, key):
+        self._remove(key)
+        self._record("expirations", key)
+
+    def _evict_expired(self, now):
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, generation, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            if entry is not None and entry.generation == generation:
+                self._expire(key)
+
+        # Entries idle the longest sit at the front of the LRU order
+        while self._store:
+            key, entry = next(iter(self._store.items()))
+            if entry.is_retained(now):
+                break
+            self._expire(key)
+
+        # Stale heap items of replaced or deleted entries are dropped on rebuild
+        if len(heap) > 2 * len(self._store) + 64:
+            self._expiry_heap = [item for item in heap if self._is_current(item)]
+            heapq.heapify(self._expiry_heap)
+
+    def _is_current(self, item):
+        entry = self._store.get(item[2])
+        return entry is not None and entry.generation == item[1]
+
+    def _evict_overflow(self):
+        while self._store and (
+            (self._max_entries is not None and len(self._store) > self._max_entries)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            key = next(iter(self._store))
+            self._remove(key)
+            self._record("evictions", key)
+            logger.debug(f'Evicted least recently used key "{key}" from cache.')
+
+    def _get_current_time(self):
+        """
+        Helper function to get current time
+
+        Returns:
+            float: value representing the number of seconds since the epoch
+        """
+        return time.time()
@@ -0,0 +1,108 @@
+def split_key(key):
+    """
+    Splits a cache key into its path segments, ignoring the query string.
+
+    Example:
+        >>> split_key("api.zsapi.net/zia/api/v1/locations/42?page=1")
+        ['api.zsapi.net', 'zia', 'api', 'v1', 'locations', '42']
+    """
+    return [segment for segment in key.split("?", 1)[0].split("/") if segment]
+
+
+class _Node:
+    __slots__ = ("parent", "segment", "children", "keys")
+
+    def __init__(self, parent=None, segment=None):
+        self.parent = parent
+        self.segment = segment
+        self.children = {}
+        self.keys = set()
+
+
+class PathIndex:
+    """
+    Tree of cache keys by URL path segment, used to find the entries a mutation
+    makes stale without scanning the whole cache.
+
+    Each node holds the keys whose path ends there, i.e. all query-parameter
+    variants of one resource or collection. :meth:`related` returns, in O(depth)
+    plus the number of matches, the keys of the mutated resource, of its
+    sub-resources and of every collection above it.
+
+    The index isn't thread safe; caches update it under their own lock.
+
+    Example:
+        >>> index = PathIndex()
+        >>> index.add("host/zpa/v1/application?page=1")
+        >>> index.add("host/zpa/v1/application/123")
+        >>> index.add("host/zpa/v1/segmentGroup")
+        >>> sorted(index.related("host/zpa/v1/application/123"))
+        ['host/zpa/v1/application/123', 'host/zpa/v1/application?page=1']
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._nodes = {}  # key -> node holding it
+
+    def add(self, key):
+        """Indexes ``key``."""
+        if key in self._nodes:
+            return
+        node = self._root
+        for segment in split_key(key):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node(node, segment)
+            node = child
+        node.keys.add(key)
+        self._nodes[key] = node
+
+    def discard(self, key):
+        """Removes ``key`` from the index, pruning the branches left empty."""
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return
+        node.keys.discard(key)
+        while node.parent is not None and not node.keys and not node.children:
+            del node.parent.children[node.segment]
+            node = node.parent
+
+    def related(self, key):
+        """
+        Returns the indexed keys a mutation of ``key`` invalidates.
+
+        Arguments:
+            key {str} -- Cache key of the mutated resource
+
+        Returns:
+            list -- Keys of the resource and its query variants, its sub-resources,
+            and the collections above it with their query variants
+        """
+        related = []
+        node = self._root
+        for segment in split_key(key):
+            node = node.children.get(segment)
+            if node is None:
+                return related
+            related.extend(node.keys)
+        # Keys of the resource itself were collected on the way down
+        related.extend(k for child in node.children.values() for k in self._subtree_keys(child))
+        return related
+
+    def clear(self):
+        """Removes all keys from the index."""
+        self._root = _Node()
+        self._nodes = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        return key in self._nodes
+
+    def _subtree_keys(self, node):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield from node.keys
+            stack.extend(node.children.values())
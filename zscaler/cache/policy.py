@@ -0,0 +1,143 @@
+import re
+
+from zscaler.helpers import to_snake_case
+
+# Endpoint families whose data changes much faster or slower than the cache-wide
+# defaults. ``path`` is a regular expression searched in the request path, so it
+# matches both OneAPI (/zia/api/v1/...) and legacy (/api/v1/...) URLs.
+DEFAULT_CACHE_POLICIES = [
+    {
+        # Pending changes must be seen right after every mutation
+        "name": "zia-activation-status",
+        "service": "zia",
+        "path": r"/status$",
+        "enabled": False,
+    },
+    {
+        "name": "ztw-activation-status",
+        "service": "ztw",
+        "path": r"/ecAdminActivateStatus$",
+        "enabled": False,
+    },
+    {
+        # The predefined cloud application catalog rarely changes
+        "name": "zia-cloud-applications",
+        "service": "zia",
+        "path": r"/cloudApplications(/|$)",
+        "ttl": 3600,
+        "tti": 3600,
+    },
+]
+
+
+def _non_negative(value, setting):
+    if value is None or value == "":
+        return None
+    value = float(value)
+    if value < 0:
+        raise ValueError(f"{setting} must be 0 or greater")
+    return value
+
+
+class CachePolicy:
+    """
+    Caching behaviour of one endpoint family.
+
+    Args:
+        name (str): Identifier of the endpoint family, used in logs.
+        service (str): Service type as returned by ``RequestExecutor.get_service_type``.
+        path (str): Regular expression searched in the request path.
+        enabled (bool, optional): Whether responses are cached at all.
+        ttl (float, optional): Time to live of the cached responses, in seconds. Defaults to ``cache.defaultTtl``.
+        tti (float, optional): Time to idle of the cached responses, in seconds. Defaults to ``cache.defaultTti``.
+        max_entry_size (int, optional): Responses estimated larger than this many bytes are not cached.
+        stale_while_revalidate (float, optional): Seconds after expiry during which
+            the cached response is served immediately while it is refreshed in the background.
+    """
+
+    def __init__(
+        self,
+        name,
+        service,
+        path,
+        enabled=True,
+        ttl=None,
+        tti=None,
+        max_entry_size=None,
+        stale_while_revalidate=0,
+    ):
+        self.name = name
+        self.service = service
+        self.path = path
+        self._path_regex = re.compile(path)
+        self.enabled = str(enabled).lower() not in ("false", "0", "no")
+        self.ttl = _non_negative(ttl, "ttl")
+        self.tti = _non_negative(tti, "tti")
+        max_entry_size = _non_negative(max_entry_size, "maxEntrySize")
+        self.max_entry_size = int(max_entry_size) if max_entry_size is not None else None
+        self.stale_while_revalidate = float(stale_while_revalidate or 0)
+
+    def matches(self, service_type, path):
+        if self.service is not None and service_type != self.service:
+            return False
+        return self._path_regex.search(path or "") is not None
+
+
+class CachePolicyRegistry:
+    """
+    Declarative table mapping endpoint patterns to their cache policy.
+
+    Requests matching no policy use the cache-wide settings.
+
+    Example:
+        >>> registry = CachePolicyRegistry.from_config(
+        ...     [{"service": "zia", "path": "/urlCategories", "ttl": 1800, "maxEntrySize": 1048576}]
+        ... )
+        >>> registry.match("zia", "/zia/api/v1/status").enabled
+        False
+        >>> registry = CachePolicyRegistry.from_config(
+        ...     [{"service": "zia", "path": "/locations", "staleWhileRevalidate": 600}]
+        ... )
+        >>> registry.match("zia", "/zia/api/v1/locations").stale_while_revalidate
+        600.0
+    """
+
+    def __init__(self, policies=None):
+        self.policies = list(policies or [])
+
+    @classmethod
+    def from_config(cls, policies=None, include_defaults=True):
+        """
+        Builds a registry from ``cache.policies`` entries. Entries are matched in order.
+
+        User supplied entries are matched first, so they override the defaults
+        for the same endpoint.
+
+        Args:
+            policies (list, optional): Cache policy definitions (dicts with camelCase keys).
+            include_defaults (bool): Append ``DEFAULT_CACHE_POLICIES``.
+
+        Returns:
+            CachePolicyRegistry: The registry.
+        """
+        definitions = list(policies or [])
+        if include_defaults:
+            definitions += DEFAULT_CACHE_POLICIES
+
+        cache_policies = []
+        for definition in definitions:
+            definition = {to_snake_case(key): value for key, value in dict(definition).items()}
+            definition.setdefault("name", definition.get("path"))
+            definition.setdefault("service", None)
+            try:
+                cache_policies.append(CachePolicy(**definition))
+            except (TypeError, ValueError, re.error) as e:
+                raise ValueError(f"Invalid cache policy definition {definition}: {e}")
+        return cls(cache_policies)
+
+    def match(self, service_type, path):
+        """Returns the first cache policy matching the request, if any."""
+        for policy in self.policies:
+            if policy.matches(service_type, path):
+                return policy
+        return None
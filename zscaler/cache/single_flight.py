@@ -0,0 +1,64 @@
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key: the first caller runs the
+    function, callers arriving while it is in flight wait for it and receive
+    the same result (or exception) instead of running it again.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> result, shared = flights.do(cache_key, lambda: send(request))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """
+        Runs ``fn`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key (str): Identity of the call, e.g. the cache key of a GET request.
+            fn (callable): Function to run when no call for ``key`` is in flight.
+
+        Returns:
+            tuple: The result of ``fn`` and whether it was shared from another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def __len__(self):
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,483 @@
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+
+from zscaler.cache.cache import Cache
+from zscaler.cache.cached_response import CachedResponse
+from zscaler.json_codec import default_codec
+from zscaler.sqlite_connection import DEFAULT_LOCK_TIMEOUT, SQLiteConnection
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+DEFAULT_CACHE_PATH = os.path.join("~", ".zscaler", "response_cache.sqlite")
+# Seconds read times are buffered in the process before being written
+ACCESS_FLUSH_INTERVAL = 5
+# Decoded responses kept in the process, so hits skip the JSON decode
+DECODED_ENTRIES = 256
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS response_cache (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    meta TEXT NOT NULL,
+    body BLOB,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    tti REAL NOT NULL,
+    stale REAL NOT NULL,
+    accessed REAL NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+)
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS response_cache_accessed ON response_cache (accessed)"
+_ADD_VERSION = "ALTER TABLE response_cache ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+
+
+def _encode(value):
+    """
+    Serializes a cache value to ``(kind, meta, body)``.
+
+    ``(CachedResponse, body)`` and ``(requests.Response, body)`` tuples keep the
+    status, headers and body of the response; other values must be JSON serializable.
+    """
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], CachedResponse):
+        response = value[0]
+        meta = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "url": response.url,
+            "reason": response.reason,
+            "json": response.has_body,
+        }
+        return "cached", json.dumps(meta), response.content
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], requests.Response):
+        response, body = value
+        meta = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "url": response.url,
+            "reason": response.reason,
+        }
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return "response", json.dumps(meta), body
+    return "json", json.dumps(value), None
+
+
+def _decode(kind, meta, body):
+    if kind == "cached":
+        meta = json.loads(meta)
+        if meta["json"]:
+            # SQLiteCache keeps the decoded snapshot, so this runs once per row version
+            text = body.decode("utf-8")
+            response = CachedResponse(
+                meta["status_code"],
+                meta["headers"],
+                text,
+                body=default_codec.loads(text),
+                url=meta["url"],
+                reason=meta["reason"],
+            )
+        else:
+            text = body.decode("utf-8", errors="replace")
+            response = CachedResponse(
+                meta["status_code"], meta["headers"], text, content=body, url=meta["url"], reason=meta["reason"]
+            )
+        return response, text
+    if kind != "response":
+        value = json.loads(meta)
+        return tuple(value) if isinstance(value, list) else value
+
+    meta = json.loads(meta)
+    response = requests.Response()
+    response.status_code = meta["status_code"]
+    response.headers.update(meta["headers"])
+    response.url = meta["url"]
+    response.reason = meta["reason"]
+    response.encoding = "utf-8"
+    response._content = body
+    return response, body.decode("utf-8") if body is not None else None
+
+
+class SQLiteCache(Cache):
+    """
+    Response cache persisted in a SQLite database, so short-lived processes
+    (CLI tools, cron jobs) on the same host reuse each other's responses.
+
+    Entries expire after ``ttl`` seconds, or ``tti`` seconds without being read.
+    ``max_entries`` and ``max_bytes`` cap the database; the least recently used
+    entries are evicted first. Each process and thread uses its own connection
+    and writes are serialized by SQLite, so any number of processes can share
+    the file. If the database cannot be used, the cache behaves as empty.
+
+    Reads don't write: the time of each hit is buffered in the process and
+    written in one batch every :data:`ACCESS_FLUSH_INTERVAL` seconds, and
+    before each :meth:`add` evicts entries. Every write gives the row a new
+    version, and the process keeps the last :data:`DECODED_ENTRIES` decoded
+    responses by version, so a hit on an unchanged row skips the body and its
+    JSON decode.
+
+    Entries are stored under ``namespace``, so clients of different tenants
+    sharing the file never read each other's responses. The file is only
+    readable by its owner. Rows that can't be decoded are dropped and treated
+    as misses.
+
+    Args:
+        path (str): SQLite database file shared by the cooperating processes.
+        ttl (float): Time to live of cache entries, in seconds.
+        tti (float): Time to idle of cache entries, in seconds.
+        max_entries (int, optional): Maximum number of entries. Unbounded when None.
+        max_bytes (int, optional): Maximum size of the cached bodies. Unbounded when None.
+        timeout (float, optional): Seconds to wait for the database lock.
+        namespace (str, optional): Tenant the entries belong to, see :func:`cache_namespace`.
+    """
+
+    def __init__(self, path, ttl, tti, max_entries=None, max_bytes=None, timeout=DEFAULT_LOCK_TIMEOUT, namespace=None):
+        super().__init__()
+        self.path = os.path.expanduser(path or DEFAULT_CACHE_PATH)
+        self.namespace = namespace or ""
+        self._prefix = f"{self.namespace}|" if self.namespace else ""
+        self._time_to_live = ttl
+        self._time_to_idle = tti
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self.timeout = timeout
+        self._connection = SQLiteConnection(self.path, (_CREATE_TABLE, _CREATE_INDEX), timeout, setup=self._upgrade)
+        self._lock = threading.Lock()
+        # Row key -> time of the last hit not yet written to the database
+        self._pending_access = {}
+        self._last_flush = self._get_current_time()
+        # Row key -> (version, decoded value)
+        self._decoded = OrderedDict()
+
+    def _upgrade(self, conn):
+        if "version" not in {column[1] for column in conn.execute("PRAGMA table_info(response_cache)")}:
+            # Database created before rows were versioned
+            conn.execute(_ADD_VERSION)
+
+    def _row_key(self, key):
+        return self._prefix + key
+
+    def _key(self, row_key):
+        return row_key[len(self._prefix) :]
+
+    def _namespace_filter(self):
+        """Returns the ``(where, params)`` selecting the rows of this namespace."""
+        if not self._prefix:
+            return "1", ()
+        # "}" sorts right after "|": [prefix, upper) holds every key of the namespace
+        return "key >= ? AND key < ?", (self._prefix, self.namespace + "}")
+
+    def _decode_row(self, key, row):
+        try:
+            return _decode(*row)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f'Dropping undecodable cache entry "{key}": {e}')
+            self.delete(key)
+            return None
+
+    def _entry(self, key):
+        """
+        Looks up the expiry of the entry at key, counting hits not yet written.
+
+        Returns:
+            tuple: ``(version, expires, idle_expires, stale)``, or None when the key is missing
+        """
+        row_key = self._row_key(key)
+        row = (
+            self._connection()
+            .execute("SELECT version, expires, tti, stale, accessed FROM response_cache WHERE key = ?", (row_key,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        version, expires, tti, stale, accessed = row
+        with self._lock:
+            accessed = max(accessed, self._pending_access.get(row_key, accessed))
+        return version, expires, accessed + tti, stale
+
+    def _load(self, key, version):
+        """Returns the decoded value of version ``version`` of the entry at key, or None if it was replaced."""
+        row_key = self._row_key(key)
+        with self._lock:
+            decoded = self._decoded.get(row_key)
+            if decoded is not None and decoded[0] == version:
+                self._decoded.move_to_end(row_key)
+                return decoded[1]
+        row = (
+            self._connection()
+            .execute("SELECT kind, meta, body FROM response_cache WHERE key = ? AND version = ?", (row_key, version))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        value = self._decode_row(key, row)
+        # Only immutable snapshots can be handed to several callers
+        if row[0] == "cached" and value is not None:
+            with self._lock:
+                self._decoded[row_key] = (version, value)
+                self._decoded.move_to_end(row_key)
+                while len(self._decoded) > DECODED_ENTRIES:
+                    self._decoded.popitem(last=False)
+        return value
+
+    def _flush_access(self, conn):
+        """Writes the buffered hit times; call inside a transaction."""
+        with self._lock:
+            pending, self._pending_access = self._pending_access, {}
+            self._last_flush = self._get_current_time()
+        conn.executemany(
+            "UPDATE response_cache SET accessed = MAX(accessed, ?) WHERE key = ?",
+            [(accessed, row_key) for row_key, accessed in pending.items()],
+        )
+
+    def _touch(self, key, now):
+        """Records a hit, writing the buffered hits once :data:`ACCESS_FLUSH_INTERVAL` passed."""
+        with self._lock:
+            self._pending_access[self._row_key(key)] = now
+            if now - self._last_flush < ACCESS_FLUSH_INTERVAL:
+                return
+        try:
+            with self._connection.transaction() as conn:
+                self._flush_access(conn)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Response cache {self.path} unavailable: {e}")
+
+    def get(self, key):
+        """
+        Retrieves value from cache using key, resetting its idle timer.
+
+        Arguments:
+            key {str} -- Desired key
+
+        Returns:
+            Corresponding value to given key, or None if it is missing or expired
+        """
+        now = self._get_current_time()
+        try:
+            entry = self._entry(key)
+            if entry is None or entry[1] <= now or entry[2] <= now:
+                logger.debug(f'Key "{key}" not found in cache.')
+                return None
+            value = self._load(key, entry[0])
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Response cache {self.path} unavailable: {e}")
+            return None
+        if value is not None:
+            self._touch(key, now)
+        return value
+
+    def get_stale(self, key):
+        """
+        Retrieves a value whose TTL or TTI passed but which is still retained for revalidation
+
+        Arguments:
+            key {str} -- Desired key
+
+        Returns:
+            Corresponding value to given key, or None if it is missing, fresh or no longer retained
+        """
+        now = self._get_current_time()
+        try:
+            entry = self._entry(key)
+            if entry is None:
+                return None
+            version, expires, idle_expires, stale = entry
+            if (expires > now and idle_expires > now) or expires + stale <= now or idle_expires + stale <= now:
+                return None
+            return self._load(key, version)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Response cache {self.path} unavailable: {e}")
+            return None
+
+    def contains(self, key):
+        """
+        Returns existence of a valid entry for key in cache, as boolean
+
+        Arguments:
+            key {str} -- Desired key
+        """
+        now = self._get_current_time()
+        try:
+            entry = self._entry(key)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Response cache {self.path} unavailable: {e}")
+            return False
+        return entry is not None and entry[1] > now and entry[2] > now
+
+    def add(self, key, value, ttl=None, tti=None, stale_ttl=0):
+        """
+        Adds a key-value pair to the cache, evicting expired and least recently used entries as needed.
+
+        Arguments:
+            key {str} -- Key in pair
+            value {tuple} -- Tuple of response and response body
+            ttl {float} -- Time to live of this entry. Defaults to the cache TTL.
+            tti {float} -- Time to idle of this entry. Defaults to the cache TTI.
+            stale_ttl {float} -- Seconds the entry is retained for revalidation once expired.
+        """
+        if not isinstance(key, str):
+            logger.error(f'Failed to add key "{key}" to cache. Invalid key type.')
+            return
+        try:
+            kind, meta, body = _encode(value)
+        except (TypeError, ValueError) as e:
+            logger.debug(f'Not caching key "{key}": value is not serializable ({e}).')
+            return
+
+        size = len(meta) + len(body or b"")
+        if self._max_bytes is not None and size > self._max_bytes:
+            logger.debug(f'Not caching key "{key}": {size} bytes exceeds maxBytes.')
+            return
+
+        now = self._get_current_time()
+        ttl = self._time_to_live if ttl is None else ttl
+        tti = self._time_to_idle if tti is None else tti
+        try:
+            with self._connection.transaction() as conn:
+                self._flush_access(conn)
+                conn.execute(
+                    "INSERT OR REPLACE INTO response_cache "
+                    "(key, kind, meta, body, size, expires, tti, stale, accessed, version) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self._row_key(key), kind, meta, body, size, now + ttl, tti, stale_ttl, now, secrets.randbits(63)),
+                )
+                expired = self._delete(conn, "expires + stale <= ? OR accessed + tti + stale <= ?", [(now, now)])
+                evicted = self._evict_overflow(conn)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Response cache {self.path} unavailable: {e}")
+            return
+        logger.debug(f'Successfully added key "{key}" to cache.')
+        for expired_key in expired:
+            self._record("expirations", expired_key)
+        for evicted_key in evicted:
+            self._record("evictions", evicted_key)
+
+    def delete(self, key):
+        """
+        Delete a key-value pair from the cache.
+
+        Arguments:
+            key {str} -- Desired key
+        """
+        with self._lock:
+            self._decoded.pop(self._row_key(key), None)
+        try:
+            self._connection().execute("DELETE FROM response_cache WHERE key = ?", (self._row_key(key),))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Response cache {self.path} unavailable: {e}")
+
+    def invalidate(self, key):
+        """
+        Delete the entries made stale by a mutation of the resource at key: the resource
+        and its query variants, its sub-resources, and the collections above it.
+
+        Each is a range of the primary key index, so this takes O(depth) lookups.
+
+        Arguments:
+            key {str} -- Key of the mutated resource
+        """
+        path = key.split("?", 1)[0].rstrip("/")
+        # "@" and "0" sort right after "?" and "/": [path?, path@) holds the query variants
+        ranges = [(path + "?", path + "@"), (path + "/", path + "0")]
+        exact = [path]
+        while "/" in path:
+            path = path.rsplit("/", 1)[0]
+            exact.append(path)
+            ranges.append((path + "?", path + "@"))
+        exact = [self._row_key(k) for k in exact]
+        ranges = [(self._row_key(low), self._row_key(high)) for low, high in ranges]
+        try:
+            with self._connection.transaction() as conn:
+                invalidated = self._delete(conn, "key = ?", [(k,) for k in exact])
+                invalidated += self._delete(conn, "key >= ? AND key < ?", ranges)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Response cache {self.path} unavailable: {e}")
+            return
+        for invalidated_key in invalidated:
+            self._record("invalidations", invalidated_key)
+
+    def clear(self):
+        """
+        Clear the cache.
+        """
+        where, params = self._namespace_filter()
+        with self._lock:
+            self._decoded.clear()
+            self._pending_access.clear()
+        try:
+            self._connection().execute(f"DELETE FROM response_cache WHERE {where}", params)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Response cache {self.path} unavailable: {e}")
+            return
+        logger.debug("Cache cleared successfully.")
+
+    def __len__(self):
+        where, params = self._namespace_filter()
+        return self._connection().execute(f"SELECT COUNT(*) FROM response_cache WHERE {where}", params).fetchone()[0]
+
+    @property
+    def size_bytes(self):
+        """Size of the cached entries of this namespace, in bytes."""
+        where, params = self._namespace_filter()
+        return (
+            self._connection()
+            .execute(f"SELECT COALESCE(SUM(size), 0) FROM response_cache WHERE {where}", params)
+            .fetchone()[0]
+        )
+
+    def _delete(self, conn, where, parameters):
+        """
+        Deletes the entries matching ``where`` for each set of parameters.
+
+        Returns:
+            list: The deleted keys when cache statistics are collected, else an empty list
+        """
+        deleted = []
+        if self.stats is not None:
+            for params in parameters:
+                deleted.extend(
+                    self._key(key)
+                    for (key,) in conn.execute(f"SELECT key FROM response_cache WHERE {where}", params)
+                    if key.startswith(self._prefix)
+                )
+        conn.executemany(f"DELETE FROM response_cache WHERE {where}", parameters)
+        return deleted
+
+    def _evict_overflow(self, conn):
+        evicted = []
+        if self._max_entries is not None:
+            evicted += self._delete(
+                conn,
+                "key IN (SELECT key FROM response_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                [(self._max_entries,)],
+            )
+        if self._max_bytes is not None:
+            (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()
+            if total <= self._max_bytes:
+                return evicted
+            overflow = []
+            for key, size in conn.execute("SELECT key, size FROM response_cache ORDER BY accessed ASC"):
+                if total <= self._max_bytes:
+                    break
+                overflow.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM response_cache WHERE key = ?", overflow)
+            evicted += [self._key(key) for (key,) in overflow if key.startswith(self._prefix)]
+        return evicted
+
+    def _get_current_time(self):
+        """
+        Helper function to get current time
+
+        Returns:
+            float: value representing the number of seconds since the epoch
+        """
+        return time.time()
@@ -0,0 +1,148 @@
+import logging
+import re
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+# Counters kept for each endpoint
+CACHE_EVENTS = (
+    "hits",  # served from a fresh entry
+    "misses",  # no fresh entry, the request was sent
+    "stale_hits",  # expired entry served while it is refreshed in the background
+    "revalidations",  # expired entry reused after a 304 Not Modified
+    "coalesced",  # response shared with an identical GET already in flight
+    "stores",  # responses added to the cache
+    "stored_bytes",  # estimated size of the responses added to the cache
+    "invalidations",  # entries removed because a mutation made them stale
+    "evictions",  # entries removed to respect maxEntries/maxBytes
+    "expirations",  # entries removed once their TTL/TTI (and stale TTL) passed
+)
+
+# Path segments identifying a single resource: numeric IDs, UUIDs and long hex IDs
+_ID_SEGMENT = re.compile(r"\d+|[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}|(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{16,}")
+
+
+def endpoint_template(path):
+    """
+    Replaces the resource IDs of a path with ``{id}``, so counters of one endpoint are grouped.
+
+    Example:
+        >>> endpoint_template("/zpa/mgmtconfig/v1/admin/customers/7205/application/2161")
+        '/zpa/mgmtconfig/v1/admin/customers/{id}/application/{id}'
+    """
+    segments = path.split("?", 1)[0].split("/")
+    return "/".join("{id}" if _ID_SEGMENT.fullmatch(segment) else segment for segment in segments)
+
+
+def key_path(key):
+    """Returns the path of a cache key, made of the host, path and query of the request URL."""
+    path = key.split("?", 1)[0]
+    if "://" in path:
+        path = path.split("://", 1)[1]
+    return "/" + path.split("/", 1)[1] if "/" in path else "/"
+
+
+class CacheStats:
+    """
+    Thread-safe counters of response cache activity, by service type and endpoint template.
+
+    The request executor records hits and misses; caches record the entries they
+    evict, expire or invalidate through :meth:`record_key`. Metric hooks are called
+    with ``(event, service_type, endpoint, value)`` for every recorded event, on the
+    thread recording it, so they must be fast. Hook errors are logged and ignored.
+
+    Args:
+        classify (callable, optional): Maps a cache key to its ``(service_type, endpoint)``.
+            Defaults to ``("unknown", endpoint_template(path))``.
+
+    Example:
+        >>> stats = client.cache_stats()
+        >>> stats["hit_ratio"], stats["services"]["zia"]["/zia/api/v1/locations"]["hits"]
+    """
+
+    def __init__(self, classify=None):
+        self._classify = classify or (lambda key: ("unknown", endpoint_template(key_path(key))))
+        self._counters = defaultdict(lambda: dict.fromkeys(CACHE_EVENTS, 0))
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """
+        Registers a metric hook.
+
+        Args:
+            hook (callable): Called with ``(event, service_type, endpoint, value)``.
+        """
+        with self._lock:
+            self._hooks = self._hooks + [hook]
+
+    def record(self, event, service_type, endpoint, value=1):
+        """
+        Adds ``value`` to the ``event`` counter of an endpoint.
+
+        Args:
+            event (str): One of :data:`CACHE_EVENTS`.
+            service_type (str): Service of the request (zia, zpa, ...).
+            endpoint (str): Endpoint template, see :func:`endpoint_template`.
+            value (int, optional): Amount to add.
+        """
+        with self._lock:
+            self._counters[(service_type or "unknown", endpoint)][event] += value
+            hooks = self._hooks
+        for hook in hooks:
+            try:
+                hook(event, service_type, endpoint, value)
+            except Exception as e:
+                logger.warning(f"Cache metric hook {hook!r} failed: {e}")
+
+    def record_key(self, event, key, value=1):
+        """Adds ``value`` to the ``event`` counter of the endpoint a cache key belongs to."""
+        service_type, endpoint = self._classify(key)
+        self.record(event, service_type, endpoint, value)
+
+    def snapshot(self, cache=None):
+        """
+        Returns the counters as plain dictionaries.
+
+        Args:
+            cache (Cache, optional): Cache whose number of entries (``len``) and
+                size (``size_bytes``) are reported, when it provides them.
+
+        Returns:
+            dict: Totals of every event, ``hit_ratio``, ``entries``, ``bytes``, and the
+            counters of each endpoint under ``services[service_type][endpoint]``.
+        """
+        with self._lock:
+            counters = {labels: dict(values) for labels, values in self._counters.items()}
+
+        totals = dict.fromkeys(CACHE_EVENTS, 0)
+        services = {}
+        for (service_type, endpoint), values in sorted(counters.items()):
+            services.setdefault(service_type, {})[endpoint] = values
+            for event, value in values.items():
+                totals[event] += value
+
+        # Revalidations are counted as misses too: a (conditional) request was sent
+        served = totals["hits"] + totals["stale_hits"] + totals["coalesced"]
+        lookups = served + totals["misses"]
+        totals["hit_ratio"] = served / lookups if lookups else 0.0
+        totals["entries"] = _cache_size(cache, len)
+        totals["bytes"] = _cache_size(cache, lambda c: c.size_bytes)
+        totals["services"] = services
+        return totals
+
+    def reset(self):
+        """Resets every counter to zero."""
+        with self._lock:
+            self._counters.clear()
+
+
+def _cache_size(cache, measure):
+    if cache is None:
+        return None
+    try:
+        return measure(cache)
+    except Exception:
+        # Custom caches need not report their size
+        return None
@@ -1,8 +1,9 @@
 import logging
+import threading
 import time
-from urllib.parse import urlparse
 
 from zscaler.cache.cache import Cache
+from zscaler.cache.path_index import PathIndex
 
 logger = logging.getLogger("zscaler-sdk-python")
 
@@ -25,6 +26,10 @@ class ZscalerCache(Cache):
         self._store = {}  # key -> {value, TTI, TTL}
         self._time_to_live = ttl
         self._time_to_idle = tti
+        # Cached keys by URL path, to invalidate the entries related to a mutation
+        self._index = PathIndex()
+        # Guards the store against concurrent access from worker threads
+        self._lock = threading.RLock()
 
     def get(self, key):
         """
@@ -38,20 +43,21 @@ class ZscalerCache(Cache):
             None -- Unable to find value for this key
         """
         logger.debug(f'Attempting to retrieve key "{key}" from cache.')
-        # Get current time
-        now = self._get_current_time()
-        # Check if key is in cache and valid
-        if self.contains(key):
-            entry = self._store[key]
-            # Reset TTI
-            entry["tti"] = now + self._time_to_idle
-            # Return desired value and update cache
+        with self._lock:
+            # Get current time
+            now = self._get_current_time()
+            # Check if key is in cache and valid
+            if self.contains(key):
+                entry = self._store[key]
+                # Reset TTI
+                entry["tti"] = now + entry.get("idle", self._time_to_idle)
+                # Return desired value and update cache
+                self._clean_cache()
+                logger.debug(f'Cached value for key {key}: {entry["value"]}')
+                return entry["value"]
+
+            # Return None if key isn't in cache and update cache
             self._clean_cache()
-            logger.debug(f'Cached value for key {key}: {entry["value"]}')
-            return entry["value"]
-
-        # Return None if key isn't in cache and update cache
-        self._clean_cache()
         logger.warning(f'Key "{key}" not found in cache.')
         return None
 
@@ -65,29 +71,54 @@ class ZscalerCache(Cache):
         Returns:
             bool -- Existence of key in cache
         """
-        return key in self._store and self._is_valid_entry(self._store[key])
+        with self._lock:
+            return key in self._store and self._is_valid_entry(self._store[key])
+
+    def get_stale(self, key):
+        """
+        Retrieves a value whose TTL or TTI passed but which is still retained for revalidation
+
+        Arguments:
+            key {str} -- Desired key
+
+        Returns:
+            Corresponding value to given key, or None if it is missing, fresh or no longer retained
+        """
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None or self._is_valid_entry(entry) or not self._is_retained_entry(entry):
+                return None
+            return entry["value"]
 
-    def add(self, key: str, value: tuple):
+    def add(self, key: str, value: tuple, ttl: float = None, tti: float = None, stale_ttl: float = 0):
         """
         Adds a key-value pair to the cache.
 
         Arguments:
             key {str} -- Key in pair
             value {tuple} -- Tuple of response and response body
+            ttl {float} -- Time to live of this entry. Defaults to the cache TTL.
+            tti {float} -- Time to idle of this entry. Defaults to the cache TTI.
+            stale_ttl {float} -- Seconds the entry is retained for revalidation once expired
         """
         logger.debug(f'Attempting to add key "{key}" to cache with value: {value}.')
-        # Update cache
-        self._clean_cache()
         if isinstance(key, str) and (not isinstance(value, list) or not isinstance(value[1], list)):
-            # Get current time
-            now = self._get_current_time()
-
-            # Add new entry to cache with timers
-            self._store[key] = {
-                "value": value,
-                "tti": now + self._time_to_idle,
-                "ttl": now + self._time_to_live,
-            }
+            with self._lock:
+                # Update cache
+                self._clean_cache()
+                # Get current time
+                now = self._get_current_time()
+
+                # Add new entry to cache with timers
+                time_to_idle = self._time_to_idle if tti is None else tti
+                self._store[key] = {
+                    "value": value,
+                    "tti": now + time_to_idle,
+                    "ttl": now + (self._time_to_live if ttl is None else ttl),
+                    "idle": time_to_idle,
+                    "stale": stale_ttl,
+                }
+                self._index.add(key)
             logger.info(f'Successfully added key "{key}" to cache.')
             logger.debug(f"Cached value for key {key}: {value}.")
         else:
@@ -101,46 +132,68 @@ class ZscalerCache(Cache):
             key {str} -- Desired key
         """
         logger.debug(f'Attempting to delete key "{key}" from cache.')
-        # Make sure key is in cache
-        if key in self._store:
-            # Delete entry
-            del self._store[key]
-            logger.info(f'Successfully deleted key "{key}" from cache.')
-        else:
-            logger.warning(f'Key "{key}" not found in cache. Nothing to delete.')
-        url_object = urlparse(key)
-        base_url = f"{url_object.netloc}{url_object.path}"
-        for other_key in self._store.keys():
-            other_url_object = urlparse(other_key)
-            other_base_url = f"{other_url_object.netloc}{other_url_object.path}"
-            if not self._is_valid_entry(self._store[other_key]) and other_base_url.startswith(base_url):
-                del self._store[other_key]
-                logger.info(f'Removed also value from cache for key "{other_key}".')
+        with self._lock:
+            # Make sure key is in cache
+            if key in self._store:
+                # Delete entry
+                del self._store[key]
+                self._index.discard(key)
+                logger.info(f'Successfully deleted key "{key}" from cache.')
+            else:
+                logger.warning(f'Key "{key}" not found in cache. Nothing to delete.')
+
+    def invalidate(self, key):
+        """
+        Delete the entries made stale by a mutation of the resource at key: the resource
+        and its query variants, its sub-resources, and the collections above it.
+
+        Arguments:
+            key {str} -- Key of the mutated resource
+        """
+        logger.debug(f'Attempting to invalidate cache entries related to key "{key}".')
+        with self._lock:
+            related = self._index.related(key)
+            for related_key in related:
+                self._store.pop(related_key, None)
+                self._index.discard(related_key)
+        if related:
+            logger.info(f"Invalidated keys from cache: {related}")
+        for related_key in related:
+            self._record("invalidations", related_key)
 
     def clear(self):
         """
         Clear the cache.
         """
         logger.debug("Attempting to clear the entire cache.")
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+            self._index.clear()
         logger.info("Cache cleared successfully.")
 
+    def __len__(self):
+        return len(self._store)
+
     def _clean_cache(self):
         """
         Updates cache by removing expired entries at time of call
         """
         logger.debug("Cleaning cache by removing expired entries.")
         expired = []
-        # Check every entry
-        for key in self._store.keys():
-            # If not valid, delete
-            if not self._is_valid_entry(self._store[key]):
-                expired.append(key)
-        # Delete keys
-        for expired_key in expired:
-            self.delete(expired_key)
+        with self._lock:
+            # Check every entry
+            for key in self._store.keys():
+                # If no longer retained, delete
+                if not self._is_retained_entry(self._store[key]):
+                    expired.append(key)
+            # Delete keys
+            for expired_key in expired:
+                if expired_key in self._store:
+                    self.delete(expired_key)
         if expired:
             logger.info(f"Removed expired keys from cache: {expired}")
+            for expired_key in expired:
+                self._record("expirations", expired_key)
         else:
             logger.debug("No expired entries found during cache cleaning.")
 
@@ -161,6 +214,21 @@ class ZscalerCache(Cache):
         timers = [entry["tti"], entry["ttl"]]
         return not any(timer <= now for timer in timers)
 
+    def _is_retained_entry(self, entry):
+        """
+        Determines if a given cache entry is fresh, or expired less than its stale TTL ago.
+
+        Args:
+            entry (dict): An entry from the cache composed of value,
+            TTI, TTL and stale TTL
+
+        Returns:
+            bool: Boolean value representing if entry must be kept
+        """
+        now = self._get_current_time()
+        stale_ttl = entry.get("stale", 0)
+        return not any(timer + stale_ttl <= now for timer in (entry["tti"], entry["ttl"]))
+
     def _get_current_time(self):
         """
         Helper function to get current time
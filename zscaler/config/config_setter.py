@@ -31,16 +31,35 @@ class ConfigSetter:
             "sandboxCloud": "",
             "connectionTimeout": 30,
             "requestTimeout": 0,
+            "maxConcurrency": 10,
+            "tokenRefreshMargin": 60,
+            "tokenStore": {"path": "", "key": ""},
+            "jsonCodec": "auto",
+            "connectionPool": {
+                "hosts": 10,
+                "maxSize": 10,
+                "block": False,
+                "keepAlive": True,
+                "idleTimeout": 0,
+            },
             "cache": {
                 "enabled": False,
                 "defaultTtl": "",
                 "defaultTti": "",
+                "backend": "memory",
+                "path": "",
+                "maxEntries": "",
+                "maxBytes": "",
+                "revalidateTtl": 300,
+                "negativeTtl": 0,
             },
             "logging": {"enabled": False, "verbose": False},
             "proxy": {"port": "", "host": "", "username": "", "password": ""},
             "rateLimit": {
                 "maxRetries": 2,
                 "maxRetrySeconds": "",
+                "pacing": True,
+                "sharedStore": "",
             },
             "testing": {"disableHttpsCheck": ""},
         }
@@ -131,12 +150,33 @@ class ConfigSetter:
 
         # Set default values for 'client' and 'testing' configurations
         self._config["client"]["connectionTimeout"] = 30
-        self._config["client"]["cache"] = {"enabled": False, "defaultTtl": 300, "defaultTti": 300}
+        self._config["client"]["cache"] = {
+            "enabled": False,
+            "defaultTtl": 300,
+            "defaultTti": 300,
+            "backend": "memory",
+            "path": "",
+            "maxEntries": "",
+            "maxBytes": "",
+            "revalidateTtl": 300,
+            "negativeTtl": 0,
+        }
         self._config["client"]["logging"] = {"enabled": False, "logLevel": logging.INFO}
 
         self._config["client"]["userAgent"] = ""
         self._config["client"]["requestTimeout"] = 0
-        self._config["client"]["rateLimit"] = {"maxRetries": 2}
+        self._config["client"]["maxConcurrency"] = 10
+        self._config["client"]["tokenRefreshMargin"] = 60
+        self._config["client"]["tokenStore"] = {"path": "", "key": ""}
+        self._config["client"]["jsonCodec"] = "auto"
+        self._config["client"]["connectionPool"] = {
+            "hosts": 10,
+            "maxSize": 10,
+            "block": False,
+            "keepAlive": True,
+            "idleTimeout": 0,
+        }
+        self._config["client"]["rateLimit"] = {"maxRetries": 2, "pacing": True}
 
         # Add a check for the 'testing' key before accessing it
         if "testing" not in self._config:
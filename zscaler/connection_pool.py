@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAX_SIZE = 10
+
+
+def _to_bool(value: Any) -> bool:
+    """Booleans coming from environment variables arrive as strings."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+class ConnectionPool:
+    """
+    Owns a persistent, pooled ``requests.Session`` shared by every request of a client.
+
+    The pool is sized from the ``connectionPool`` block of the client
+    configuration:
+
+    * ``hosts``: number of per-host pools kept open (default 10).
+    * ``maxSize``: maximum number of connections kept per host (default 10).
+    * ``block``: wait for a free connection instead of opening an extra one.
+    * ``keepAlive``: keep connections open between requests (default True).
+    * ``idleTimeout``: seconds of inactivity after which the session is recycled.
+
+    The session is opened lazily on first use, so callers get connection reuse
+    without having to enter a context manager.
+    """
+
+    def __init__(self, pool_config: Optional[Dict[str, Any]] = None) -> None:
+        pool_config = pool_config or {}
+        self.hosts: int = int(pool_config.get("hosts") or DEFAULT_POOL_CONNECTIONS)
+        self.max_size: int = int(pool_config.get("maxSize") or DEFAULT_POOL_MAX_SIZE)
+        self.block: bool = _to_bool(pool_config.get("block", False))
+        self.keep_alive: bool = _to_bool(pool_config.get("keepAlive", True))
+        idle_timeout = pool_config.get("idleTimeout")
+        self.idle_timeout: Optional[float] = float(idle_timeout) if idle_timeout and float(idle_timeout) > 0 else None
+
+        self._session: Optional[requests.Session] = None
+        self._owns_session: bool = False
+        self._last_used: float = 0.0
+        self._lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.hosts, pool_maxsize=self.max_size, pool_block=self.block)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        logger.debug(
+            f"Opened HTTP connection pool (hosts={self.hosts}, maxSize={self.max_size}, "
+            f"block={self.block}, keepAlive={self.keep_alive})."
+        )
+        return session
+
+    def get_session(self) -> requests.Session:
+        """
+        Returns the pooled session, opening it on first use.
+
+        Sessions owned by the pool are replaced once they have been idle for
+        longer than ``idleTimeout`` so stale keep-alive sockets are not reused.
+        Sessions provided through :meth:`set_session` are never recycled.
+
+        Returns:
+            requests.Session: The session to send requests with.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._session is not None and self._owns_session and self.idle_timeout:
+                if now - self._last_used > self.idle_timeout:
+                    logger.debug("HTTP connection pool idle timeout reached, recycling session.")
+                    # Requests still in flight may use the old session: drop it rather than
+                    # closing it under them; its sockets are closed once it is garbage collected
+                    self._session = None
+
+            if self._session is None:
+                self._session = self._build_session()
+                self._owns_session = True
+
+            self._last_used = now
+            return self._session
+
+    def set_session(self, session: requests.Session) -> None:
+        """
+        Replaces the pooled session with a caller managed one.
+
+        Args:
+            session (requests.Session): Session to use for all further requests.
+        """
+        with self._lock:
+            if self._session is not None and self._owns_session and self._session is not session:
+                self._session.close()
+            self._session = session
+            self._owns_session = False
+            self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        """Closes the session and releases its connections. The next request opens a new pool."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._owns_session = False
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """The current session, or None when the pool is closed."""
+        return self._session
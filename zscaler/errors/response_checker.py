@@ -5,12 +5,13 @@ from zscaler.errors.graphql_error import GraphQLAPIError, is_graphql_error_respo
 from zscaler.errors.http_error import HTTPError
 from zscaler.errors.zscaler_api_error import ZscalerAPIError
 from zscaler.exceptions import HTTPException, ZscalerAPIException, exceptions
+from zscaler.json_codec import default_codec
 
 logger = logging.getLogger(__name__)
 
 
 # @staticmethod
-def check_response_for_error(url, response_details, response_body, service_type: str = ""):
+def check_response_for_error(url, response_details, response_body, service_type: str = "", json_codec=None, parsed_body=None):
     """
     Checks HTTP response for errors in the response body.
 
@@ -19,6 +20,8 @@ def check_response_for_error(url, response_details, response_body, service_type:
         response_details (requests.Response): Response object with details
         response_body (str): Response body in JSON or plain string
         service_type (str): The service type (e.g., 'zins' for GraphQL)
+        json_codec (JSONCodec, optional): Codec decoding JSON bodies. Defaults to the process default codec.
+        parsed_body (dict or list, optional): The already decoded response body, if available.
 
     Returns:
         Tuple(dict or None, error or None)
@@ -33,7 +36,10 @@ def check_response_for_error(url, response_details, response_body, service_type:
     body_text = response_body if isinstance(response_body, str) else str(response_body)
 
     try:
-        formatted_response = json.loads(response_body) if is_json else response_body
+        if parsed_body is not None:
+            formatted_response = parsed_body
+        else:
+            formatted_response = (json_codec or default_codec).loads(response_body) if is_json else response_body
     except json.JSONDecodeError:
         logger.warning(f"Non-JSON response from {url}: {body_text}")
         if exceptions.raise_exception:
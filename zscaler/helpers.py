@@ -4,8 +4,14 @@ Module is independent from any zscaler modules.
 """
 
 import re
+from functools import lru_cache
 
+# Key conversions run for every key of every item of a response, over a small
+# set of distinct keys, so their results are memoized.
+KEY_CONVERSION_CACHE_SIZE = 8192
 
+
+@lru_cache(maxsize=KEY_CONVERSION_CACHE_SIZE)
 def to_snake_case(string):
     """
     Converts camelCase or PascalCase to snake_case.
@@ -159,6 +165,7 @@ def to_snake_case(string):
     return string.replace("__", "_").strip("_")
 
 
+@lru_cache(maxsize=KEY_CONVERSION_CACHE_SIZE)
 def to_lower_camel_case(string):
     """
     Converts snake_case to camelCase with support for known edge-case field mappings.
@@ -0,0 +1,99 @@
+import json
+import logging
+from typing import Any, Optional, Union
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Types the stdlib encodes differently (or not at all) are passed through to it
+_ORJSON_DUMPS_OPTIONS = (
+    (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+    if orjson is not None
+    else 0
+)
+
+
+class JSONCodec:
+    """
+    Stdlib JSON codec. Bodies are encoded exactly like ``requests`` does for ``json=``.
+
+    Custom codecs should inherit from this class and override :meth:`loads`
+    and :meth:`dumps`.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjson backed codec. Documents orjson does not support (integers wider than
+    64 bits, NaN, non-serializable keys) fall back to the stdlib codec.
+
+    Decoding yields the same values as :class:`JSONCodec`. Encoded bodies are the
+    same JSON document but not the same bytes: orjson writes no whitespace and
+    may format floats differently. Datetimes, dataclasses and subclasses of
+    builtin types go through the stdlib, so they raise ``TypeError`` (or encode)
+    exactly as with :class:`JSONCodec`; NaN and infinities still encode to
+    ``null`` where the stdlib raises ``ValueError``.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("The 'orjson' JSON codec requires the orjson package: pip install orjson")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_DUMPS_OPTIONS)
+        except TypeError:
+            return super().dumps(obj)
+
+
+JSON_CODECS = {"json": JSONCodec, "orjson": OrjsonCodec}
+
+
+def get_json_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Resolves the ``jsonCodec`` client setting.
+
+    Args:
+        codec (str or JSONCodec, optional): ``"auto"`` (default) picks orjson when it is
+            installed and the stdlib otherwise; ``"orjson"`` and ``"json"`` force a backend.
+            A :class:`JSONCodec` instance is used as is.
+
+    Returns:
+        JSONCodec: The codec.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    name = str(codec or "auto").strip().lower()
+    if name == "auto":
+        return OrjsonCodec() if orjson is not None else JSONCodec()
+    if name not in JSON_CODECS:
+        raise ValueError(f"Invalid JSON codec: {codec}. Must be one of: auto, {', '.join(JSON_CODECS)}.")
+    return JSON_CODECS[name]()
+
+
+default_codec = get_json_codec()
@@ -0,0 +1,197 @@
+import inspect
+import logging
+from typing import Any, Dict, Optional
+
+from zscaler.async_request_executor import AsyncRequestExecutor
+from zscaler.oneapi_client import Client
+
+logger = logging.getLogger(__name__)
+
+# Attribute values that are returned as-is by the async proxies instead of being wrapped.
+_PLAIN_TYPES = (str, bytes, int, float, bool, dict, list, tuple, set, type(None))
+
+
+class AsyncServiceProxy:
+    """
+    Wraps a synchronous service or API object so its methods become awaitable.
+
+    Attribute access is delegated to the wrapped object: bound methods are
+    returned as coroutine functions scheduled on the :class:`AsyncRequestExecutor`
+    worker pool, nested service/API objects are wrapped again and plain values
+    are returned untouched.
+
+    Example:
+        >>> users, resp, err = await async_client.zia.user_management.list_users()
+    """
+
+    def __init__(self, target: Any, executor: AsyncRequestExecutor) -> None:
+        self._target = target
+        self._executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+
+        if isinstance(attr, _PLAIN_TYPES):
+            return attr
+
+        if inspect.ismethod(attr) or inspect.isfunction(attr):
+
+            async def _call(*args: Any, **kwargs: Any) -> Any:
+                return await self._executor.run(attr, *args, **kwargs)
+
+            _call.__name__ = getattr(attr, "__name__", name)
+            _call.__doc__ = getattr(attr, "__doc__", None)
+            return _call
+
+        return AsyncServiceProxy(attr, self._executor)
+
+    def __dir__(self):
+        return dir(self._target)
+
+    def __repr__(self) -> str:
+        return f"<AsyncServiceProxy for {self._target!r}>"
+
+
+class AsyncClient:
+    """
+    An asyncio-friendly Zscaler client.
+
+    Every service exposed by :class:`zscaler.oneapi_client.Client` is available
+    under the same name, with awaitable API methods. All calls share a single
+    :class:`AsyncRequestExecutor`, so the configured ``maxConcurrency`` is the
+    in-flight budget for the whole client, whatever the number of scheduled
+    coroutines.
+
+    Example:
+        >>> async with AsyncClient(config) as client:
+        ...     results = await asyncio.gather(
+        ...         client.zia.user_management.list_users(),
+        ...         client.zpa.segment_groups.list_groups(),
+        ...         client.zdx.devices.list_devices(),
+        ...     )
+    """
+
+    def __init__(
+        self,
+        user_config: Dict[str, Any] = {},
+        max_concurrency: Optional[int] = None,
+        client: Optional[Client] = None,
+    ) -> None:
+        """
+        Constructor for the AsyncClient.
+
+        Args:
+            user_config (dict): Same configuration accepted by :class:`Client`.
+            max_concurrency (int, optional): Maximum number of in-flight requests.
+                Defaults to ``maxConcurrency`` from the client configuration.
+            client (Client, optional): An existing (OneAPI or legacy) client to wrap
+                instead of building a new one from ``user_config``.
+        """
+        self._client = client or Client(user_config)
+        config = self._client.get_config() or {}
+        if max_concurrency is None:
+            max_concurrency = config.get("client", {}).get("maxConcurrency")
+
+        self._async_request_executor = AsyncRequestExecutor(self._client.get_request_executor(), max_concurrency)
+        self._services: Dict[str, AsyncServiceProxy] = {}
+
+    def _service(self, name: str) -> AsyncServiceProxy:
+        if name not in self._services:
+            self._services[name] = AsyncServiceProxy(getattr(self._client, name), self._async_request_executor)
+        return self._services[name]
+
+    @property
+    def zcc(self) -> AsyncServiceProxy:
+        return self._service("zcc")
+
+    @property
+    def zdx(self) -> AsyncServiceProxy:
+        return self._service("zdx")
+
+    @property
+    def zia(self) -> AsyncServiceProxy:
+        return self._service("zia")
+
+    @property
+    def zcell(self) -> AsyncServiceProxy:
+        return self._service("zcell")
+
+    @property
+    def zwa(self) -> AsyncServiceProxy:
+        return self._service("zwa")
+
+    @property
+    def ztb(self) -> AsyncServiceProxy:
+        return self._service("ztb")
+
+    @property
+    def ztw(self) -> AsyncServiceProxy:
+        return self._service("ztw")
+
+    @property
+    def zpa(self) -> AsyncServiceProxy:
+        return self._service("zpa")
+
+    @property
+    def zid(self) -> AsyncServiceProxy:
+        return self._service("zid")
+
+    @property
+    def zidentity(self) -> AsyncServiceProxy:
+        """Alias for zid property (backward compatibility)."""
+        return self.zid
+
+    @property
+    def zbi(self) -> AsyncServiceProxy:
+        return self._service("zbi")
+
+    @property
+    def zeasm(self) -> AsyncServiceProxy:
+        return self._service("zeasm")
+
+    @property
+    def aiguard(self) -> AsyncServiceProxy:
+        return self._service("aiguard")
+
+    @property
+    def zins(self) -> AsyncServiceProxy:
+        return self._service("zins")
+
+    @property
+    def zms(self) -> AsyncServiceProxy:
+        return self._service("zms")
+
+    async def __aenter__(self) -> "AsyncClient":
+        await self._async_request_executor.run(self._client.__enter__)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            await self._async_request_executor.run(self._client.__exit__, exc_type, exc_val, exc_tb)
+        finally:
+            self._async_request_executor.close()
+
+    """
+    Getters
+    """
+
+    def get_client(self) -> Client:
+        return self._client
+
+    def get_config(self) -> Dict[str, Any]:
+        return self._client.get_config()
+
+    def get_request_executor(self) -> AsyncRequestExecutor:
+        return self._async_request_executor
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Returns the response cache statistics, see :meth:`Client.cache_stats`."""
+        return self._client.cache_stats()
+
+    def add_cache_stats_hook(self, hook) -> None:
+        """Registers a response cache metric hook, see :meth:`Client.add_cache_stats_hook`."""
+        self._client.add_cache_stats_hook(hook)
+
+    def close(self) -> None:
+        """Releases the worker pool. Only needed when not using ``async with``."""
+        self._async_request_executor.close()
@@ -2,12 +2,10 @@ import logging
 import os
 from typing import Any, Dict, Optional, TypeVar
 
-import requests
-
 from zscaler.aiguard.aiguard_service import AIGuardService
 from zscaler.aiguard.legacy import LegacyZGuardClientHelper
+from zscaler.cache.backends import cache_namespace, get_cache
 from zscaler.cache.no_op_cache import NoOpCache
-from zscaler.cache.zscaler_cache import ZscalerCache
 from zscaler.config.config_setter import ConfigSetter
 from zscaler.config.config_validator import ConfigValidator
 from zscaler.logger import setup_logging
@@ -200,10 +198,10 @@ class Client:
         cache = NoOpCache()
         if self._config["client"]["cache"]["enabled"]:
             if user_config.get("cacheManager") is None:
-                time_to_idle = self._config["client"]["cache"]["defaultTti"]
-                time_to_live = self._config["client"]["cache"]["defaultTtl"]
-                cache = ZscalerCache(time_to_live, time_to_idle)
-                self.logger.debug(f"Using default cache with TTL: {time_to_live}, TTI: {time_to_idle}")
+                # Responses persisted on disk must not leak between tenants sharing the file
+                namespace = cache_namespace(self._client_id, self._vanity_domain, self._customer_id, self._cloud)
+                cache = get_cache(self._config["client"]["cache"], namespace=namespace)
+                self.logger.debug(f"Using {type(cache).__name__} response cache.")
             else:
                 cache = user_config.get("cacheManager")
                 self.logger.debug("Using custom cache manager.")
@@ -465,12 +463,13 @@ class Client:
 
     def __enter__(self):
         """
-        Automatically create and set session within context manager.
+        Open the HTTP connection pool for the lifetime of the context manager.
+
+        Requests are pooled with or without the context manager; entering it
+        only warms the pool up and guarantees it is released on exit.
         """
         if not self.use_legacy_client:
-            # Create and set up a session using 'requests' library for sync.
-            self._session = requests.Session()
-            self._request_executor.set_session(self._session)
+            self._request_executor.open_session()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -481,11 +480,6 @@ class Client:
         if getattr(self, "aiguard_legacy_client", None) is not None:
             return
 
-        self.logger.debug("Exiting context manager, closing session.")
-        if hasattr(self, "_session"):
-            self._session.close()
-            self.logger.debug("Session closed.")
-
         # Clean up Zscaler authentication session
         if hasattr(self, "_request_executor"):
             # For legacy clients, use their deauthenticate method
@@ -507,6 +501,12 @@ class Client:
                     self._request_executor.deauthenticate(service_type)
                     self.logger.debug(f"Zscaler session deauthenticated for {service_type}.")
 
+            # Release the pooled HTTP connections (OneAPI executor or legacy helper)
+            if hasattr(self._request_executor, "close_session"):
+                self.logger.debug("Exiting context manager, closing session.")
+                self._request_executor.close_session()
+                self.logger.debug("Session closed.")
+
     """
     Getters
     """
@@ -527,6 +527,67 @@ class Client:
     def clear_custom_headers(self):
         self._request_executor.clear_custom_headers()
 
+    def run_many(self, calls, max_concurrency=None):
+        """
+        Runs SDK service calls in parallel, at most ``max_concurrency`` at a time.
+
+        Args:
+            calls (iterable): Callables taking no arguments, typically service
+                methods bound with ``functools.partial``.
+            max_concurrency (int, optional): Maximum number of calls in flight.
+                Defaults to ``maxConcurrency`` from the client configuration.
+
+        Returns:
+            list: The ``(result, response, error)`` tuple of each call, in input order.
+
+        Examples:
+            >>> from functools import partial
+            >>> results = client.run_many(
+            ...     [partial(client.zpa.segment_groups.get_group, group_id) for group_id in group_ids]
+            ... )
+            >>> for group, _, error in results:
+            ...     print(error or group.name)
+        """
+        # Legacy clients keep their RequestExecutor on the legacy helper
+        request_executor = getattr(self._request_executor, "request_executor", self._request_executor)
+        if max_concurrency is None:
+            max_concurrency = self._config.get("client", {}).get("maxConcurrency")
+        return request_executor.run_many(calls, max_concurrency)
+
+    def cache_stats(self):
+        """
+        Returns the response cache statistics, to tune TTL/TTI per endpoint.
+
+        Returns:
+            dict: Totals of ``hits``, ``misses``, ``stale_hits``, ``revalidations``, ``coalesced``,
+            ``stores``, ``stored_bytes``, ``invalidations``, ``evictions`` and ``expirations``,
+            the ``hit_ratio``, the number of ``entries`` and ``bytes`` in the cache (None when the
+            cache doesn't report them), and the same counters under ``services[service][endpoint]``.
+
+        Examples:
+            >>> stats = client.cache_stats()
+            >>> for endpoint, counters in stats["services"].get("zia", {}).items():
+            ...     print(endpoint, counters["hits"], counters["misses"])
+        """
+        request_executor = getattr(self._request_executor, "request_executor", self._request_executor)
+        return request_executor.cache_stats()
+
+    def add_cache_stats_hook(self, hook):
+        """
+        Registers a metric hook called on every response cache event, e.g. to feed Prometheus or StatsD.
+
+        Args:
+            hook (callable): Called with ``(event, service_type, endpoint, value)``. It runs on the
+                thread serving the request and must be fast; its exceptions are logged and ignored.
+
+        Examples:
+            >>> client.add_cache_stats_hook(
+            ...     lambda event, service, endpoint, value: counter.labels(event, service, endpoint).inc(value)
+            ... )
+        """
+        request_executor = getattr(self._request_executor, "request_executor", self._request_executor)
+        request_executor.add_cache_stats_hook(hook)
+
     def _require_legacy_client(self, service_name: str, client: Optional[TLegacy]) -> TLegacy:
         """
         Ensure a legacy client instance is available before returning it.
@@ -577,6 +638,7 @@ class LegacyZPAClient(Client):
             cache=cache,
             fail_safe=fail_safe,
             request_executor_impl=request_executor_impl,
+            connection_pool=config.get("connectionPool"),
         )
         super().__init__(config, zpa_legacy_client=legacy_helper, use_legacy_client=True)
 
@@ -609,6 +671,7 @@ class LegacyZIAClient(Client):
             cache=cache,
             fail_safe=fail_safe,
             request_executor_impl=request_executor_impl,
+            connection_pool=config.get("connectionPool"),
             session_safety_margin=session_safety_margin,
             use_session_validation=use_session_validation,
         )
@@ -640,6 +703,7 @@ class LegacyZTWClient(Client):
             cache=cache,
             fail_safe=fail_safe,
             request_executor_impl=request_executor_impl,
+            connection_pool=config.get("connectionPool"),
         )
         super().__init__(config, ztw_legacy_client=legacy_helper, use_legacy_client=True)
 
@@ -664,6 +728,7 @@ class LegacyZCCClient(Client):
             partner_id=partner_id,
             timeout=timeout,
             request_executor_impl=request_executor_impl,
+            connection_pool=config.get("connectionPool"),
         )
         super().__init__(config, zcc_legacy_client=legacy_helper, use_legacy_client=True)
 
@@ -731,6 +796,7 @@ class LegacyZDXClient(Client):
             partner_id=partner_id,
             timeout=timeout,
             request_executor_impl=request_executor_impl,
+            connection_pool=config.get("connectionPool"),
         )
         super().__init__(config, zdx_legacy_client=legacy_helper, use_legacy_client=True)
 
@@ -754,6 +820,7 @@ class LegacyZWAClient(Client):
             partner_id=partner_id,
             timeout=timeout,
             request_executor_impl=request_executor_impl,
+            connection_pool=config.get("connectionPool"),
         )
         super().__init__(config, zwa_legacy_client=legacy_helper, use_legacy_client=True)
 
@@ -782,5 +849,6 @@ class LegacyZTBClient(Client):
             cache=cache,
             fail_safe=fail_safe,
             request_executor_impl=request_executor_impl,
+            connection_pool=config.get("connectionPool"),
         )
         super().__init__(config, ztb_legacy_client=legacy_helper, use_legacy_client=True)
@@ -6,6 +6,8 @@ from urllib.parse import urlparse
 
 import requests
 
+from zscaler.connection_pool import ConnectionPool
+from zscaler.json_codec import get_json_codec
 from zscaler.logger import dump_request, dump_response
 from zscaler.zcc.legacy import LegacyZCCClientHelper
 from zscaler.zdx.legacy import LegacyZDXClientHelper
@@ -76,19 +78,34 @@ class HTTPClient:
         else:
             self._ssl_context: Union[bool, Any] = True  # Enable SSL certificate validation by default
 
-        self._session: Optional[requests.Session] = None
+        # Request bodies are encoded with the client JSON codec rather than requests' json=
+        self._json_codec = get_json_codec(http_config.get("jsonCodec"))
+
+        # Persistent connection pool, sized from client.connectionPool
+        self._connection_pool = ConnectionPool(http_config.get("connectionPool"))
+
+    @property
+    def _session(self) -> Optional[requests.Session]:
+        return self._connection_pool.session
+
+    def open_session(self) -> requests.Session:
+        """Opens the connection pool eagerly. Requests open it lazily otherwise."""
+        return self._connection_pool.get_session()
 
     def set_session(self, session: requests.Session) -> None:
         """Set Client Session to improve performance by reusing session.
 
-        Session should be closed manually or within context manager.
+        A session set here replaces the built-in connection pool and should be
+        closed manually or within context manager.
         """
-        self._session = session
+        self._connection_pool.set_session(session)
 
     def close_session(self) -> None:
-        """Closes the session if one was used."""
-        if self._session:
-            self._session.close()
+        """Closes the session and releases its pooled connections.
+
+        The next request opens a new connection pool.
+        """
+        self._connection_pool.close()
 
     def send_request(self, request: Dict[str, Any]) -> Tuple[Optional[requests.Response], Optional[Exception]]:
         try:
@@ -111,7 +128,10 @@ class HTTPClient:
 
             # Handle payload
             if "json" in request:
-                params["json"] = request["json"]
+                if request["json"] is not None:
+                    params["data"] = self._json_codec.dumps(request["json"])
+                    if not any(key.lower() == "content-type" for key in params["headers"]):
+                        params["headers"] = {**params["headers"], "Content-Type": "application/json"}
             elif "data" in request:
                 params["data"] = request["data"]
             elif "form" in request:
@@ -316,13 +336,8 @@ class HTTPClient:
                 )
 
             else:
-                # Standard session
-                if self._session:
-                    logger.debug("Request with re-usable session.")
-                    response = self._session.request(**params)
-                else:
-                    logger.debug("Request without re-usable session.")
-                    response = requests.request(**params)
+                # Standard session, always backed by the connection pool
+                response = self._connection_pool.get_session().request(**params)
 
             if response is None:
                 logger.error("Request execution failed. Response is None.")
@@ -332,7 +347,7 @@ class HTTPClient:
                 logger,
                 params["url"],
                 params["method"],
-                params.get("json"),
+                request.get("json"),
                 params.get("params"),
                 params.get("headers"),
                 request["uuid"],
@@ -1,15 +1,18 @@
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from zscaler.request_executor import RequestExecutor
 import json
 import os
+import threading
 import time
+import weakref
 
 # JWT handling - using PyJWT instead of python-jose to avoid ecdsa dependency (CVE-2024-23342)
 import jwt as pyjwt
 import requests
+from cryptography.fernet import Fernet
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
@@ -17,6 +20,8 @@ from jwcrypto.jwk import JWK
 
 from zscaler.constants import ONEAPI_GOV_AUTH_DOMAINS
 from zscaler.errors.response_checker import check_response_for_error
+from zscaler.token_manager import TOKEN_MANAGER, TokenManager, TokenState
+from zscaler.token_store import TokenStore, derive_key
 from zscaler.user_agent import UserAgent
 
 logger = logging.getLogger(__name__)
@@ -24,6 +29,15 @@ logger = logging.getLogger(__name__)
 # Security constants for key validation
 MIN_RSA_KEY_SIZE: int = 2048  # NIST recommends minimum 2048 bits for RSA keys
 
+# Seconds before expiry at which the access token is renewed in the background
+DEFAULT_TOKEN_REFRESH_MARGIN: float = 60
+# Lifetime of the JWT client assertions signed with the private key
+JWT_ASSERTION_LIFETIME: int = 600
+# A signed assertion is reused until it has fewer seconds than this left
+JWT_ASSERTION_MIN_VALIDITY: int = 120
+# Seconds before a failed background renewal is retried
+TOKEN_RENEWAL_RETRY_DELAY: float = 10
+
 
 def validate_rsa_key_strength(private_key_obj: Union[rsa.RSAPrivateKey, Any]) -> Optional[int]:
     """
@@ -57,35 +71,88 @@ def validate_rsa_key_strength(private_key_obj: Union[rsa.RSAPrivateKey, Any]) ->
         return None
 
 
+def _call_if_alive(client_ref: "weakref.ReferenceType[OAuth]", method: str) -> None:
+    """Timer target calling ``method`` on the OAuth client, unless it was garbage collected."""
+    client: Optional["OAuth"] = client_ref()
+    if client is not None:
+        getattr(client, method)()
+
+
 class OAuth:
     """
     This class contains the OAuth actions for the Zscaler Client.
-    """
 
-    _instance: Optional["OAuth"] = None
-    _last_config: Optional[Dict[str, Any]] = None
+    Each client authenticates with its own configuration (credentials, proxy, ...),
+    while the access token lives in the process-wide :class:`TokenManager`, shared
+    by every client of the same tenant.
+    """
 
-    def __new__(cls, request_executor: "RequestExecutor", config: Dict[str, Any]) -> "OAuth":
-        if cls._instance is None or cls._last_config != config:
-            cls._instance = super(OAuth, cls).__new__(cls)
-            cls._last_config = config
-            cls._instance.__init__(request_executor, config)
-        return cls._instance
+    _token_manager: TokenManager = TOKEN_MANAGER
 
     def __init__(self, request_executor: "RequestExecutor", config: Dict[str, Any]) -> None:
-        if not hasattr(self, "_initialized"):
-            self._request_executor: "RequestExecutor" = request_executor
-            self._config: Dict[str, Any] = config
-            self._access_token: Optional[str] = None
-            self._token_expires_at: Optional[float] = None
-            self._token_issued_at: Optional[float] = None
-
-            # Initialize cache based on config
-            self._cache: Optional[Any] = self._initialize_cache()
-            self._cache_key: str = self._generate_cache_key()
-            # No buffer needed - simple expiration check
-            # logging.debug("OAuth instance created with provided configuration.")
-            self._initialized: bool = True
+        self._request_executor: "RequestExecutor" = request_executor
+        self._config: Dict[str, Any] = config
+
+        client_config: Dict[str, Any] = self._config.get("client", {})
+        if "clientId" in client_config:
+            self._token_state: TokenState = self._token_manager.get(TokenManager.tenant_key(client_config))
+        else:
+            # Legacy configurations don't use OAuth tokens
+            self._token_state = TokenState()
+
+        # Ahead of expiry, a timer renews the token so requests never wait on authentication
+        margin: Any = client_config.get("tokenRefreshMargin")
+        self._token_refresh_margin: float = float(DEFAULT_TOKEN_REFRESH_MARGIN if margin in (None, "") else margin)
+
+        # Parsed private key and last signed JWT assertion, reused across token requests
+        self._private_key_cache: Optional[Tuple[Any, Any]] = None
+        self._assertion_cache: Optional[Tuple[Any, str, int, str]] = None
+        self._presign_timer: Optional[threading.Timer] = None
+
+        # Initialize cache based on config
+        self._cache: Optional[Any] = self._initialize_cache()
+        self._cache_key: str = self._generate_cache_key()
+
+        # Optional encrypted on-disk token store, letting new processes reuse a valid token
+        self._token_store: Optional[TokenStore] = None
+        self._token_store_key: Optional[bytes] = None
+        store_config: Dict[str, Any] = client_config.get("tokenStore") or {}
+        if store_config.get("path") and "clientId" in client_config:
+            self._token_store_key = self._token_store_encryption_key(store_config.get("key"))
+            if self._token_store_key is not None:
+                self._token_store = TokenStore(store_config["path"])
+
+    @property
+    def _access_token(self) -> Optional[str]:
+        return self._token_state.access_token
+
+    @_access_token.setter
+    def _access_token(self, value: Optional[str]) -> None:
+        self._token_state.access_token = value
+
+    @property
+    def _token_expires_at(self) -> Optional[float]:
+        return self._token_state.expires_at
+
+    @_token_expires_at.setter
+    def _token_expires_at(self, value: Optional[float]) -> None:
+        self._token_state.expires_at = value
+
+    @property
+    def _token_issued_at(self) -> Optional[float]:
+        return self._token_state.issued_at
+
+    @_token_issued_at.setter
+    def _token_issued_at(self, value: Optional[float]) -> None:
+        self._token_state.issued_at = value
+
+    @property
+    def _token_refresh_at(self) -> Optional[float]:
+        return self._token_state.refresh_at
+
+    @_token_refresh_at.setter
+    def _token_refresh_at(self, value: Optional[float]) -> None:
+        self._token_state.refresh_at = value
 
     def _initialize_cache(self) -> Optional[Any]:
         """
@@ -180,6 +247,57 @@ class OAuth:
         except Exception as e:
             logger.warning(f"Failed to cache token: {e}")
 
+    def _token_store_encryption_key(self, key: Optional[Union[str, bytes]]) -> Optional[bytes]:
+        """
+        Returns the key encrypting tokens in the token store: ``tokenStore.key`` if set,
+        otherwise a key derived from the client secret or private key.
+
+        Raises:
+            ValueError: If ``tokenStore.key`` is not a valid Fernet key.
+        """
+        if key:
+            key = key.encode() if isinstance(key, str) else key
+            Fernet(key)  # Raises ValueError for a malformed key
+            return key
+
+        client_config: Dict[str, Any] = self._config["client"]
+        secret: Union[str, bytes] = client_config.get("clientSecret") or ""
+        private_key: str = client_config.get("privateKey") or ""
+        if private_key:
+            secret = private_key
+            if not private_key.strip().startswith("{") and "BEGIN PRIVATE KEY" not in private_key:
+                try:
+                    with open(private_key, "rb") as key_file:
+                        secret = key_file.read()
+                except OSError as e:
+                    logger.warning(f"Token store disabled, private key unreadable: {e}")
+                    return None
+        if not secret:
+            return None
+        return derive_key(secret, self._cache_key)
+
+    def _get_stored_token(self) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a valid token from the token store, if one is configured.
+
+        Returns:
+            dict: Stored token data or None if not available
+        """
+        if self._token_store is None:
+            return None
+        return self._token_store.get(self._cache_key, self._token_store_key)
+
+    def _store_token(self) -> None:
+        """Save the current token in the token store, if one is configured."""
+        if self._token_store is None or not self._access_token:
+            return
+        token_data: Dict[str, Any] = {
+            "access_token": self._access_token,
+            "expires_at": self._token_expires_at,
+            "issued_at": self._token_issued_at,
+        }
+        self._token_store.add(self._cache_key, token_data, self._token_store_key)
+
     def _cache_enabled(self) -> bool:
         """
         Check if caching is enabled in the configuration.
@@ -340,7 +458,64 @@ class OAuth:
         cloud: str = self._config["client"].get("cloud", "PRODUCTION").lower()
         auth_url: str = self._get_auth_url(vanity_domain, cloud)
 
-        # **Step 1: Determine the Private Key Type**
+        # **Step 1: Load the Private Key (parsed and validated once per key)**
+        private_key_obj: Union[rsa.RSAPrivateKey, Any] = self._load_private_key(private_key)
+
+        # **Step 2: Create JWT for Client Assertion**
+        assertion: str = self._client_assertion(client_id, private_key_obj)
+
+        # **Step 3: Prepare OAuth Request**
+        form_data: Dict[str, str] = {
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_assertion": assertion,
+            "client_assertion_type": "urn:ietf:params:oauth:client-assertion-type:jwt-bearer",
+            "audience": "https://api.zscaler.com",
+        }
+
+        headers: Dict[str, str] = {
+            "Accept": "application/json",
+            "Content-Type": "application/x-www-form-urlencoded",
+            "User-Agent": "Zscaler-SDK",
+        }
+
+        # Setup proxy if configured
+        proxy_config: Optional[Dict[str, Any]] = self._config["client"].get("proxy")
+        proxy_string: Optional[str] = self._setup_proxy(proxy_config)
+        proxies: Optional[Dict[str, str]] = None
+        if proxy_string:
+            proxies = {"http": proxy_string, "https": proxy_string}
+
+        logging.debug(f"Sending authentication request to {auth_url} with JWT.")
+        response: requests.Response = requests.post(auth_url, data=form_data, headers=headers, proxies=proxies)
+
+        if response.status_code >= 300:
+            logging.error(f"Error authenticating: {response.status_code}, {response.text}")
+            raise Exception(f"Error authenticating: {response.status_code}, {response.text}")
+
+        logging.info("Authentication with JWT private key successful.")
+        return response
+
+    def _load_private_key(self, private_key: str) -> Union[rsa.RSAPrivateKey, Any]:
+        """
+        Parses and validates the private key, once: the parsed key is reused until the
+        configured key, or the contents of the key file, change.
+
+        Args:
+            private_key (str): Path to the private key file, JWK JSON string, or raw private key.
+
+        Returns:
+            The parsed private key.
+        """
+        source: Any = private_key
+        is_file: bool = not private_key.strip().startswith("{") and "BEGIN PRIVATE KEY" not in private_key
+        if is_file:
+            key_stat: os.stat_result = os.stat(private_key)
+            source = (private_key, key_stat.st_mtime_ns, key_stat.st_size)
+        cached: Optional[Tuple[Any, Any]] = self._private_key_cache
+        if cached is not None and cached[0] == source:
+            return cached[1]
+
         private_key_obj: Union[rsa.RSAPrivateKey, Any]
         if private_key.strip().startswith("{"):
             # **JWK JSON Format**
@@ -352,7 +527,7 @@ class OAuth:
             pem_bytes = jwk_obj.export_to_pem(private_key=True, password=None)
             private_key_obj = serialization.load_pem_private_key(pem_bytes, password=None, backend=default_backend())
 
-        elif "BEGIN PRIVATE KEY" in private_key:
+        elif not is_file:
             # **Raw PEM Private Key**
             logging.info("Using raw PEM private key.")
             private_key_obj = serialization.load_pem_private_key(
@@ -368,55 +543,67 @@ class OAuth:
         # **Validate key strength to mitigate CWE-326 (Inadequate Encryption Strength)**
         validate_rsa_key_strength(private_key_obj)
 
-        # **Step 2: Create JWT for Client Assertion**
+        self._private_key_cache = (source, private_key_obj)
+        return private_key_obj
+
+    def _client_assertion(self, client_id: str, private_key_obj: Union[rsa.RSAPrivateKey, Any]) -> str:
+        """
+        Returns a JWT client assertion signed with the private key. A signed assertion
+        is reused while it has at least ``JWT_ASSERTION_MIN_VALIDITY`` seconds left.
+
+        Args:
+            client_id (str): Client ID, issuer and subject of the assertion.
+            private_key_obj: Parsed private key, see :meth:`_load_private_key`.
+
+        Returns:
+            str: Signed JWT assertion.
+        """
         now: int = int(time.time())
+        cached: Optional[Tuple[Any, str, int, str]] = self._assertion_cache
+        if (
+            cached is not None
+            and cached[0] is private_key_obj
+            and cached[1] == client_id
+            and cached[2] - now >= JWT_ASSERTION_MIN_VALIDITY
+        ):
+            return cached[3]
+
         payload: Dict[str, Union[str, int]] = {
             "iss": client_id,
             "sub": client_id,
             "aud": "https://api.zscaler.com",
-            "exp": now + 600,  # 10 minutes expiration
+            "exp": now + JWT_ASSERTION_LIFETIME,
         }
 
         # **Generate the JWT assertion using the private key**
         # Using PyJWT instead of python-jose to avoid ecdsa dependency (CVE-2024-23342)
         assertion: str = pyjwt.encode(payload, private_key_obj, algorithm="RS256")
+        self._assertion_cache = (private_key_obj, client_id, payload["exp"], assertion)
+        return assertion
 
-        # **Step 3: Prepare OAuth Request**
-        form_data: Dict[str, str] = {
-            "grant_type": "client_credentials",
-            "client_id": client_id,
-            "client_assertion": assertion,
-            "client_assertion_type": "urn:ietf:params:oauth:client-assertion-type:jwt-bearer",
-            "audience": "https://api.zscaler.com",
-        }
-
-        headers: Dict[str, str] = {
-            "Accept": "application/json",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "User-Agent": "Zscaler-SDK",
-        }
-
-        # Setup proxy if configured
-        proxy_config: Optional[Dict[str, Any]] = self._config["client"].get("proxy")
-        proxy_string: Optional[str] = self._setup_proxy(proxy_config)
-        proxies: Optional[Dict[str, str]] = None
-        if proxy_string:
-            proxies = {"http": proxy_string, "https": proxy_string}
-
-        logging.debug(f"Sending authentication request to {auth_url} with JWT.")
-        response: requests.Response = requests.post(auth_url, data=form_data, headers=headers, proxies=proxies)
-
-        if response.status_code >= 300:
-            logging.error(f"Error authenticating: {response.status_code}, {response.text}")
-            raise Exception(f"Error authenticating: {response.status_code}, {response.text}")
-
-        logging.info("Authentication with JWT private key successful.")
-        return response
+    def _presign_client_assertion(self) -> None:
+        """
+        Signs the JWT assertion of the next token request ahead of time, on the
+        renewal timer thread, so that request only waits on the network.
+        """
+        client_config: Dict[str, Any] = self._config.get("client", {})
+        private_key: str = client_config.get("privateKey", "")
+        if not private_key:
+            return
+        try:
+            self._client_assertion(client_config["clientId"], self._load_private_key(private_key))
+        except Exception as e:
+            # The token request reports the error, if it persists
+            logger.debug(f"Could not pre-sign the JWT client assertion: {e}")
 
     def _get_access_token(self) -> Optional[str]:
         """
         Retrieves or generates the OAuth access token for the Zscaler OneAPI Client.
-        Implements proactive token refresh using expires_in with configurable buffer.
+
+        A valid token is returned without locking. Within ``tokenRefreshMargin`` seconds
+        of its expiry it is still returned while it is renewed in the background. Once
+        missing or expired, one thread requests a new token and the others wait for it.
+        Only tokens used since they were issued are renewed in the background.
 
         Returns:
             str: OAuth access token.
@@ -427,22 +614,49 @@ class OAuth:
             logger.warning("OAuth client initialized with legacy configuration - OAuth functionality not available")
             return None
 
-        # 1. Check cache first (if enabled)
-        cached_token: Optional[Dict[str, Any]] = self._get_cached_token()
-        if cached_token and not self._is_token_expired(cached_token):
-            self._access_token = cached_token["access_token"]
-            self._token_expires_at = cached_token["expires_at"]
-            self._token_issued_at = cached_token.get("issued_at", time.time())
-            logger.debug("Using cached access token")
-            return self._access_token
-
-        # 2. Check if current token is about to expire (proactive refresh)
-        if self._access_token and not self._is_token_expired():
-            logger.debug("Using existing access token")
-            return self._access_token
-
-        # 3. Get new token
-        logger.info("Access token expired or not available, requesting new token")
+        state: TokenState = self._token_state
+        access_token: Optional[str] = state.access_token
+        expires_at: Optional[float] = state.expires_at
+        refresh_at: Optional[float] = state.refresh_at
+        now: float = time.time()
+        state.last_used = now
+        if access_token and expires_at and now < expires_at:
+            if refresh_at is not None and now >= refresh_at:
+                self._renew_in_background()
+            return access_token
+
+        with state.lock:
+            # Another thread or client of the same tenant may have refreshed the token while this one waited for the lock
+            if self._access_token and not self._is_token_expired():
+                logger.debug("Using access token refreshed by another thread")
+                return self._access_token
+
+            # Check cache first (if enabled)
+            cached_token: Optional[Dict[str, Any]] = self._get_cached_token()
+            if cached_token and not self._is_token_expired(cached_token):
+                self._set_token(
+                    cached_token["access_token"], cached_token["expires_at"], cached_token.get("issued_at", time.time())
+                )
+                logger.debug("Using cached access token")
+                return self._access_token
+
+            # Then the token store, where another process may have saved a token
+            stored_token: Optional[Dict[str, Any]] = self._get_stored_token()
+            if stored_token and not self._is_token_expired(stored_token):
+                self._set_token(stored_token["access_token"], stored_token["expires_at"], stored_token["issued_at"])
+                logger.debug("Using access token from the token store")
+                return self._access_token
+
+            logger.info("Access token expired or not available, requesting new token")
+            return self._request_access_token()
+
+    def _request_access_token(self) -> Optional[str]:
+        """
+        Authenticates and stores the new access token. Called with the token lock held.
+
+        Returns:
+            str: OAuth access token.
+        """
         try:
             # Call the authenticate function, which now returns the response object
             response: requests.Response = self.authenticate()
@@ -458,13 +672,13 @@ class OAuth:
 
             # Extract access token and expiration from the parsed response
             if isinstance(parsed_response, dict):
-                self._access_token = parsed_response.get("access_token")
                 expires_in: int = parsed_response.get("expires_in", 3600)  # Default to 1 hour
-                self._token_expires_at = time.time() + expires_in
-                self._token_issued_at = time.time()
+                issued_at: float = time.time()
+                self._set_token(parsed_response.get("access_token"), issued_at + expires_in, issued_at)
 
                 # Cache the new token
                 self._cache_token(self._access_token, self._token_expires_at)
+                self._store_token()
 
                 logger.info(f"New access token obtained, expires in {expires_in} seconds")
             else:
@@ -477,6 +691,100 @@ class OAuth:
 
         return self._access_token
 
+    def _set_token(self, access_token: Optional[str], expires_at: float, issued_at: float) -> None:
+        """
+        Stores the access token and schedules its renewal ``tokenRefreshMargin`` seconds
+        before it expires, at most half-way through its lifetime.
+        """
+        self._access_token = access_token
+        self._token_expires_at = expires_at
+        self._token_issued_at = issued_at
+        if self._token_refresh_margin > 0 and access_token:
+            margin: float = min(self._token_refresh_margin, max(expires_at - issued_at, 0) / 2)
+            self._token_refresh_at = expires_at - margin
+            self._schedule_renewal(self._token_refresh_at - time.time())
+        else:
+            self._token_refresh_at = None
+        if access_token and self._config.get("client", {}).get("privateKey"):
+            self._schedule_presign(expires_at)
+
+    def _schedule_presign(self, expires_at: float) -> None:
+        """
+        Schedules signing the assertion of the next token request so it is still valid
+        for ``JWT_ASSERTION_MIN_VALIDITY`` seconds once the token expires.
+        """
+        next_request_at: float = self._token_refresh_at or expires_at
+        presign_at: float = expires_at + JWT_ASSERTION_MIN_VALIDITY - JWT_ASSERTION_LIFETIME
+        if presign_at >= next_request_at:
+            # Short-lived token: the assertion is signed when the token is requested
+            return
+        if self._presign_timer is not None:
+            self._presign_timer.cancel()
+        timer: threading.Timer = threading.Timer(
+            max(presign_at - time.time(), 0), _call_if_alive, args=(weakref.ref(self), "_presign_client_assertion")
+        )
+        timer.name = "zscaler-assertion-presign"
+        timer.daemon = True
+        self._presign_timer = timer
+        timer.start()
+
+    def _schedule_renewal(self, delay: float) -> None:
+        state: TokenState = self._token_state
+        with state.renewal_lock:
+            if state.renewal_timer is not None:
+                state.renewal_timer.cancel()
+            # The timer only holds a weak reference, so it doesn't keep a dropped client alive
+            timer: threading.Timer = threading.Timer(
+                max(delay, 0), _call_if_alive, args=(weakref.ref(self), "_renew_access_token")
+            )
+            timer.name = "zscaler-token-renewal"
+            # Doesn't keep the process alive; an idle client renews on its next request instead
+            timer.daemon = True
+            state.renewal_timer = timer
+            state.renewal_owner = weakref.ref(self)
+            timer.start()
+
+    def _renew_in_background(self) -> None:
+        """Starts a renewal unless one is pending, e.g. when the timer didn't survive a fork."""
+        timer: Optional[threading.Timer] = self._token_state.renewal_timer
+        if timer is None or not timer.is_alive():
+            self._schedule_renewal(0)
+
+    def _renew_access_token(self) -> None:
+        """Renews the access token ahead of its expiry, on the renewal timer thread."""
+        with self._token_state.lock:
+            now: float = time.time()
+            if self._token_refresh_at is None or now < self._token_refresh_at:
+                # Cleared, or already renewed by a request that found the token expired
+                return
+            if self._token_state.last_used < (self._token_issued_at or 0):
+                # Idle since the last renewal: the next request refreshes the token in the foreground
+                logger.debug("Access token unused since it was issued, not renewing it in the background")
+                return
+            # Another process sharing the token store may have renewed it already
+            stored_token: Optional[Dict[str, Any]] = self._get_stored_token()
+            if stored_token and stored_token["expires_at"] > (self._token_expires_at or 0):
+                self._set_token(stored_token["access_token"], stored_token["expires_at"], stored_token["issued_at"])
+                logger.debug("Using access token renewed by another process")
+                return
+            logger.debug("Renewing access token before it expires")
+            try:
+                self._request_access_token()
+            except Exception as e:
+                expires_at: float = self._token_expires_at or now
+                logger.warning(f"Access token renewal failed, retrying in {TOKEN_RENEWAL_RETRY_DELAY}s: {e}")
+                if now + TOKEN_RENEWAL_RETRY_DELAY < expires_at:
+                    self._token_refresh_at = now + TOKEN_RENEWAL_RETRY_DELAY
+                    self._schedule_renewal(TOKEN_RENEWAL_RETRY_DELAY)
+                # Otherwise the next request after expiry authenticates in the foreground
+
+    def close(self) -> None:
+        """Cancels the background renewal of the access token this client scheduled."""
+        self._token_state.cancel_renewal(owner=self)
+        if self._presign_timer is not None:
+            self._presign_timer.cancel()
+            self._presign_timer = None
+
     def _get_auth_url(self, vanity_domain: str, cloud: str) -> str:
         """
         Determines the OAuth2 provider URL based on the vanity domain and cloud.
@@ -500,14 +808,25 @@ class OAuth:
 
         return f"https://{vanity_domain}.zslogin{cloud}.net/oauth2/v1/token"
 
-    def clear_access_token(self) -> None:
+    def clear_access_token(self, rejected_token: Optional[str] = None) -> None:
         """
         Clear the current OAuth access token and remove from cache.
+
+        Args:
+            rejected_token (str, optional): Token the API rejected. When another thread
+                already replaced it, the newer token is kept.
         """
-        logging.info("Clearing the current access token.")
-        self._access_token = None
-        self._token_expires_at = None
-        self._token_issued_at = None
+        with self._token_state.lock:
+            if rejected_token is not None and rejected_token != self._access_token:
+                logger.debug("Rejected access token was already replaced.")
+                return
+            logging.info("Clearing the current access token.")
+            cleared_token: Optional[str] = self._access_token
+            self._access_token = None
+            self._token_expires_at = None
+            self._token_issued_at = None
+            self._token_refresh_at = None
+        self._token_state.cancel_renewal()
 
         # Clear from cache if enabled
         if self._cache and self._cache_enabled():
@@ -517,6 +836,9 @@ class OAuth:
             except Exception as e:
                 logger.warning(f"Failed to clear token from cache: {e}")
 
+        if self._token_store is not None:
+            self._token_store.delete(self._cache_key, rejected_token or cleared_token, self._token_store_key)
+
         self._request_executor._default_headers.pop("Authorization", None)
 
     def get_token_info(self) -> Dict[str, Any]:
@@ -1,16 +1,34 @@
 import json
 import logging
 import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 import jmespath
 import requests
 
+from zscaler.json_codec import JSONCodec, default_codec
+
 if TYPE_CHECKING:
     from zscaler.request_executor import RequestExecutor
 
 logger = logging.getLogger(__name__)
 
+# Services reporting totalPages on the first page, so the remaining pages can be requested ahead
+PREFETCH_SERVICES = ("zpa", "zcell")
+DEFAULT_PREFETCH_CONCURRENCY = 4
+
+
+def _fetch_page_if_alive(
+    response_ref: "weakref.ReferenceType[ZscalerAPIResponse]", page: int
+) -> Tuple[Optional[str], Optional[Exception]]:
+    """Prefetch worker task: fetches ``page`` unless its response was garbage collected."""
+    response: Optional["ZscalerAPIResponse"] = response_ref()
+    if response is None:
+        return None, None
+    return response._fetch_page(page)
+
 
 class ZscalerAPIResponse:
     """
@@ -40,6 +58,8 @@ class ZscalerAPIResponse:
         sort_dir: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
+        parsed_body: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        json_codec: Optional[JSONCodec] = None,
     ) -> None:
         self._url = req.get("url", None)
         self._headers = req.get("headers", {})
@@ -49,6 +69,7 @@ class ZscalerAPIResponse:
         self._type = data_type
         self._status = res_details.status_code if res_details and hasattr(res_details, "status_code") else None
         self._request_executor = request_executor
+        self._json_codec = json_codec or default_codec
 
         # self._max_items = max_items
         # self._max_pages = max_pages
@@ -62,6 +83,11 @@ class ZscalerAPIResponse:
         self._list = []
         self._is_flat_list_response = False
 
+        # Concurrent page prefetch, see prefetch()
+        self._prefetch_concurrency = 0
+        self._prefetch_pool = None
+        self._prefetched = {}
+
         if all_entries:
             self._params["allEntries"] = True
         if sort_order:
@@ -110,7 +136,7 @@ class ZscalerAPIResponse:
 
             if "application/json" in content_type:
                 try:
-                    self._build_json_response(response_body)
+                    self._build_json_response(response_body, parsed_body)
                 except (json.JSONDecodeError, AttributeError, TypeError):
                     # Fallback if body is not JSON object or list (e.g., int or plain string)
                     self._body = response_body
@@ -118,7 +144,7 @@ class ZscalerAPIResponse:
             else:
                 # Attempt JSON parse, else store as raw text
                 try:
-                    self._build_json_response(response_body)
+                    self._build_json_response(response_body, parsed_body)
                 except (json.JSONDecodeError, AttributeError, TypeError):
                     self._body = response_body
                     self._list = []
@@ -170,14 +196,15 @@ class ZscalerAPIResponse:
         logger.debug("Fetching response status code: %s", self._status)
         return self._status
 
-    def _build_json_response(self, response_body: str) -> None:
+    def _build_json_response(self, response_body: str, parsed_body: Optional[Union[Dict[str, Any], List[Any]]] = None) -> None:
         """
         Converts JSON response text into Python dictionary.
 
         Args:
             response_body (str): Response text
+            parsed_body (dict or list, optional): The already decoded response text, if available.
         """
-        self._body = json.loads(response_body)
+        self._body = parsed_body if parsed_body is not None else self._json_codec.loads(response_body)
 
         if isinstance(self._body, list):
             self._list = self._body
@@ -388,12 +415,139 @@ class ZscalerAPIResponse:
 
         return results, self, None
 
+    def prefetch(self, max_concurrency: Optional[int] = None) -> "ZscalerAPIResponse":
+        """
+        Opts in to concurrent page fetching for ZPA and ZCell list responses.
+
+        Once the total number of pages is known, :meth:`next` requests the
+        following pages ahead of time on a small worker pool, while still
+        returning them one at a time and in order. Every page request goes
+        through the client-side rate limiter like any other call. Other
+        services keep fetching pages one by one.
+
+        Pages still pending when iteration stops early are cancelled by
+        :meth:`close`, when leaving a ``with`` block, or once the response is
+        garbage collected.
+
+        Args:
+            max_concurrency (int, optional): Maximum number of page requests in flight.
+                Defaults to ``maxConcurrency`` from the client configuration, or 4.
+
+        Returns:
+            ZscalerAPIResponse: This response, to allow chaining.
+
+        Examples:
+            >>> segments, resp, err = client.zpa.application_segment.list_segments()
+            >>> with resp.prefetch(max_concurrency=5):
+            ...     while resp.has_next():
+            ...         more_segments, resp, err = resp.next()
+            ...         if err:
+            ...             break
+            ...         segments.extend(more_segments or [])
+        """
+        if self._service_type not in PREFETCH_SERVICES:
+            logger.debug("Page prefetch is not supported for %s, pages are fetched one by one", self._service_type)
+            return self
+        if max_concurrency is None:
+            max_concurrency = getattr(self._request_executor, "max_concurrency", None) or DEFAULT_PREFETCH_CONCURRENCY
+        max_concurrency = int(max_concurrency)
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max concurrency: {max_concurrency}. Must be 1 or greater.")
+        self._prefetch_concurrency = max_concurrency
+        return self
+
+    def _api_page(self, page: int) -> int:
+        # ZCell pages are 0-based while the internal page counter is 1-based
+        return page - 1 if self._service_type == "zcell" else page
+
+    def _page_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "method": "GET",
+            "url": self._url,
+            "headers": self._headers,
+            "params": params,
+            "uuid": uuid.uuid4(),
+            "service_type": self._service_type,
+        }
+
+    def _fetch_page(self, page: int) -> Tuple[Optional[str], Optional[Exception]]:
+        params = dict(self._params)
+        params["page"] = self._api_page(page)
+        request = self._page_request(params)
+        # Concurrent requests must not share the headers a 401 retry rewrites
+        request["headers"] = dict(self._headers)
+        _, _, response_body, error = self._request_executor.fire_request(request)
+        return response_body, error
+
+    def _schedule_prefetch(self, first_page: int) -> None:
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=self._prefetch_concurrency, thread_name_prefix="zscaler-prefetch"
+            )
+        # Keep a bounded window of pages ahead of the caller
+        last_page = min(self._total_pages, first_page + 2 * self._prefetch_concurrency - 1)
+        for page in range(first_page, last_page + 1):
+            if page not in self._prefetched:
+                # Queued pages only hold a weak reference, so a dropped response can be collected
+                self._prefetched[page] = self._prefetch_pool.submit(_fetch_page_if_alive, weakref.ref(self), page)
+
+    def _close_prefetch(self) -> None:
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched = {}
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_pool = None
+
+    def close(self) -> None:
+        """
+        Cancels the pages prefetched ahead of the caller and stops the prefetch workers.
+
+        Page requests already sent complete in the background; the others are never sent.
+        """
+        self._close_prefetch()
+
+    def __enter__(self) -> "ZscalerAPIResponse":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_prefetch_pool", None) is not None:
+            self._close_prefetch()
+
+    def _fetch_prefetched_page(self) -> Tuple[List[Any], Optional[Exception]]:
+        next_page = self._page + 1
+        self._schedule_prefetch(next_page)
+        try:
+            response_body, error = self._prefetched.pop(next_page).result()
+        except Exception as ex:
+            response_body, error = None, ex
+
+        if error:
+            logger.error(f"Error fetching page {next_page}: {error}")
+            self._close_prefetch()
+            return None, error
+
+        self._page = next_page
+        self._params["page"] = self._api_page(next_page)
+        self._build_json_response(response_body)
+        if self._has_next():
+            self._schedule_prefetch(next_page + 1)
+        else:
+            self._close_prefetch()
+        return self._list, None
+
     def _fetch_next_page(self) -> Tuple[List[Any], Optional[Exception]]:
         logger.debug(f"[DEBUG] _fetch_next_page called. service_type={self._service_type}, params={self._params}")
         if not self._has_next():
             logger.debug("No more pages to fetch")
             return [], None
 
+        if self._prefetch_concurrency and self._service_type in PREFETCH_SERVICES:
+            return self._fetch_prefetched_page()
+
         if self._service_type == "zdx":
             logger.debug("[DEBUG] Taking ZDX pagination branch.")
             self._params["offset"] = self._next_offset
@@ -430,13 +584,7 @@ class ZscalerAPIResponse:
 
         logger.debug(f"Requesting next page with params: {self._params}")
 
-        req = {
-            "method": "GET",
-            "url": self._url,
-            "headers": self._headers,
-            "params": self._params,
-            "uuid": uuid.uuid4(),
-        }
+        req = self._page_request(self._params)
         _, _, response_body, error = self._request_executor.fire_request(req)
 
         if error:
@@ -1,60 +1,234 @@
+import math
 import threading
 import time
 
+# Client-side pacing defaults per service, expressed as
+# (get_limit, post_put_delete_limit, get_freq, post_put_delete_freq):
+# ``limit`` requests every ``freq`` seconds, from the documented service-wide
+# rates (ZPA: 20 GETs and 10 writes per 10 seconds). ZIA and ZTW have no
+# service-wide rate, only per-endpoint quotas, which the rate limit registry
+# covers; like other services they are paced from the X-RateLimit-Limit-Second
+# header of their responses instead of a guessed default.
+DEFAULT_RATE_LIMITS = {
+    "zpa": (20, 10, 10, 10),
+    "ztb": (5, 5, 1, 1),
+}
+
+POST_PUT_DELETE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to ``capacity`` tokens, refilled at ``capacity / period`` tokens per second.
+
+    Acquiring a token is O(1), whatever the number of requests sent so far.
+
+    Raises:
+        ValueError: If ``period`` is not a positive number of seconds.
+    """
+
+    def __init__(self, capacity, period):
+        if float(period) <= 0:
+            raise ValueError(f"Token bucket period must be positive, got {period}")
+        self.capacity = float(capacity)
+        self.period = float(period)
+        self.tokens = float(capacity)
+        self.updated = time.time()
+        self.blocked_until = 0.0
+
+    @property
+    def rate(self):
+        return self.capacity / self.period
+
+    def _refill(self, now):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def delay(self, now):
+        """
+        Returns:
+            float: 0 if a token is available, otherwise the seconds until one is.
+        """
+        if self.capacity <= 0:
+            return 0.0
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        """Consumes a token previously reported available by :meth:`delay`."""
+        if self.capacity > 0:
+            self.tokens -= 1
+
+    def acquire(self, now):
+        """
+        Takes a token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until one is available.
+        """
+        delay = self.delay(now)
+        if delay == 0:
+            self.take()
+        return delay
+
+    def resize(self, capacity=None, period=None):
+        """Changes the bucket size and/or refill period, keeping the tokens already available."""
+        if period is not None and float(period) <= 0:
+            raise ValueError(f"Token bucket period must be positive, got {period}")
+        now = time.time()
+        if self.capacity > 0:
+            self._refill(now)
+        if capacity is not None:
+            self.capacity = float(capacity)
+        if period is not None:
+            self.period = float(period)
+        self.tokens = min(self.tokens, self.capacity)
+        self.updated = now
+
+    def limit_to(self, remaining, reset=None):
+        """
+        Aligns the bucket with the quota reported by the server.
+
+        Args:
+            remaining (int): Requests the server still accepts in the current window.
+            reset (float, optional): Seconds until the server window resets.
+        """
+        now = time.time()
+        self._refill(now)
+        self.tokens = min(self.tokens, float(remaining))
+        if remaining <= 0 and reset:
+            self.blocked_until = max(self.blocked_until, now + float(reset))
+
 
 class RateLimiter:
+    """
+    Client-side pacing for one service, with separate token buckets for
+    GET and POST/PUT/PATCH/DELETE requests.
+
+    Each bucket allows ``limit`` requests every ``freq`` seconds, with bursts
+    of up to ``limit`` requests. :meth:`update_limits` retunes the buckets
+    from the ``X-RateLimit-*`` headers returned by the API: ``X-RateLimit-Limit-Second``
+    sets both buckets to that many requests per second. ``X-RateLimit-Reset``
+    is the countdown to the next server window: it only holds the buckets back
+    once the quota is exhausted and never replaces the configured ``freq``.
+    A ``freq`` of 0 or less leaves that method family unpaced.
+    """
+
     def __init__(self, get_limit, post_put_delete_limit, get_freq, post_put_delete_freq):
-        self.lock = threading.Lock()
-        self.get_requests = []
-        self.post_put_delete_requests = []
+        self.lock = threading.RLock()
         self.get_limit = get_limit
         self.post_put_delete_limit = post_put_delete_limit
         self.get_freq = get_freq
         self.post_put_delete_freq = post_put_delete_freq
+        self.get_bucket = _bucket(get_limit, get_freq)
+        self.post_put_delete_bucket = _bucket(post_put_delete_limit, post_put_delete_freq)
+
+    def _bucket_for(self, method):
+        method = (method or "").upper()
+        if method == "GET":
+            return self.get_bucket
+        if method in POST_PUT_DELETE_METHODS:
+            return self.post_put_delete_bucket
+        return None
 
     def wait(self, method):
+        """
+        Takes a token for ``method`` if one is available.
+
+        Returns:
+            tuple: ``(True, delay)`` when the caller must wait ``delay`` seconds
+            and try again, ``(False, 0)`` when the request may be sent.
+        """
         with self.lock:
-            now = time.time()
-
-            if method == "GET":
-                if len(self.get_requests) >= self.get_limit:
-                    oldest_request = self.get_requests[0]
-                    if now - oldest_request < self.get_freq:
-                        d = self.get_freq - (now - oldest_request)
-                        return True, d
-                    self.get_requests.pop(0)
-                self.get_requests.append(now)
-
-            elif method in ["POST", "PUT", "DELETE"]:
-                if len(self.post_put_delete_requests) >= self.post_put_delete_limit:
-                    oldest_request = self.post_put_delete_requests[0]
-                    if now - oldest_request < self.post_put_delete_freq:
-                        d = self.post_put_delete_freq - (now - oldest_request)
-                        return True, d
-                    self.post_put_delete_requests.pop(0)
-                self.post_put_delete_requests.append(now)
+            bucket = self._bucket_for(method)
+            if bucket is None:
+                return False, 0
 
+            delay = bucket.acquire(time.time())
+            if delay > 0:
+                return True, delay
             return False, 0
 
     def update_limits(self, headers):
-        if "X-Ratelimit-Limit-Second" in headers:
-            self.get_limit = int(headers["X-Ratelimit-Limit-Second"])
-            self.post_put_delete_limit = int(headers["X-Ratelimit-Limit-Second"])
-        if "X-Ratelimit-Reset" in headers:
-            self.get_freq = int(headers["X-Ratelimit-Reset"])
-            self.post_put_delete_freq = int(headers["X-Ratelimit-Reset"])
-
-        # Handle minute, hour, and day limits
-        if "X-RateLimit-Limit-Minute" in headers:
-            self.minute_limit = int(headers["X-RateLimit-Limit-Minute"])
-        if "X-RateLimit-Limit-Hour" in headers:
-            self.hour_limit = int(headers["X-RateLimit-Limit-Hour"])
-        if "X-RateLimit-Limit-Day" in headers:
-            self.day_limit = int(headers["X-RateLimit-Limit-Day"])
-
-        if "X-RateLimit-Remaining-Minute" in headers:
-            self.remaining_minute = int(headers["X-RateLimit-Remaining-Minute"])
-        if "X-RateLimit-Remaining-Hour" in headers:
-            self.remaining_hour = int(headers["X-RateLimit-Remaining-Hour"])
-        if "X-RateLimit-Remaining-Day" in headers:
-            self.remaining_day = int(headers["X-RateLimit-Remaining-Day"])
+        headers = {str(k).lower(): v for k, v in (headers or {}).items()}
+
+        with self.lock:
+            limit_second = _header_int(headers, "x-ratelimit-limit-second")
+            if limit_second is not None and limit_second > 0:
+                self.get_limit = limit_second
+                self.post_put_delete_limit = limit_second
+                # A per-second limit comes with its own one second window
+                if self.get_freq > 0:
+                    self.get_freq = 1
+                if self.post_put_delete_freq > 0:
+                    self.post_put_delete_freq = 1
+
+            # Handle minute, hour, and day limits
+            for attr, key in (
+                ("minute_limit", "x-ratelimit-limit-minute"),
+                ("hour_limit", "x-ratelimit-limit-hour"),
+                ("day_limit", "x-ratelimit-limit-day"),
+                ("remaining_minute", "x-ratelimit-remaining-minute"),
+                ("remaining_hour", "x-ratelimit-remaining-hour"),
+                ("remaining_day", "x-ratelimit-remaining-day"),
+            ):
+                value = _header_int(headers, key)
+                if value is not None:
+                    setattr(self, attr, value)
+
+            # Retune the buckets from what the server reported; the reset countdown never sets the period
+            if self.get_freq > 0:
+                self.get_bucket.resize(self.get_limit, self.get_freq)
+            if self.post_put_delete_freq > 0:
+                self.post_put_delete_bucket.resize(self.post_put_delete_limit, self.post_put_delete_freq)
+
+            remaining = [
+                value
+                for value in (
+                    _header_int(headers, key)
+                    for key in (
+                        "x-ratelimit-remaining-second",
+                        "x-ratelimit-remaining-minute",
+                        "x-ratelimit-remaining-hour",
+                        "x-ratelimit-remaining-day",
+                        "x-ratelimit-remaining",
+                    )
+                )
+                if value is not None
+            ]
+            if remaining:
+                reset = _header_float(headers, "x-ratelimit-reset")
+                if reset is None:
+                    reset = _header_float(headers, "ratelimit-reset")
+                for bucket in (self.get_bucket, self.post_put_delete_bucket):
+                    bucket.limit_to(min(remaining), reset)
+
+
+def _bucket(limit, freq):
+    # An empty bucket never throttles, which is what a non-positive frequency always meant
+    if float(freq) <= 0:
+        return TokenBucket(0, 1)
+    return TokenBucket(limit, freq)
+
+
+def _header_int(headers, key):
+    """Returns the integer value of a rate limit header, or None if it is missing or malformed."""
+    value = _header_float(headers, key)
+    return int(value) if value is not None else None
+
+
+def _header_float(headers, key):
+    """Returns the numeric value of a rate limit header, or None if it is missing or malformed."""
+    value = headers.get(key)
+    if value is None:
+        return None
+    try:
+        value = float(str(value).strip())
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
@@ -0,0 +1,186 @@
+import re
+import threading
+import time
+
+from zscaler.ratelimiter.ratelimiter import TokenBucket
+
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
+
+# Endpoint families with their own documented limits, on top of the
+# service-wide buckets. ``path`` is a regular expression searched in the
+# request path, so it matches both OneAPI (/zia/api/v1/...) and legacy
+# (/api/v1/...) URLs. ZPA only documents service-wide GET and write rates,
+# which already seed its service bucket (see DEFAULT_RATE_LIMITS).
+DEFAULT_ENDPOINT_RATE_LIMITS = [
+    {
+        "name": "zia-url-lookup",
+        "service": "zia",
+        "path": r"/urlLookup$",
+        "methods": ["POST"],
+        "limit": 1,
+        "period": 1,
+        "hourly": 400,
+    },
+    {
+        "name": "zia-users-bulk-delete",
+        "service": "zia",
+        "path": r"/users/bulkDelete$",
+        "methods": ["POST"],
+        "limit": 1,
+        "period": 60,
+        "hourly": 4,
+    },
+    {
+        "name": "zia-user-management",
+        "service": "zia",
+        "path": r"/users(/\d+)?$",
+        "methods": ["POST", "PUT", "DELETE"],
+        "limit": 1,
+        "period": 1,
+        "hourly": 1000,
+    },
+    {
+        "name": "zia-activation",
+        "service": "zia",
+        "path": r"/status/activate$",
+        "methods": ["POST"],
+        "limit": 1,
+        "period": 1,
+    },
+    {
+        "name": "zia-sandbox-submit",
+        "service": "zia",
+        "path": r"/zscsb/(submit|discan)$",
+        "methods": ["POST"],
+        "limit": 1,
+        "period": 1,
+    },
+]
+
+
+class EndpointRateLimit:
+    """
+    Rate limit of one endpoint family: a short-term token bucket plus optional
+    hourly and daily quotas. A request is let through only when every bucket
+    has a token, so a request held back by one quota does not spend the others.
+
+    Args:
+        name (str): Identifier of the endpoint family, used in logs.
+        service (str): Service type as returned by ``RequestExecutor.get_service_type``.
+        path (str): Regular expression searched in the request path.
+        methods (list, optional): HTTP methods the limit applies to. Defaults to all methods.
+        limit (int, optional): Requests allowed every ``period`` seconds.
+        period (float, optional): Length of the short-term window in seconds.
+        hourly (int, optional): Requests allowed per hour.
+        daily (int, optional): Requests allowed per day.
+    """
+
+    def __init__(self, name, service, path, methods=None, limit=None, period=1, hourly=None, daily=None):
+        self.name = name
+        self.service = service
+        self.path = path
+        self._path_regex = re.compile(path)
+        self.methods = {m.upper() for m in methods} if methods else None
+
+        self.buckets = []
+        if limit:
+            self.buckets.append(TokenBucket(limit, period))
+        if hourly:
+            self.buckets.append(TokenBucket(hourly, SECONDS_PER_HOUR))
+        if daily:
+            self.buckets.append(TokenBucket(daily, SECONDS_PER_DAY))
+
+    def matches(self, service_type, method, path):
+        if service_type != self.service:
+            return False
+        if self.methods is not None and (method or "").upper() not in self.methods:
+            return False
+        return self._path_regex.search(path or "") is not None
+
+    def acquire(self, now):
+        """
+        Takes a token from every bucket, or none of them.
+
+        Returns:
+            float: 0 if the request may be sent, otherwise the seconds to wait.
+        """
+        delay = max((bucket.delay(now) for bucket in self.buckets), default=0.0)
+        if delay == 0:
+            for bucket in self.buckets:
+                bucket.take()
+        return delay
+
+
+class RateLimitRegistry:
+    """
+    Declarative registry mapping endpoint patterns to their own rate limits.
+
+    Only requests matching a registered endpoint family are throttled by it;
+    every other call keeps going at the service-wide rate.
+
+    Example:
+        >>> registry = RateLimitRegistry.from_config(
+        ...     [{"name": "lookup", "service": "zia", "path": "/urlLookup$", "limit": 1, "period": 1, "hourly": 400}]
+        ... )
+        >>> registry.wait("zia", "POST", "/zia/api/v1/urlLookup")
+        (False, 0)
+    """
+
+    def __init__(self, endpoint_limits=None):
+        self.lock = threading.Lock()
+        self.endpoint_limits = list(endpoint_limits or [])
+
+    @classmethod
+    def from_config(cls, endpoints=None, include_defaults=True):
+        """
+        Builds a registry from ``rateLimit.endpoints`` entries.
+
+        User supplied entries are matched first, so they override the defaults
+        for the same endpoint.
+
+        Args:
+            endpoints (list, optional): Endpoint rate limit definitions (dicts).
+            include_defaults (bool): Append ``DEFAULT_ENDPOINT_RATE_LIMITS``.
+
+        Returns:
+            RateLimitRegistry: The registry.
+        """
+        definitions = list(endpoints or [])
+        if include_defaults:
+            definitions += DEFAULT_ENDPOINT_RATE_LIMITS
+
+        endpoint_limits = []
+        for definition in definitions:
+            definition = dict(definition)
+            definition.setdefault("name", definition.get("path"))
+            try:
+                endpoint_limits.append(EndpointRateLimit(**definition))
+            except (TypeError, re.error) as e:
+                raise ValueError(f"Invalid endpoint rate limit definition {definition}: {e}")
+        return cls(endpoint_limits)
+
+    def match(self, service_type, method, path):
+        """Returns the first endpoint rate limit matching the request, if any."""
+        for endpoint_limit in self.endpoint_limits:
+            if endpoint_limit.matches(service_type, method, path):
+                return endpoint_limit
+        return None
+
+    def wait(self, service_type, method, path):
+        """
+        Takes a token for the endpoint family of the request.
+
+        Returns:
+            tuple: ``(True, delay)`` when the caller must wait ``delay`` seconds
+            and try again, ``(False, 0)`` when the request may be sent.
+        """
+        endpoint_limit = self.match(service_type, method, path)
+        if endpoint_limit is None:
+            return False, 0
+
+        with self.lock:
+            delay = endpoint_limit.acquire(time.time())
+        if delay > 0:
+            return True, delay
+        return False, 0
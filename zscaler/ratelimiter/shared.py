@@ -0,0 +1,108 @@
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from zscaler.ratelimiter.ratelimiter import RateLimiter
+from zscaler.sqlite_connection import DEFAULT_LOCK_TIMEOUT, SQLiteConnection
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    name TEXT PRIMARY KEY,
+    capacity REAL NOT NULL,
+    period REAL NOT NULL,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    blocked_until REAL NOT NULL
+)
+"""
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    :class:`RateLimiter` whose token buckets live in a SQLite database, so every
+    process on the host pointing at the same file draws from one budget.
+
+    Each :meth:`wait` and :meth:`update_limits` call loads the buckets, applies
+    the regular token bucket logic and writes them back inside a single
+    ``BEGIN IMMEDIATE`` transaction, which SQLite serializes across processes.
+    Bucket timestamps use the wall clock, so they mean the same thing in every
+    process. The database file is only readable by its owner. If the database
+    cannot be used, pacing falls back to the in-process buckets.
+
+    Args:
+        path (str): SQLite database file shared by the cooperating processes.
+        name (str): Budget name, e.g. ``"<tenant>:zpa"``. Limiters with the same
+            name share their buckets.
+        timeout (float, optional): Seconds to wait for the database lock.
+    """
+
+    def __init__(
+        self,
+        path,
+        name,
+        get_limit,
+        post_put_delete_limit,
+        get_freq,
+        post_put_delete_freq,
+        timeout=DEFAULT_LOCK_TIMEOUT,
+    ):
+        super().__init__(get_limit, post_put_delete_limit, get_freq, post_put_delete_freq)
+        self.path = os.path.expanduser(path)
+        self.name = name
+        self.timeout = timeout
+        self._connection = SQLiteConnection(self.path, (_CREATE_TABLE,), timeout)
+
+    def _buckets(self):
+        return (("get", self.get_bucket), ("post_put_delete", self.post_put_delete_bucket))
+
+    def _load(self, conn):
+        for suffix, bucket in self._buckets():
+            row = conn.execute(
+                "SELECT capacity, period, tokens, updated, blocked_until FROM rate_limit_buckets WHERE name = ?",
+                (f"{self.name}:{suffix}",),
+            ).fetchone()
+            # Rows written before periods were validated may hold a zero period
+            if row is not None and row[1] > 0:
+                bucket.capacity, bucket.period, bucket.tokens, bucket.updated, bucket.blocked_until = row
+
+        # Another process may have retuned the buckets from its response headers
+        self.get_limit = int(self.get_bucket.capacity)
+        self.get_freq = self.get_bucket.period
+        self.post_put_delete_limit = int(self.post_put_delete_bucket.capacity)
+        self.post_put_delete_freq = self.post_put_delete_bucket.period
+
+    def _store(self, conn):
+        for suffix, bucket in self._buckets():
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (name, capacity, period, tokens, updated, blocked_until) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (f"{self.name}:{suffix}", bucket.capacity, bucket.period, bucket.tokens, bucket.updated, bucket.blocked_until),
+            )
+
+    @contextmanager
+    def _shared_state(self):
+        with self._connection.transaction() as conn:
+            self._load(conn)
+            yield
+            self._store(conn)
+
+    def wait(self, method):
+        with self.lock:
+            try:
+                with self._shared_state():
+                    return super().wait(method)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Shared rate limit store {self.path} unavailable, pacing in-process only: {e}")
+                return super().wait(method)
+
+    def update_limits(self, headers):
+        with self.lock:
+            try:
+                with self._shared_state():
+                    super().update_limits(headers)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Shared rate limit store {self.path} unavailable, pacing in-process only: {e}")
+                super().update_limits(headers)
@@ -1,17 +1,34 @@
+import functools
+import inspect
 import logging
+import os
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from typing import Any, Dict, Optional, Tuple
-
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+from zscaler.cache.cache import Cache
+from zscaler.cache.cached_response import CachedResponse
+from zscaler.cache.lru_cache import estimate_size
+from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.cache.policy import CachePolicyRegistry
+from zscaler.cache.single_flight import SingleFlight
+from zscaler.cache.stats import CacheStats, endpoint_template, key_path
 from zscaler.constants import ONEAPI_GOV_API_BASE_URLS
 from zscaler.error_messages import ERROR_MESSAGE_429_MISSING_DATE_X_RESET
 from zscaler.errors.response_checker import check_response_for_error
 from zscaler.exceptions import exceptions
-from zscaler.helpers import convert_keys_to_camel_case, convert_keys_to_snake_case
+from zscaler.helpers import convert_keys_to_camel_case
+from zscaler.json_codec import get_json_codec
 from zscaler.oneapi_http_client import HTTPClient
 from zscaler.oneapi_oauth_client import OAuth
 from zscaler.oneapi_response import ZscalerAPIResponse
+from zscaler.ratelimiter.ratelimiter import DEFAULT_RATE_LIMITS, RateLimiter
+from zscaler.ratelimiter.registry import RateLimitRegistry
+from zscaler.ratelimiter.shared import SharedRateLimiter
 from zscaler.user_agent import UserAgent
 from zscaler.zcc.legacy import LegacyZCCClientHelper
 from zscaler.zdx.legacy import LegacyZDXClientHelper
@@ -23,6 +40,31 @@ from zscaler.zwa.legacy import LegacyZWAClientHelper
 
 logger = logging.getLogger("zscaler-sdk-python")
 
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_REVALIDATE_TTL = 300
+DEFAULT_REFRESH_WORKERS = 2
+
+
+def _accepts_keyword(function, name) -> bool:
+    try:
+        parameters = inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in parameters or any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+
+
+def _conditional_headers(response) -> Dict[str, str]:
+    """Returns the If-None-Match / If-Modified-Since headers revalidating a cached response."""
+    headers = getattr(response, "headers", None)
+    if not isinstance(headers, Mapping):
+        return {}
+    conditional = {}
+    if headers.get("ETag"):
+        conditional["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        conditional["If-Modified-Since"] = headers["Last-Modified"]
+    return conditional
+
 
 class RequestExecutor:
     """
@@ -85,9 +127,67 @@ class RequestExecutor:
         if self._max_retries < 0:
             raise ValueError(f"Invalid max retries: {self._max_retries}. Must be 0 or greater.")
 
+        # Codec encoding request bodies and decoding responses (orjson when installed)
+        self._json_codec = get_json_codec(config["client"].get("jsonCodec"))
+
+        # Worker pool size of execute_many/run_many batches
+        self._max_concurrency = int(config["client"].get("maxConcurrency") or DEFAULT_MAX_CONCURRENCY)
+        if self._max_concurrency < 1:
+            raise ValueError(f"Invalid max concurrency: {self._max_concurrency}. Must be 1 or greater.")
+
+        # Client-side pacing: one adaptive RateLimiter per service, shared by all threads
+        pacing = config["client"]["rateLimit"].get("pacing", os.getenv("ZSCALER_RATE_LIMIT_PACING", "true"))
+        self._rate_limit_pacing = str(pacing).lower() not in ("false", "0", "no")
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._rate_limiters_lock = threading.Lock()
+        # Optional SQLite file coordinating the buckets of every process on the host
+        self._rate_limit_shared_store = config["client"]["rateLimit"].get(
+            "sharedStore", os.getenv("ZSCALER_RATE_LIMIT_SHARED_STORE")
+        )
+        # Endpoint families with their own limits (URL lookup, sandbox submit, ...)
+        self._endpoint_rate_limits = RateLimitRegistry.from_config(config["client"]["rateLimit"].get("endpoints"))
+        # Legacy helpers already carry a limiter tuned for their service, reuse it
+        for service_type, legacy_client in (
+            ("zpa", zpa_legacy_client),
+            ("zia", zia_legacy_client),
+            ("ztw", ztw_legacy_client),
+            ("ztb", ztb_legacy_client),
+        ):
+            rate_limiter = getattr(legacy_client, "rate_limiter", None)
+            if isinstance(rate_limiter, RateLimiter) and not self._rate_limit_shared_store:
+                self._rate_limiters[service_type] = rate_limiter
+
         # Set configuration and cache
         self._config = config
         self._cache = cache
+        # Identical GETs in flight at the same time share one HTTP call
+        self._in_flight = SingleFlight()
+        # Expired responses carrying an ETag or Last-Modified header are kept this long
+        # so they can be revalidated with a conditional GET, if the cache supports it
+        revalidate_ttl = self._config["client"].get("cache", {}).get("revalidateTtl", DEFAULT_REVALIDATE_TTL)
+        self._cache_revalidate_ttl = float(revalidate_ttl or 0)
+        self._cache_revalidates = getattr(type(cache), "get_stale", Cache.get_stale) is not Cache.get_stale
+        # 404 answers to by-ID GETs are remembered this long, if the cache takes per-entry TTLs
+        self._cache_negative_ttl = float(self._config["client"].get("cache", {}).get("negativeTtl") or 0)
+        if self._cache_negative_ttl > 0 and not _accepts_keyword(cache.add, "ttl"):
+            logger.warning(f"{type(cache).__name__} doesn't take per-entry TTLs; not caching 404 responses.")
+            self._cache_negative_ttl = 0
+        self._cache_policies = CachePolicyRegistry.from_config(self._config["client"].get("cache", {}).get("policies"))
+        # Per-entry options a custom cache manager's add() doesn't take are dropped
+        self._cache_add_options = {name for name in ("ttl", "tti", "stale_ttl") if _accepts_keyword(cache.add, name)}
+        if not isinstance(cache, NoOpCache) and not {"ttl", "tti"} <= self._cache_add_options:
+            logger.warning(
+                f"{type(cache).__name__}.add() doesn't take per-entry TTL/TTI; cache policies use the cache-wide ones."
+            )
+        # Stale-while-revalidate refreshes run on a small pool, at most one per cache key
+        self._refresh_pool = None
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        # Cache activity by service and endpoint; the cache reports its evictions and expirations
+        self._cache_stats = CacheStats(self._cache_labels)
+        self._cache_services = {}  # endpoint template -> service type of its requests
+        if isinstance(cache, Cache):
+            cache.stats = self._cache_stats
 
         # Retrieve cloud, service, and customer ID (optional)
         self.cloud = self._config["client"].get("cloud", "production").lower()
@@ -125,6 +225,8 @@ class RequestExecutor:
                 "headers": self._default_headers,
                 "proxy": self._config["client"].get("proxy"),
                 "sslContext": self._config["client"].get("sslContext"),
+                "connectionPool": self._config["client"].get("connectionPool"),
+                "jsonCodec": self._json_codec,
             },
             zcc_legacy_client=self.zcc_legacy_client,
             ztw_legacy_client=self.ztw_legacy_client,
@@ -562,7 +664,14 @@ class RequestExecutor:
             return response, None
 
         try:
-            response_data, error = check_response_for_error(request["url"], response, response_body)
+            # Cached responses carry their decoded body
+            response_data, error = check_response_for_error(
+                request["url"],
+                response,
+                response_body,
+                json_codec=self._json_codec,
+                parsed_body=response.body if isinstance(response, CachedResponse) else None,
+            )
         except Exception as ex:
             logger.error(f"Exception while checking response for errors: {ex}")
             return None, ex
@@ -574,9 +683,8 @@ class RequestExecutor:
         logger.debug(f"Successful response from {request['url']}")
         logger.debug(f"Response Data: {response_data}")
 
-        if isinstance(response_data, (dict, list)):
-            response_data = convert_keys_to_snake_case(response_data)
-
+        # The body is decoded once by check_response_for_error; hand it over
+        # instead of having the response parse the same text again.
         return (
             ZscalerAPIResponse(
                 request_executor=self,
@@ -585,10 +693,79 @@ class RequestExecutor:
                 response_body=response_body,
                 data_type=response_type,
                 service_type=request.get("service_type", ""),
+                parsed_body=response_data if isinstance(response_data, (dict, list)) else None,
+                json_codec=self._json_codec,
             ),
             None,
         )
 
+    @property
+    def max_concurrency(self) -> int:
+        """Default number of requests in flight for batches and page prefetch."""
+        return self._max_concurrency
+
+    def execute_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        response_type: Optional[type] = None,
+        max_concurrency: Optional[int] = None,
+        return_raw_response: bool = False,
+    ) -> List[Tuple[Optional["ZscalerAPIResponse"], Optional[Exception]]]:
+        """
+        Executes prepared requests in parallel on a bounded worker pool.
+
+        Every request goes through :meth:`execute`, so client-side pacing,
+        retries and caching apply to each of them as if they were sent one by one.
+
+        Args:
+            requests (iterable): Requests returned by :meth:`create_request`.
+            response_type (type, optional): Expected data type of every response.
+            max_concurrency (int, optional): Maximum number of requests in flight.
+                Defaults to ``maxConcurrency`` from the client configuration.
+            return_raw_response (bool): Return the raw HTTP responses.
+
+        Returns:
+            list: One ``(API response, Error)`` tuple per request, in input order.
+        """
+        calls = [functools.partial(self.execute, request, response_type, return_raw_response) for request in requests]
+        return self._run_in_order(calls, max_concurrency, lambda error: (None, error))
+
+    def run_many(self, calls: Iterable[Callable[[], Any]], max_concurrency: Optional[int] = None) -> List[Any]:
+        """
+        Runs SDK service calls in parallel on a bounded worker pool.
+
+        Args:
+            calls (iterable): Callables taking no arguments, typically service
+                methods bound with ``functools.partial``.
+            max_concurrency (int, optional): Maximum number of calls in flight.
+                Defaults to ``maxConcurrency`` from the client configuration.
+
+        Returns:
+            list: What each call returned, in input order. A call raising an
+            exception yields ``(None, None, exception)``, like a failed service method.
+        """
+        return self._run_in_order(list(calls), max_concurrency, lambda error: (None, None, error))
+
+    def _run_in_order(self, calls, max_concurrency, on_error):
+        calls = list(calls)
+        if not calls:
+            return []
+        max_concurrency = self._max_concurrency if max_concurrency is None else int(max_concurrency)
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max concurrency: {max_concurrency}. Must be 1 or greater.")
+
+        results = []
+        workers = min(max_concurrency, len(calls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zscaler-batch") as pool:
+            futures = [pool.submit(call) for call in calls]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as ex:
+                    logger.error(f"Exception during batch execution: {ex}")
+                    results.append(on_error(ex))
+        return results
+
     def _extract_and_append_query_params(self, url, params):
         """
         Extracts query parameters from the URL and appends them to the params dictionary.
@@ -635,34 +812,276 @@ class RequestExecutor:
 
         # Pass both URL and params to create_key
         url_cache_key = self._cache.create_key(request["url"], request["params"])
-        if self._cache_enabled() and not is_sandbox_request:
-            # Remove cache entry if not a GET call
+        use_cache = self._cache_enabled() and not is_sandbox_request
+        if use_cache:
+            # Remove the entries a non-GET call makes stale
             if request["method"].upper() != "GET":
-                logger.debug(f"Deleting cache entry for non-GET request: {url_cache_key}")
-                self._cache.delete(url_cache_key)
+                logger.debug(f"Invalidating cache entries for non-GET request: {url_cache_key}")
+                self._cache.invalidate(url_cache_key)
+                result = self._send_request(request, url_cache_key, use_cache)
+                # Again, in case a concurrent GET cached the resource before the change
+                self._cache.invalidate(url_cache_key)
+                return result
+
+            policy = self._cache_policy(request)
+            if policy is not None and not policy.enabled:
+                logger.debug(f"Cache policy {policy.name} disables caching for URL: {request['url']}")
+                return self._send_request(request, url_cache_key, False)
 
             # Check if response exists in cache
-            if self._cache.contains(url_cache_key):
+            cached = self._cache.get(url_cache_key) if self._cache.contains(url_cache_key) else None
+            if cached is not None:
                 logger.info(f"Cache hit for URL: {request['url']}")
-                response, response_body = self._cache.get(url_cache_key)
+                self._record_cache_event("hits", request, url_cache_key)
+                response, response_body = cached
                 return request, response, response_body, None
-            else:
-                logger.debug(f"No cache entry found for URL: {request['url']}")
+            logger.debug(f"No cache entry found for URL: {request['url']}")
+
+            stale = self._cache.get_stale(url_cache_key) if self._cache_revalidates else None
+            if stale is not None and policy is not None and policy.stale_while_revalidate:
+                # Serve the expired response right away and refresh it in the background
+                logger.info(f"Serving stale cached response for URL: {request['url']}")
+                self._record_cache_event("stale_hits", request, url_cache_key)
+                self._refresh_in_background(request, url_cache_key, stale)
+                response, response_body = stale
+                return request, response, response_body, None
+
+            # An expired entry with validators is revalidated instead of downloaded again
+            stale = self._revalidatable(stale)
+
+            # Wait for an identical GET already in flight rather than sending another one
+            result, shared = self._in_flight.do(
+                url_cache_key, lambda: self._send_request(request, url_cache_key, use_cache, stale)
+            )
+            if shared:
+                logger.debug(f"Shared in-flight response for URL: {request['url']}")
+                self._record_cache_event("coalesced", request, url_cache_key)
+                return (request,) + result[1:]
+            self._record_cache_event("misses", request, url_cache_key)
+            return result
 
-        # Send Actual Request
+        return self._send_request(request, url_cache_key, use_cache)
+
+    def _send_request(self, request, url_cache_key, use_cache, stale=None):
+        """
+        Sends the request, paced by the service rate limiter, and caches successful GET responses,
+        and 404 answers to by-ID GETs when negative caching is enabled.
+        A 304 answer to a conditional GET refreshes and returns the ``stale`` cached response.
+        """
+        self._pace_request(request)
+        # The validators only go on the wire: the request kept by callers and paginated
+        # responses must not send them again for other pages
+        conditional_headers = _conditional_headers(stale[0]) if stale is not None else {}
+        wire_request = (
+            {**request, "headers": {**request["headers"], **conditional_headers}} if conditional_headers else request
+        )
         try:
-            request, response, response_body, error = self.fire_request_helper(request, 0, time.time())
+            sent_request, response, response_body, error = self.fire_request_helper(wire_request, 0, time.time())
         except Exception as e:
             logger.error(f"Request execution failed: {e}")
             return request, None, None, e
-
-        if self._cache_enabled() and not is_sandbox_request:
-            if not error and request["method"].upper() == "GET" and response and response.status_code < 300:
+        if sent_request is wire_request and conditional_headers:
+            # Keep a token refreshed by a 401 retry, without the validators
+            request["headers"].update({k: v for k, v in wire_request["headers"].items() if k not in conditional_headers})
+        elif sent_request is not None:
+            request = sent_request
+        self._update_rate_limits(request, response)
+
+        if stale is not None and not error and response is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            logger.info(f"Cached response revalidated for URL: {request['url']}")
+            self._record_cache_event("revalidations", request, url_cache_key)
+            response, response_body = stale
+            self._cache_response(request, url_cache_key, response, response_body)
+            return request, response, response_body, None
+
+        if use_cache and not error and response is not None and request["method"].upper() == "GET":
+            if response.status_code < 300:
                 logger.info(f"Caching response for URL: {request['url']}")
-                self._cache.add(url_cache_key, (response, response_body))
+                response = self._cache_response(request, url_cache_key, response, response_body)
+            elif response.status_code == HTTPStatus.NOT_FOUND and self._caches_not_found(request):
+                logger.info(f"Caching not found response for URL: {request['url']}")
+                response = self._cache_response(request, url_cache_key, response, response_body, negative=True)
 
         return request, response, response_body, error
 
+    def _cache_response(self, request, url_cache_key, response, response_body, negative=False):
+        """
+        Caches a compact snapshot of the response, following the cache policy of its endpoint, and returns it.
+        ``negative`` responses (404) are kept for ``cache.negativeTtl`` seconds only.
+        """
+        if not isinstance(response, CachedResponse) and isinstance(getattr(response, "headers", None), Mapping):
+            response = CachedResponse.from_response(response, response_body, self._json_codec)
+
+        policy = self._cache_policy(request)
+        size = estimate_size((response, response_body))
+        if policy is not None and policy.max_entry_size is not None and size > policy.max_entry_size:
+            logger.debug(f"Not caching {size} bytes response for URL: {request['url']} (cache policy {policy.name}).")
+            return response
+
+        # Cache-wide TTL/TTI unless the policy sets its own; custom caches only get the options used
+        options = {}
+        if negative:
+            options["ttl"] = options["tti"] = self._cache_negative_ttl
+        elif policy is not None:
+            if policy.ttl is not None:
+                options["ttl"] = policy.ttl
+            if policy.tti is not None:
+                options["tti"] = policy.tti
+        # Keep expired entries around if they can be served stale or revalidated
+        if self._cache_revalidates and not negative:
+            if policy is not None and policy.stale_while_revalidate:
+                options["stale_ttl"] = policy.stale_while_revalidate
+            elif self._cache_revalidate_ttl > 0 and _conditional_headers(response):
+                options["stale_ttl"] = self._cache_revalidate_ttl
+        options = {name: value for name, value in options.items() if name in self._cache_add_options}
+        self._cache.add(url_cache_key, (response, response_body), **options)
+        self._record_cache_event("stores", request, url_cache_key)
+        self._record_cache_event("stored_bytes", request, url_cache_key, size)
+        return response
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Returns the response cache counters: hits, misses, evictions, expirations, stored bytes, ...
+
+        Returns:
+            dict: Totals, hit ratio, size of the cache, and counters by service and endpoint.
+            See :meth:`zscaler.cache.stats.CacheStats.snapshot`.
+        """
+        return self._cache_stats.snapshot(self._cache)
+
+    def add_cache_stats_hook(self, hook: Callable[[str, str, str, int], Any]) -> None:
+        """
+        Registers a metric hook called with ``(event, service_type, endpoint, value)`` on every cache event.
+        """
+        self._cache_stats.add_hook(hook)
+
+    def _record_cache_event(self, event, request, url_cache_key, value=1):
+        endpoint = endpoint_template(key_path(url_cache_key))
+        service_type = request.get("service_type") or "unknown"
+        self._cache_services[endpoint] = service_type
+        self._cache_stats.record(event, service_type, endpoint, value)
+
+    def _cache_labels(self, url_cache_key):
+        """Returns the service type and endpoint template of a cache key, for events reported by the cache."""
+        endpoint = endpoint_template(key_path(url_cache_key))
+        return self._cache_services.get(endpoint, "unknown"), endpoint
+
+    def _caches_not_found(self, request):
+        """Whether a 404 answer to this GET is cached: negative caching is on and the URL names a single resource."""
+        return self._cache_negative_ttl > 0 and endpoint_template(urlparse(request["url"]).path).endswith("/{id}")
+
+    def _cache_policy(self, request):
+        return self._cache_policies.match(request.get("service_type"), urlparse(request["url"]).path)
+
+    def _revalidatable(self, stale):
+        """Returns the ``stale`` cached response if it carries validators for a conditional GET, else None."""
+        if stale is None or not _conditional_headers(stale[0]):
+            return None
+        return stale
+
+    def _refresh_in_background(self, request, url_cache_key, stale):
+        with self._refresh_lock:
+            if url_cache_key in self._refreshing:
+                return
+            self._refreshing.add(url_cache_key)
+            if self._refresh_pool is None:
+                self._refresh_pool = ThreadPoolExecutor(
+                    max_workers=DEFAULT_REFRESH_WORKERS, thread_name_prefix="zscaler-cache-refresh"
+                )
+        # The caller may reuse its headers, e.g. for a 401 retry
+        request = {**request, "headers": dict(request["headers"])}
+        self._refresh_pool.submit(self._refresh, request, url_cache_key, stale)
+
+    def _refresh(self, request, url_cache_key, stale):
+        try:
+            stale = self._revalidatable(stale)
+            result, _ = self._in_flight.do(url_cache_key, lambda: self._send_request(request, url_cache_key, True, stale))
+            if result[3] is not None:
+                logger.warning(f"Background refresh failed for URL {request['url']}: {result[3]}")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for URL {request['url']}: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(url_cache_key)
+
+    def get_rate_limiter(self, service_type: str, headers=None) -> Optional[RateLimiter]:
+        """
+        Returns the client-side rate limiter of a service, creating it on first use
+        from ``DEFAULT_RATE_LIMITS`` or, for services without documented defaults,
+        from the per-second limit advertised in the response headers.
+
+        Args:
+            service_type (str): Service the request is sent to (zia, zpa, ...).
+            headers (dict, optional): Response headers of the service.
+
+        Returns:
+            RateLimiter or None when the service is not paced client side.
+        """
+        if not service_type:
+            return None
+        with self._rate_limiters_lock:
+            rate_limiter = self._rate_limiters.get(service_type)
+            if rate_limiter is None:
+                if service_type in DEFAULT_RATE_LIMITS:
+                    rate_limiter = self._new_rate_limiter(service_type, *DEFAULT_RATE_LIMITS[service_type])
+                elif headers and headers.get("X-RateLimit-Limit-Second"):
+                    limit = int(headers["X-RateLimit-Limit-Second"])
+                    rate_limiter = self._new_rate_limiter(service_type, limit, limit, 1, 1)
+                if rate_limiter is not None:
+                    self._rate_limiters[service_type] = rate_limiter
+            return rate_limiter
+
+    def _new_rate_limiter(self, service_type, get_limit, post_put_delete_limit, get_freq, post_put_delete_freq):
+        if not self._rate_limit_shared_store:
+            return RateLimiter(get_limit, post_put_delete_limit, get_freq, post_put_delete_freq)
+        # Processes working on the same tenant share one budget per service
+        tenant = self._config["client"].get("vanityDomain") or self._config["client"].get("customerId") or "default"
+        return SharedRateLimiter(
+            self._rate_limit_shared_store,
+            f"{tenant}:{service_type}",
+            get_limit,
+            post_put_delete_limit,
+            get_freq,
+            post_put_delete_freq,
+        )
+
+    def _pace_request(self, request):
+        """
+        Blocks until the endpoint family bucket (if the request matches one in the
+        rate limit registry) and then the service bucket let the request through.
+        """
+        if not self._rate_limit_pacing:
+            return
+        service_type = request.get("service_type")
+        method = request["method"]
+        path = urlparse(request["url"]).path
+        self._wait_for_token(lambda: self._endpoint_rate_limits.wait(service_type, method, path), f"{method} {path}")
+
+        rate_limiter = self.get_rate_limiter(service_type)
+        if rate_limiter is not None:
+            self._wait_for_token(lambda: rate_limiter.wait(method), service_type)
+
+    def _wait_for_token(self, wait, limit_name):
+        while True:
+            should_wait, delay = wait()
+            if not should_wait:
+                return
+            logger.debug(f"Client-side rate limit reached for {limit_name}, waiting {delay:.2f} seconds.")
+            time.sleep(delay)
+
+    def _update_rate_limits(self, request, response):
+        """Retunes the service token buckets from the X-RateLimit-* response headers."""
+        if not self._rate_limit_pacing or response is None:
+            return
+        try:
+            rate_limiter = self.get_rate_limiter(request.get("service_type"), response.headers)
+            if rate_limiter is None:
+                return
+            rate_limiter.update_limits(response.headers)
+        except Exception as e:
+            # Pacing is best effort: odd headers must never fail a response the API accepted
+            logger.debug(f"Ignoring unparsable rate limit headers: {e}")
+
     def fire_request_helper(self, request, attempts, request_start_time):
         """
         Helper method to perform HTTP call with retries if needed.
@@ -706,7 +1125,9 @@ class RequestExecutor:
             # We only want to attempt refreshing the token if we haven't hit max_retries
             if attempts < max_retries and self._oauth is not None:
                 logger.info("Got 401 response; clearing token and re-authenticating.")
-                self._oauth.clear_access_token()
+                # Concurrent 401s for the same token trigger a single refresh
+                rejected_token = request["headers"].get("Authorization", "").split("Bearer ", 1)[-1]
+                self._oauth.clear_access_token(rejected_token or None)
 
                 try:
                     fresh_token = self._oauth._get_access_token()
@@ -762,6 +1183,9 @@ class RequestExecutor:
                 f"Hit rate limit or retryable status {response.status_code}. Retrying request in {backoff_seconds} seconds."
             )
             time.sleep(backoff_seconds)
+            # The retry takes a token like any other request, from buckets retuned by this answer
+            self._update_rate_limits(request, response)
+            self._pace_request(request)
             attempts += 1
             return self.fire_request_helper(request, attempts, request_start_time)
 
@@ -829,6 +1253,27 @@ class RequestExecutor:
         # logger.debug("Setting HTTP client session.")
         self._http_client.set_session(session)
 
+    def open_session(self):
+        """
+        Open the HTTP client's connection pool.
+        """
+        return self._http_client.open_session()
+
+    def close_session(self):
+        """
+        Close the HTTP client's connection pool and release its connections.
+        """
+        self._http_client.close_session()
+        if self._oauth is not None:
+            self._oauth.close()
+        # Stop the stale-while-revalidate workers; the next stale hit starts a new pool
+        with self._refresh_lock:
+            refresh_pool, self._refresh_pool = self._refresh_pool, None
+            # Cancelled refreshes never clear their key themselves
+            self._refreshing.clear()
+        if refresh_pool is not None:
+            refresh_pool.shutdown(wait=False, cancel_futures=True)
+
     def clear_custom_headers(self):
         """
         Clear custom headers set for future requests.
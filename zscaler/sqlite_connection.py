@@ -0,0 +1,74 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Sequence
+
+DEFAULT_LOCK_TIMEOUT = 30
+
+
+class SQLiteConnection:
+    """
+    Per-thread connections to a SQLite database shared by cooperating processes,
+    used by the response cache, the shared rate limiter and the token store.
+
+    sqlite3 connections can't cross threads nor survive a fork, so each thread
+    opens its own, and a forked child opens fresh ones. The database file is
+    created readable by its owner only, in a directory only its owner can
+    enter, and runs in WAL mode so readers don't block the writer.
+
+    Calling the instance returns the connection of the current thread, creating
+    the schema on first use.
+
+    Args:
+        path (str): SQLite database file.
+        schema (Sequence[str]): Statements run on each new connection, e.g. ``CREATE TABLE IF NOT EXISTS``.
+        timeout (float, optional): Seconds to wait for the database lock.
+        setup (Callable, optional): Called with each new connection after the schema, e.g. to upgrade it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: Sequence[str],
+        timeout: float = DEFAULT_LOCK_TIMEOUT,
+        setup: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ) -> None:
+        self.path: str = path
+        self.schema: Sequence[str] = schema
+        self.timeout: float = timeout
+        self.setup: Optional[Callable[[sqlite3.Connection], None]] = setup
+        self._local: threading.local = threading.local()
+
+    def __call__(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            directory: str = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            if not os.path.exists(self.path):
+                os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self.schema:
+                conn.execute(statement)
+            if self.setup is not None:
+                self.setup(conn)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Runs the block in a ``BEGIN IMMEDIATE`` transaction, which SQLite serializes
+        across processes, rolling it back if the block raises.
+        """
+        conn: sqlite3.Connection = self()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
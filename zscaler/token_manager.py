@@ -0,0 +1,128 @@
+import hashlib
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+# Tenants whose tokens are kept at once before the least recently used one is dropped
+DEFAULT_MAX_TENANTS: int = 100
+
+
+class TokenState:
+    """
+    OAuth access token of one tenant, shared by every client authenticating as it.
+
+    ``lock`` makes refreshes single-flight; ``renewal_timer`` is the pending
+    background renewal, scheduled by the OAuth client ``renewal_owner`` (a weak
+    reference, so the shared state doesn't keep dropped clients alive).
+    ``last_used`` is when a client last asked for the token: an unused token
+    is not renewed in the background.
+    """
+
+    def __init__(self) -> None:
+        self.access_token: Optional[str] = None
+        self.expires_at: Optional[float] = None
+        self.issued_at: Optional[float] = None
+        self.refresh_at: Optional[float] = None
+        self.last_used: float = 0.0
+        self.lock: threading.Lock = threading.Lock()
+        self.renewal_lock: threading.Lock = threading.Lock()
+        self.renewal_timer: Optional[threading.Timer] = None
+        self.renewal_owner: Optional[weakref.ReferenceType] = None
+
+    def cancel_renewal(self, owner: Optional[Any] = None) -> None:
+        """
+        Cancels the pending background renewal.
+
+        Args:
+            owner (optional): Only cancel the renewal if this client scheduled it.
+        """
+        with self.renewal_lock:
+            renewal_owner: Optional[Any] = self.renewal_owner() if self.renewal_owner is not None else None
+            if self.renewal_timer is not None and (owner is None or owner is renewal_owner):
+                self.renewal_timer.cancel()
+                self.renewal_timer = None
+                self.renewal_owner = None
+
+
+class TokenManager:
+    """
+    Thread-safe registry of the access tokens of many tenants, kept at once.
+
+    Clients configured for the same tenant (``clientId``, ``vanityDomain`` and
+    ``cloud``) and credentials share one :class:`TokenState`, so a worker serving
+    many tenants authenticates once per tenant per token lifetime, whatever the
+    number of clients it builds. Beyond ``max_tenants`` the least recently used
+    tenant is dropped; clients still holding its state keep using it on their own.
+
+    Args:
+        max_tenants (int, optional): Number of tenants kept. Defaults to ``DEFAULT_MAX_TENANTS``.
+
+    Example:
+        >>> from zscaler.token_manager import TOKEN_MANAGER
+        >>> TOKEN_MANAGER.max_tenants = 500
+    """
+
+    def __init__(self, max_tenants: int = DEFAULT_MAX_TENANTS) -> None:
+        self.max_tenants: int = max_tenants
+        self._states: "OrderedDict[Hashable, TokenState]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def tenant_key(client_config: Dict[str, Any]) -> Tuple[str, str, str, str]:
+        """
+        Returns the key of the tenant a client configuration authenticates as.
+
+        A digest of the client secret or private key is part of the key, so a client
+        never receives a token obtained with other credentials.
+        """
+        credential: str = str(client_config.get("clientSecret") or client_config.get("privateKey") or "")
+        return (
+            str(client_config.get("clientId", "")),
+            str(client_config.get("vanityDomain", "")),
+            str(client_config.get("cloud") or "PRODUCTION").lower(),
+            hashlib.sha256(credential.encode()).hexdigest(),
+        )
+
+    def get(self, key: Hashable) -> TokenState:
+        """Returns the token state of a tenant, created on first use."""
+        evicted: list = []
+        with self._lock:
+            state: Optional[TokenState] = self._states.get(key)
+            if state is None:
+                state = self._states[key] = TokenState()
+            self._states.move_to_end(key)
+            while len(self._states) > max(self.max_tenants, 1):
+                evicted.append(self._states.popitem(last=False)[1])
+        for old_state in evicted:
+            logger.debug("Dropping the access token of the least recently used tenant")
+            old_state.cancel_renewal()
+        return state
+
+    def discard(self, key: Hashable) -> None:
+        """Drops the token state of a tenant."""
+        with self._lock:
+            state: Optional[TokenState] = self._states.pop(key, None)
+        if state is not None:
+            state.cancel_renewal()
+
+    def clear(self) -> None:
+        """Drops the token state of every tenant."""
+        with self._lock:
+            states: list = list(self._states.values())
+            self._states.clear()
+        for state in states:
+            state.cancel_renewal()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._states
+
+
+# Shared by every OAuth client of the process
+TOKEN_MANAGER: TokenManager = TokenManager()
@@ -0,0 +1,144 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Optional, Union
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from zscaler.sqlite_connection import DEFAULT_LOCK_TIMEOUT, SQLiteConnection
+
+logger = logging.getLogger("zscaler-sdk-python")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS oauth_tokens (
+    key TEXT PRIMARY KEY,
+    token BLOB NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def derive_key(secret: Union[str, bytes], salt: str) -> bytes:
+    """
+    Derives a Fernet key from client credentials with HKDF-SHA256.
+
+    Args:
+        secret (str or bytes): Client secret, or private key contents.
+        salt (str): Token key the encrypted entry is stored under.
+
+    Returns:
+        bytes: URL-safe base64 encoded 32-byte key.
+    """
+    if isinstance(secret, str):
+        secret = secret.encode()
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=salt.encode(), info=b"zscaler-sdk-python token store")
+    return base64.urlsafe_b64encode(hkdf.derive(secret))
+
+
+class TokenStore:
+    """
+    On-disk store of OAuth access tokens, encrypted at rest and shared by every
+    process pointing at the same file.
+
+    Tokens are encrypted with Fernet (AES-128-CBC with HMAC-SHA256), with a key
+    each client passes along, and stored in a SQLite database under a digest of
+    their token key, with no plaintext credentials or tenant names. SQLite
+    serializes writers across processes, so concurrent processes never read a
+    partially written token; the last token stored wins. The database file is
+    created readable by its owner only. If the store cannot be used, tokens are
+    requested from the API as usual.
+
+    Args:
+        path (str): SQLite database file shared by the cooperating processes.
+        timeout (float, optional): Seconds to wait for the database lock.
+    """
+
+    def __init__(self, path: str, timeout: float = DEFAULT_LOCK_TIMEOUT) -> None:
+        self.path: str = os.path.expanduser(path)
+        self.timeout: float = timeout
+        self._connection: SQLiteConnection = SQLiteConnection(self.path, (_CREATE_TABLE,), timeout)
+
+    @staticmethod
+    def _row_key(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str, encryption_key: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Returns the stored token data, if any is still valid.
+
+        Args:
+            key (str): Token key, see ``OAuth._generate_cache_key``.
+            encryption_key (bytes): Fernet key the token was stored with.
+
+        Returns:
+            dict: ``access_token``, ``expires_at`` and ``issued_at``, or None.
+        """
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT token FROM oauth_tokens WHERE key = ? AND expires_at > ?",
+                    (self._row_key(key), time.time()),
+                )
+                .fetchone()
+            )
+            if row is None:
+                return None
+            return json.loads(Fernet(encryption_key).decrypt(row[0]))
+        except InvalidToken:
+            # Credentials (hence the key) changed since the token was stored
+            logger.debug("Stored access token can't be decrypted with the current credentials")
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning(f"Token store {self.path} unavailable: {e}")
+        return None
+
+    def add(self, key: str, token_data: Dict[str, Any], encryption_key: bytes) -> None:
+        """
+        Stores token data, replacing the previous token of the key.
+
+        Args:
+            key (str): Token key, see ``OAuth._generate_cache_key``.
+            token_data (dict): ``access_token``, ``expires_at`` and ``issued_at``.
+            encryption_key (bytes): Fernet key to encrypt the token with.
+        """
+        token: bytes = Fernet(encryption_key).encrypt(json.dumps(token_data).encode())
+        try:
+            with self._connection.transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO oauth_tokens (key, token, expires_at) VALUES (?, ?, ?)",
+                    (self._row_key(key), token, token_data["expires_at"]),
+                )
+                conn.execute("DELETE FROM oauth_tokens WHERE expires_at <= ?", (time.time(),))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Token store {self.path} unavailable: {e}")
+
+    def delete(self, key: str, access_token: Optional[str] = None, encryption_key: Optional[bytes] = None) -> None:
+        """
+        Removes the stored token of a key.
+
+        Args:
+            key (str): Token key, see ``OAuth._generate_cache_key``.
+            access_token (str, optional): Only remove the stored token if it is this one,
+                so a token another process stored in the meantime is kept.
+            encryption_key (bytes, optional): Fernet key, required with ``access_token``.
+        """
+        try:
+            with self._connection.transaction() as conn:
+                row = conn.execute("SELECT token FROM oauth_tokens WHERE key = ?", (self._row_key(key),)).fetchone()
+                if row is not None and access_token is not None:
+                    try:
+                        stored: Dict[str, Any] = json.loads(Fernet(encryption_key).decrypt(row[0]))
+                        if stored.get("access_token") != access_token:
+                            row = None
+                    except (InvalidToken, ValueError):
+                        pass
+                if row is not None:
+                    conn.execute("DELETE FROM oauth_tokens WHERE key = ?", (self._row_key(key),))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Token store {self.path} unavailable: {e}")
@@ -692,6 +692,26 @@ def is_token_expired(token_string):
         return True
 
 
+def token_expiry(token_string):
+    """
+    Returns the expiration time (``exp`` claim) of a JWT, as a Unix timestamp.
+
+    Args:
+        token_string (str): The JWT.
+
+    Returns:
+        float: Expiration time, or None if the token isn't a JWT or has no ``exp`` claim.
+    """
+    try:
+        parts = token_string.split(".")
+        if len(parts) != 3:
+            return None
+        payload = jsonp.loads(base64.urlsafe_b64decode(parts[1] + "=="))
+        return float(payload["exp"]) if "exp" in payload else None
+    except Exception:
+        return None
+
+
 def str2bool(v):
     if isinstance(v, bool):
         return v
@@ -11,6 +11,7 @@ import requests
 
 from zscaler import __version__
 from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.connection_pool import ConnectionPool
 from zscaler.errors.response_checker import check_response_for_error
 from zscaler.logger import setup_logging
 from zscaler.user_agent import UserAgent
@@ -105,7 +106,15 @@ class LegacyZCCClientHelper:
     DOWNLOAD_DEVICES_RESET_TIME = timedelta(days=1)
 
     def __init__(
-        self, api_key=None, secret_key=None, cloud=None, partner_id=None, timeout=240, cache=None, request_executor_impl=None
+        self,
+        api_key=None,
+        secret_key=None,
+        cloud=None,
+        partner_id=None,
+        timeout=240,
+        cache=None,
+        request_executor_impl=None,
+        connection_pool=None,
     ):
         from zscaler.request_executor import RequestExecutor
 
@@ -122,6 +131,7 @@ class LegacyZCCClientHelper:
         self.login_url = f"{self.url}/papi/auth/v1/login"
 
         self.timeout = timeout
+        self._connection_pool = ConnectionPool(connection_pool)
 
         self.cache = NoOpCache()
 
@@ -292,7 +302,7 @@ class LegacyZCCClientHelper:
                 headers_with_user_agent["User-Agent"] = self.user_agent
                 headers_with_user_agent.update(self.request_executor.get_custom_headers())
 
-                response = requests.request(
+                response = self._connection_pool.get_session().request(
                     method=method,
                     url=url,
                     json=json,
@@ -357,8 +367,12 @@ class LegacyZCCClientHelper:
         }
 
     def set_session(self, session):
-        """Dummy method for compatibility with the request executor."""
-        self._session = session
+        """Replaces the pooled session used by :meth:`send` with a caller managed one."""
+        self._connection_pool.set_session(session)
+
+    def close_session(self):
+        """Closes the pooled session and releases its connections."""
+        self._connection_pool.close()
 
     @property
     def devices(self) -> "DevicesAPI":
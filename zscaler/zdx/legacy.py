@@ -8,6 +8,7 @@ import requests
 
 from zscaler import __version__
 from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.connection_pool import ConnectionPool
 from zscaler.logger import setup_logging
 from zscaler.user_agent import UserAgent
 
@@ -49,6 +50,7 @@ class LegacyZDXClientHelper:
         partner_id=None,
         timeout=240,
         request_executor_impl=None,  # Uses centralized request executor
+        connection_pool=None,
     ):
         self._client_id = client_id or os.getenv(f"{self._env_base}_CLIENT_ID")
         self._client_secret = client_secret or os.getenv(f"{self._env_base}_CLIENT_SECRET")
@@ -56,6 +58,7 @@ class LegacyZDXClientHelper:
         self.partner_id = partner_id or os.getenv("ZSCALER_PARTNER_ID")
         self.url = f"https://api.{self._env_cloud}.net"
         self.timeout = timeout
+        self._connection_pool = ConnectionPool(connection_pool)
 
         # Validate required credentials
         if not self._client_id or not self._client_secret:
@@ -334,7 +337,7 @@ class LegacyZDXClientHelper:
         headers.update(self.request_executor.get_custom_headers())
         try:
             # Make the HTTP request directly
-            response = requests.request(
+            response = self._connection_pool.get_session().request(
                 method=method, url=url, json=json, data=data, params=params, headers=headers, timeout=self.timeout
             )
 
@@ -353,6 +356,14 @@ class LegacyZDXClientHelper:
             logger.error(f"Error sending request: {error}")
             raise ValueError(f"Request execution failed: {error}")
 
+    def set_session(self, session):
+        """Replaces the pooled session used by :meth:`send` with a caller managed one."""
+        self._connection_pool.set_session(session)
+
+    def close_session(self):
+        """Closes the pooled session and releases its connections."""
+        self._connection_pool.close()
+
     @property
     def admin(self):
         """
@@ -31,6 +31,7 @@ from zscaler import __version__
 from zscaler.cache.cache import Cache
 from zscaler.cache.no_op_cache import NoOpCache
 from zscaler.cache.zscaler_cache import ZscalerCache
+from zscaler.connection_pool import ConnectionPool
 from zscaler.errors.response_checker import check_response_for_error
 from zscaler.logger import dump_request, dump_response, setup_logging
 from zscaler.ratelimiter.ratelimiter import RateLimiter
@@ -210,6 +211,7 @@ class LegacyZIAClientHelper:
         self.sandbox_token = kw.get("sandbox_token") or os.getenv(f"{self._env_base}_SANDBOX_TOKEN")
         self.partner_id = kw.get("partner_id") or os.getenv("ZSCALER_PARTNER_ID")
         self.timeout = timeout
+        self._connection_pool = ConnectionPool(kw.get("connection_pool"))
         self.fail_safe = fail_safe
 
         # Session management configuration
@@ -329,7 +331,7 @@ class LegacyZIAClientHelper:
             headers = self.headers.copy()
             headers["Cookie"] = f"JSESSIONID={self.session_id}"
 
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self._connection_pool.get_session().get(url, headers=headers, timeout=self.timeout)
 
             if response.status_code == 200:
                 # Session is still valid, update last activity
@@ -479,7 +481,7 @@ class LegacyZIAClientHelper:
                 # Special handling for PAC file validation endpoint
                 if "/pacFiles/validate" in path:
                     # For PAC validation, send as raw data without any modification
-                    resp = requests.request(
+                    resp = self._connection_pool.get_session().request(
                         method=method,
                         url=url,
                         data=data,  # Send as raw data, not JSON
@@ -488,7 +490,7 @@ class LegacyZIAClientHelper:
                         timeout=self.timeout,
                     )
                 else:
-                    resp = requests.request(
+                    resp = self._connection_pool.get_session().request(
                         method=method,
                         url=url,
                         json=json,
@@ -538,8 +540,12 @@ class LegacyZIAClientHelper:
         raise ValueError("Request execution failed after maximum retries.")
 
     def set_session(self, session: Any) -> None:
-        """Dummy method for compatibility with the request executor."""
-        self._session = session
+        """Replaces the pooled session used by :meth:`send` with a caller managed one."""
+        self._connection_pool.set_session(session)
+
+    def close_session(self) -> None:
+        """Closes the pooled session and releases its connections."""
+        self._connection_pool.close()
 
     @property
     def activate(self) -> "ActivationAPI":
@@ -2,21 +2,25 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
 import urllib.parse
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Type
 
 import requests
 
 from zscaler.cache.cache import Cache
 from zscaler.cache.no_op_cache import NoOpCache
 from zscaler.cache.zscaler_cache import ZscalerCache
+from zscaler.connection_pool import ConnectionPool
 from zscaler.constants import DEV_AUTH_URL, ZPA_BASE_URLS
 from zscaler.errors.response_checker import check_response_for_error
 from zscaler.logger import setup_logging
 from zscaler.ratelimiter.ratelimiter import RateLimiter
 from zscaler.user_agent import UserAgent
 from zscaler.utils import (
-    is_token_expired,
+    token_expiry,
 )
 
 # Import all ZPA API classes for type hints only (to avoid circular imports)
@@ -104,6 +108,13 @@ if TYPE_CHECKING:
 setup_logging(logger_name="zscaler-sdk-python")
 logger = logging.getLogger("zscaler-sdk-python")
 
+# Seconds before expiry at which the access token is refreshed, at most half its lifetime
+TOKEN_REFRESH_MARGIN = 60
+# Lifetime assumed when neither the signin response nor the token report an expiry
+DEFAULT_TOKEN_LIFETIME = 3600
+# Seconds before a failed proactive refresh is retried, while the current token is still valid
+TOKEN_REFRESH_RETRY_DELAY = 10
+
 
 class LegacyZPAClientHelper:
     """A Controller to access Endpoints in the Zscaler Private Access (ZPA) API.
@@ -135,6 +146,7 @@ class LegacyZPAClientHelper:
         cache: Optional[Cache] = None,
         fail_safe: bool = False,
         request_executor_impl: Optional[Type] = None,
+        connection_pool: Optional[Dict[str, Any]] = None,
     ) -> None:
         from zscaler.request_executor import RequestExecutor
 
@@ -155,6 +167,7 @@ class LegacyZPAClientHelper:
 
         self.baseurl = ZPA_BASE_URLS.get(cloud, ZPA_BASE_URLS["PRODUCTION"])
         self.timeout = timeout
+        self._connection_pool = ConnectionPool(connection_pool)
         self.client_id = client_id
         self.client_secret = client_secret
         self.customer_id = customer_id
@@ -191,25 +204,76 @@ class LegacyZPAClientHelper:
         ua = UserAgent()
         self.user_agent = ua.get_user_agent_string()
         self.access_token = None
-        self.headers = {}
+        self.headers: Dict[str, str] = {}
+        # Token expiry is recorded at login, so requests don't decode the JWT to check it
+        self._token_expires_at: Optional[float] = None
+        self._token_refresh_at = 0.0
+        self._token_lock = threading.Lock()
+        # Read-only headers merged with the executor's custom headers, reused while neither changes
+        self._merged_headers: Tuple[Dict[str, str], Dict[str, Any], Mapping[str, str]] = ({}, {}, MappingProxyType({}))
         self.refreshToken()
 
     def refreshToken(self) -> None:
-        if not self.access_token or is_token_expired(self.access_token):
+        """
+        Logs in again once the access token is missing or within ``TOKEN_REFRESH_MARGIN``
+        seconds of its expiry. Only one thread logs in at a time: while the current token
+        is still valid, the other threads keep using it instead of waiting.
+        """
+        if time.time() < self._token_refresh_at:
+            return
+        still_valid = self._token_expires_at is not None and time.time() < self._token_expires_at
+        if not self._token_lock.acquire(blocking=not still_valid):
+            return
+        try:
+            if time.time() < self._token_refresh_at:
+                # Refreshed by another thread while this one waited
+                return
             response = self.login()
             if response is None or response.status_code > 299 or not response.json():
                 logger.error("Failed to login using provided credentials, response: %s", response)
+                if self._token_expires_at is not None and time.time() < self._token_expires_at:
+                    # Keep the current token until it expires, and retry shortly
+                    self._token_refresh_at = min(time.time() + TOKEN_REFRESH_RETRY_DELAY, self._token_expires_at)
+                    return
                 raise Exception("Failed to login using provided credentials.")
-            self.access_token = response.json().get("access_token")
-            self.headers = {
+            body = response.json()
+            access_token = body.get("access_token")
+            headers = {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
-                "Authorization": f"Bearer {self.access_token}",
+                "Authorization": f"Bearer {access_token}",
                 "User-Agent": self.user_agent,
             }
             # Add x-partner-id header if partnerId is provided
             if self.partner_id:
-                self.headers["x-partner-id"] = self.partner_id
+                headers["x-partner-id"] = self.partner_id
+
+            issued_at = time.time()
+            try:
+                expires_at = issued_at + float(body.get("expires_in"))
+            except (TypeError, ValueError):
+                expires_at = token_expiry(access_token or "") or issued_at + DEFAULT_TOKEN_LIFETIME
+            self.access_token = access_token
+            self.headers = headers
+            self._token_expires_at = expires_at
+            self._token_refresh_at = expires_at - min(TOKEN_REFRESH_MARGIN, max(expires_at - issued_at, 0) / 2)
+        finally:
+            self._token_lock.release()
+
+    def _request_headers(self) -> Mapping[str, str]:
+        """
+        Returns the read-only request headers, with the executor's custom headers. The
+        merged map is only rebuilt when :attr:`headers` (e.g. at login) or the custom
+        headers change.
+        """
+        headers = self.headers
+        custom_headers = self.request_executor.get_custom_headers()
+        cached_headers, cached_custom_headers, merged = self._merged_headers
+        if cached_headers == headers and cached_custom_headers == custom_headers:
+            return merged
+        merged = MappingProxyType({**headers, **custom_headers})
+        self._merged_headers = (dict(headers), dict(custom_headers), merged)
+        return merged
 
     def login(self) -> Optional[requests.Response]:
         params = {
@@ -271,16 +335,12 @@ class LegacyZPAClientHelper:
 
         while attempts < max_retries:
             try:
-                headers = self.headers.copy()
-                headers.update(self.request_executor.get_custom_headers())
-                if not headers.get("Authorization"):
+                # The expiry recorded at login makes this check cheap
+                if time.time() >= self._token_refresh_at:
                     self.refreshToken()
-                    # Re-copy headers after refreshToken() to include x-partner-id if it was added
-                    headers = self.headers.copy()
-                    headers.update(self.request_executor.get_custom_headers())
-                    headers["Authorization"] = f"Bearer {self.access_token}"
+                headers = self._request_headers()
 
-                response = requests.request(
+                response = self._connection_pool.get_session().request(
                     method=method,
                     url=base_url,
                     headers=headers,
@@ -320,7 +380,7 @@ class LegacyZPAClientHelper:
                     "method": method,
                     "url": base_url,
                     "params": params or {},
-                    "headers": headers,
+                    "headers": dict(headers),
                     "json": json or {},
                 }
 
@@ -335,8 +395,12 @@ class LegacyZPAClientHelper:
         raise ValueError("Request execution failed after maximum retries.")
 
     def set_session(self, session: Any) -> None:
-        """Dummy method for compatibility with the request executor."""
-        self._session = session
+        """Replaces the pooled session used by :meth:`send` with a caller managed one."""
+        self._connection_pool.set_session(session)
+
+    def close_session(self) -> None:
+        """Closes the pooled session and releases its connections."""
+        self._connection_pool.close()
 
     @property
     def customer_controller(self) -> CustomerControllerAPI:
@@ -30,6 +30,7 @@ from zscaler import __version__
 from zscaler.cache.cache import Cache
 from zscaler.cache.no_op_cache import NoOpCache
 from zscaler.cache.zscaler_cache import ZscalerCache
+from zscaler.connection_pool import ConnectionPool
 from zscaler.errors.response_checker import check_response_for_error
 from zscaler.logger import dump_request, dump_response, setup_logging
 from zscaler.ratelimiter.ratelimiter import RateLimiter
@@ -134,6 +135,7 @@ class LegacyZTBClientHelper:
         # --- Misc ---
         self.partner_id: Optional[str] = kw.get("partner_id") or os.getenv("ZSCALER_PARTNER_ID")
         self.timeout: int = timeout
+        self._connection_pool = ConnectionPool(kw.get("connection_pool"))
         self.fail_safe: bool = fail_safe
         self.max_retries: int = max_retries
 
@@ -293,7 +295,7 @@ class LegacyZTBClientHelper:
 
                 dump_request(logger, url, method, json, params, merged_headers, request_uuid)
 
-                resp = requests.request(
+                resp = self._connection_pool.get_session().request(
                     method=method,
                     url=url,
                     json=json,
@@ -417,8 +419,12 @@ class LegacyZTBClientHelper:
     # ------------------------------------------------------------------
 
     def set_session(self, session: Any) -> None:
-        """Compatibility stub for RequestExecutor integration."""
-        self._session = session
+        """Replaces the pooled session used by :meth:`send` with a caller managed one."""
+        self._connection_pool.set_session(session)
+
+    def close_session(self) -> None:
+        """Closes the pooled session and releases its connections."""
+        self._connection_pool.close()
 
     # ------------------------------------------------------------------
     # API properties
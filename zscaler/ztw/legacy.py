@@ -27,6 +27,7 @@ import requests
 
 from zscaler import __version__
 from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.connection_pool import ConnectionPool
 from zscaler.errors.response_checker import check_response_for_error
 from zscaler.logger import setup_logging
 from zscaler.ratelimiter.ratelimiter import RateLimiter
@@ -97,6 +98,7 @@ class LegacyZTWClientHelper:
         self.url = f"https://connector.{self.env_cloud}.net"
         self.conv_box = True
         self.timeout = timeout
+        self._connection_pool = ConnectionPool(kw.get("connection_pool"))
         self.fail_safe = fail_safe
         self.partner_id = kw.get("partner_id") or os.getenv("ZSCALER_PARTNER_ID")
 
@@ -261,7 +263,7 @@ class LegacyZTWClientHelper:
                 headers_with_user_agent.update(headers or {})
                 headers_with_user_agent["Cookie"] = f"JSESSIONID={self.session_id}"
 
-                resp = requests.request(
+                resp = self._connection_pool.get_session().request(
                     method=method,
                     url=url,
                     json=json,
@@ -311,8 +313,12 @@ class LegacyZTWClientHelper:
         raise ValueError("Request execution failed after maximum retries.")
 
     def set_session(self, session):
-        """Dummy method for compatibility with the request executor."""
-        self._session = session
+        """Replaces the pooled session used by :meth:`send` with a caller managed one."""
+        self._connection_pool.set_session(session)
+
+    def close_session(self):
+        """Closes the pooled session and releases its connections."""
+        self._connection_pool.close()
 
     @property
     def account_details(self) -> AccountDetailsAPI:
@@ -9,6 +9,7 @@ import requests
 
 from zscaler import __version__
 from zscaler.cache.no_op_cache import NoOpCache
+from zscaler.connection_pool import ConnectionPool
 from zscaler.logger import setup_logging
 from zscaler.user_agent import UserAgent
 
@@ -52,6 +53,7 @@ class LegacyZWAClientHelper:
         partner_id=None,
         timeout=240,
         request_executor_impl=None,  # Uses centralized request executor
+        connection_pool=None,
     ):
         self._key_id = key_id or os.getenv(f"{self._env_base}_CLIENT_ID")
         self._key_secret = key_secret or os.getenv(f"{self._env_base}_CLIENT_SECRET")
@@ -59,6 +61,7 @@ class LegacyZWAClientHelper:
         self.partner_id = partner_id or os.getenv("ZSCALER_PARTNER_ID")
         self.url = f"https://api.{self._env_cloud}.zsworkflow.net"
         self.timeout = timeout
+        self._connection_pool = ConnectionPool(connection_pool)
 
         # Validate required credentials
         if not self._key_id or not self._key_secret:
@@ -226,7 +229,7 @@ class LegacyZWAClientHelper:
 
         try:
             # Make the HTTP request directly
-            response = requests.request(
+            response = self._connection_pool.get_session().request(
                 method=method, url=url, json=json, data=data, params=params, headers=headers, timeout=self.timeout
             )
 
@@ -245,6 +248,14 @@ class LegacyZWAClientHelper:
             logger.error(f"Error sending request: {error}")
             raise ValueError(f"Request execution failed: {error}")
 
+    def set_session(self, session):
+        """Replaces the pooled session used by :meth:`send` with a caller managed one."""
+        self._connection_pool.set_session(session)
+
+    def close_session(self):
+        """Closes the pooled session and releases its connections."""
+        self._connection_pool.close()
+
     @property
     def audit_logs(self) -> "AuditLogsAPI":
         """